@@ -1,21 +1,62 @@
-from fastapi import APIRouter, HTTPException
-from typing import Dict, Any
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import JSONResponse
+from typing import Dict, Any, Optional
 from ...core.models import (
     InterviewConfig, 
     SessionStartResponse, 
     SessionStatusResponse, 
-    InterviewFeedback,
+    FeedbackJobResponse,
     SessionStatus
 )
 from ...core.session_manager import session_manager
+from ...core.metrics import set_turn_labels, span
+from ...core.drain import drain_controller
+from ...core.config import settings
 from ...services.persona_service import persona_service
 from ...services.openai_service import openai_service
+from ...services.feedback_jobs import feedback_jobs
+from ...services.feedback_segments import feedback_segmenter
+from ...services.filler_audio import filler_audio
+from ...services.admission import admission_controller, AdmissionRejected
+from ...services.usage import usage_meter
+from ...services.response_cache import response_cache
+from ..websocket.voice import voice_manager
+from datetime import datetime
 
 router = APIRouter()
 
+
+def _reject_if_draining():
+    if drain_controller.draining:
+        raise HTTPException(
+            status_code=503,
+            detail="Server is restarting, retry shortly",
+            headers={"Retry-After": str(max(1, settings.drain_reconnect_delay_ms // 1000))}
+        )
+
+
+def _tenant(request: Request) -> str:
+    """Fairness and billing key: the gateway's tenant header, else the client address"""
+    return request.headers.get("x-tenant-id") or (request.client.host if request.client else "unknown")
+
 @router.post("/interview/start", response_model=SessionStartResponse)
-async def start_interview(config: InterviewConfig):
-    """Start a new interview session"""
+async def start_interview(config: InterviewConfig, request: Request, ticket: Optional[str] = None):
+    """Start a new interview session.
+    
+    When the server is at capacity the request waits in a queue for a short
+    while; if it is still queued the response is 202 with a ticket, position
+    and ETA, and the client repeats the call with `?ticket=<ticket_id>`.
+    """
+    _reject_if_draining()
+    try:
+        admission = await admission_controller.acquire(_tenant(request), ticket)
+    except AdmissionRejected as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(max(1, round(e.retry_after)))})
+    
+    if not admission.granted.is_set():
+        status = admission_controller.queue_status(admission)
+        return JSONResponse(status_code=202, content=status, headers={"Retry-After": str(max(1, round(status["poll_after_seconds"])))})
+    
     try:
         # Create new session
         session_id = session_manager.create_session(config)
@@ -27,6 +68,7 @@ async def start_interview(config: InterviewConfig):
         session = session_manager.get_session(session_id)
         if not session:
             raise HTTPException(status_code=500, detail="Failed to create session")
+        session.tenant = _tenant(request)
         
         # Generate initial greeting
         initial_greeting = persona_service.get_initial_greeting(session)
@@ -41,11 +83,28 @@ async def start_interview(config: InterviewConfig):
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to start interview: {str(e)}")
+    finally:
+        admission_controller.release(admission)
+
+@router.get("/interview/queue")
+async def get_interview_queue():
+    """Admission capacity, queue depth and the expected wait for a new interview"""
+    return admission_controller.stats()
+
+@router.get("/interview/usage")
+async def get_tenant_usage(request: Request):
+    """Provider usage and cost so far for the calling tenant"""
+    tenant = _tenant(request)
+    return {
+        "tenant": tenant,
+        **usage_meter.tenant_usage(tenant),
+        "budget_usd": settings.tenant_budget_usd or None,
+    }
 
 @router.get("/interview/status/{session_id}", response_model=SessionStatusResponse)
 async def get_interview_status(session_id: str):
     """Get current interview session status"""
-    session = session_manager.get_session(session_id)
+    session = await session_manager.find_session(session_id)
     
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
@@ -57,48 +116,67 @@ async def get_interview_status(session_id: str):
         status=session.status,
         question_count=session.question_count,
         duration=duration,
-        current_question=session.current_question
+        current_question=session.current_question,
+        usage=usage_meter.session_usage(session)
     )
 
-@router.post("/interview/stop/{session_id}", response_model=InterviewFeedback)
+@router.post("/interview/stop/{session_id}", response_model=FeedbackJobResponse, status_code=202)
 async def stop_interview(session_id: str):
-    """Stop interview session and generate feedback"""
-    session = session_manager.get_session(session_id)
+    """Stop interview session and start feedback generation in the background"""
+    session = await session_manager.find_session(session_id)
     
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    if session.status == SessionStatus.COMPLETED:
-        raise HTTPException(status_code=400, detail="Session already completed")
-    
     try:
-        # Mark session as completed
-        session_manager.complete_session(session_id)
-        
-        # Generate feedback using OpenAI
-        feedback = await openai_service.generate_feedback(session)
+        # Mark session as completed; repeated stops reuse the same feedback job
+        if session.status != SessionStatus.COMPLETED:
+            session_manager.complete_session(session_id)
+            filler_audio.discard(session_id)
+            admission_controller.session_ended((session.end_time - session.start_time).total_seconds())
         
-        # Clean up session after a delay (optional)
-        # Could implement background task here
+        # Feedback calls are billed to the session too
+        usage_meter.bind(session)
+        job = feedback_jobs.submit(session)
         
-        return feedback
+        return job.to_response()
     
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to generate feedback: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to start feedback generation: {str(e)}")
+
+@router.get("/interview/feedback/{session_id}", response_model=FeedbackJobResponse)
+async def get_interview_feedback(session_id: str):
+    """Poll the feedback job for a stopped interview"""
+    job = feedback_jobs.get_job(session_id)
+    
+    if not job:
+        raise HTTPException(status_code=404, detail="No feedback job for this session")
+    
+    return job.to_response()
 
 @router.post("/interview/test-voice")
-async def test_voice_generation(text: str = "Hello! This is a test of the ElevenLabs voice synthesis.", persona_id: str = "hr-friendly"):
-    """Test endpoint for ElevenLabs voice generation"""
+async def test_voice_generation(
+    text: str = "Hello! This is a test of the ElevenLabs voice synthesis.",
+    persona_id: str = "hr-friendly",
+    output_format: Optional[str] = None
+):
+    """Test endpoint for ElevenLabs voice generation
+    
+    `output_format` is a comma-separated preference list (e.g. "opus,mp3-low");
+    the first supported format is used.
+    """
     try:
-        from ...services.elevenlabs_service import elevenlabs_service
+        from ...services.elevenlabs_service import elevenlabs_service, negotiate_output_format, OUTPUT_FORMATS
         from ...core.models import PersonaId
         import base64
         
         # Convert persona_id string to PersonaId enum
         persona_enum = PersonaId(persona_id)
         
+        audio_format = negotiate_output_format(output_format)
+        
         # Generate voice
-        audio_data = await elevenlabs_service.text_to_speech(text, persona_enum)
+        audio_data = await elevenlabs_service.text_to_speech(text, persona_enum, output_format=audio_format)
         
         if audio_data:
             # Convert to base64 for response
@@ -107,6 +185,8 @@ async def test_voice_generation(text: str = "Hello! This is a test of the Eleven
                 "success": True,
                 "message": "Voice generated successfully",
                 "audio_base64": audio_base64,
+                "audio_format": audio_format,
+                "mime_type": OUTPUT_FORMATS[audio_format],
                 "text": text,
                 "persona": persona_id,
                 "audio_size_bytes": len(audio_data)
@@ -128,7 +208,7 @@ async def test_voice_generation(text: str = "Hello! This is a test of the Eleven
 @router.post("/interview/message/{session_id}")
 async def add_message_to_conversation(session_id: str, message_data: Dict[str, Any]):
     """Add a message to the conversation and get interviewer response"""
-    session = session_manager.get_session(session_id)
+    session = await session_manager.find_session(session_id)
     
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
@@ -136,42 +216,53 @@ async def add_message_to_conversation(session_id: str, message_data: Dict[str, A
     if session.status != SessionStatus.ACTIVE:
         raise HTTPException(status_code=400, detail="Session is not active")
     
-    try:
-        from ...core.models import ConversationMessage, ConversationRole
-        from datetime import datetime
-        
-        # Add candidate message
-        candidate_message = ConversationMessage(
-            role=ConversationRole.CANDIDATE,
-            content=message_data.get("content", ""),
-            timestamp=datetime.now()
-        )
-        
-        session_manager.add_message(session_id, candidate_message)
-        
-        # Generate system prompt
-        system_prompt = persona_service.build_system_prompt(session)
-        
-        # Generate interviewer response
-        interviewer_response = await openai_service.generate_interview_response(
-            system_prompt=system_prompt,
-            conversation_history=session.conversation_history
-        )
-        
-        # Add interviewer message
-        interviewer_message = ConversationMessage(
-            role=ConversationRole.INTERVIEWER,
-            content=interviewer_response,
-            timestamp=datetime.now()
-        )
-        
-        session_manager.add_message(session_id, interviewer_message)
+    _reject_if_draining()
+    with drain_controller.turn():
+        try:
+            from ...core.models import ConversationRole
+            
+            # Add candidate message
+            session_manager.add_turn(session_id, ConversationRole.CANDIDATE, message_data.get("content", ""))
+            set_turn_labels(session.config.persona_id.value, session.config.interview_type.value)
+            usage_meter.bind(session)
+            
+            cache_probe = response_cache.probe(session, message_data.get("content", ""))
+            if cache_probe and cache_probe.hit:
+                interviewer_response = cache_probe.entry.reply
+            else:
+                # Generate system prompt
+                with span("prompt_build"):
+                    system_prompt = persona_service.build_system_prompt(session)
+                
+                # Generate interviewer response
+                with span("llm_completion"):
+                    interviewer_response = await openai_service.generate_interview_response(
+                        system_prompt=system_prompt,
+                        conversation_history=session.conversation_history
+                    )
+                if cache_probe:
+                    response_cache.store(cache_probe, interviewer_response, session)
+            
+            # Add interviewer message
+            session_manager.add_turn(session_id, ConversationRole.INTERVIEWER, interviewer_response)
+            
+            # Get a head start on feedback for long interviews
+            feedback_segmenter.observe(session)
+            
+            # Mirror the turn to the session's voice and observer sockets on any worker
+            await voice_manager.send_message(session_id, {
+                "type": "text_response",
+                "text": interviewer_response,
+                "question_count": session.question_count,
+                "source": "rest",
+                "timestamp": datetime.now()
+            })
+            
+            return {
+                "response": interviewer_response,
+                "question_count": session.question_count,
+                "session_status": session.status
+            }
         
-        return {
-            "response": interviewer_response,
-            "question_count": session.question_count,
-            "session_status": session.status
-        }
-    
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to process message: {str(e)}")
\ No newline at end of file
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to process message: {str(e)}")
\ No newline at end of file
@@ -1,11 +1,32 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response
 from typing import List
+from ...core.config import settings
 from ...core.models import PersonaInfo
 from ...services.persona_service import persona_service
 
 router = APIRouter()
 
+
+def _etag_matches(etag: str, if_none_match: str) -> bool:
+    """Weak comparison against an If-None-Match header, as HTTP caches expect for GET"""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
 @router.get("/personas", response_model=List[PersonaInfo])
-async def get_personas():
-    """Get all available interviewer personas"""
-    return persona_service.get_all_personas()
\ No newline at end of file
+async def get_personas(request: Request):
+    """Get all available interviewer personas
+    
+    The body is serialized once per registry load and tagged with an ETag;
+    a matching If-None-Match gets 304 Not Modified.
+    """
+    body, etag = persona_service.get_personas_response()
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={settings.personas_max_age_seconds}"
+    }
+    if _etag_matches(etag, request.headers.get("if-none-match", "")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
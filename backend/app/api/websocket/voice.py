@@ -1,73 +1,364 @@
 from fastapi import WebSocket, WebSocketDisconnect
-from typing import Dict, Any
-import json
+from typing import Dict, Any, Deque, List, Optional, Set, Tuple, Union
+from collections import deque
 import base64
 import asyncio
-from ...core.models import ConversationMessage, ConversationRole, SessionStatus
+import time
+from ...core.models import ConversationRole, InterviewSession, SessionStatus
 from ...core.session_manager import session_manager
+from ...core.config import settings
+from ...core.event_bus import event_bus
+from ...core.drain import drain_controller
+from ...core.metrics import observe_turn, set_turn_labels, span
+from ...core.serialization import dumps, loads, static_frame
 from ...services.openai_service import openai_service
-from ...services.elevenlabs_service import elevenlabs_service
+from ...services.elevenlabs_service import elevenlabs_service, negotiate_output_format, OUTPUT_FORMATS
 from ...services.persona_service import persona_service
+from ...services.feedback_jobs import feedback_jobs, FeedbackJob
+from ...services.feedback_segments import feedback_segmenter
+from ...services.speech_metrics import speech_metrics
+from ...services.audio_ingest import audio_ingest
+from ...services.filler_audio import filler_audio
+from ...services.speculative_drafts import speculative_drafts
+from ...services.usage import BudgetLevel, usage_meter
+from ...services.response_cache import response_cache
 from datetime import datetime
 
 
+# Fixed status messages, encoded once; send_message splices in the sequence number
+NO_SPEECH_FRAME = static_frame({"type": "status", "message": "No speech detected", "status": "no_speech"})
+TRANSCRIBING_FRAME = static_frame({"type": "status", "message": "Processing audio...", "status": "transcribing"})
+THINKING_FRAME = static_frame({"type": "status", "message": "Generating response...", "status": "thinking"})
+GENERATING_VOICE_FRAME = static_frame({"type": "status", "message": "Converting to speech...", "status": "generating_voice"})
+TEXT_ONLY_FRAME = static_frame({"type": "status", "message": "Voice paused to stay within the session budget", "status": "text_only"})
+
+
+class EventLog:
+    """Sequenced outbound events for one session, kept so a reconnect can replay what it missed"""
+    
+    __slots__ = ("last_seq", "events", "size", "lock", "expiry")
+    
+    def __init__(self):
+        self.last_seq = 0
+        self.events: Deque[Tuple[int, str]] = deque()
+        self.size = 0  # Encoded bytes held, dominated by reply audio
+        self.lock = asyncio.Lock()  # Orders live sends against a replay in progress
+        self.expiry: Optional[asyncio.TimerHandle] = None
+    
+    def append(self, seq: int, frame: str):
+        self.events.append((seq, frame))
+        self.size += len(frame)
+        # Drop the oldest events past either bound, but always keep the newest
+        while len(self.events) > 1 and (
+            len(self.events) > settings.replay_buffer_events or self.size > settings.replay_buffer_bytes
+        ):
+            _, dropped = self.events.popleft()
+            self.size -= len(dropped)
+    
+    def next_seq(self) -> int:
+        self.last_seq += 1
+        return self.last_seq
+    
+    def first_seq(self) -> int:
+        return self.events[0][0] if self.events else self.last_seq + 1
+    
+    def since(self, last_seq: int) -> List[str]:
+        """Frames with a sequence number after `last_seq`, oldest first"""
+        return [frame for seq, frame in self.events if seq > last_seq]
+
+
+class ObserverFeed:
+    """Bounded send queue for one observer socket, drained by its own task.
+    
+    Events are queued, never sent inline, so a slow dashboard only backs up
+    its own queue instead of the candidate's turn. An observer that falls
+    `observer_queue_frames` behind is closed; it can resume with ?last_seq=.
+    """
+    
+    __slots__ = ("websocket", "queue", "task")
+    
+    def __init__(self, websocket: WebSocket):
+        self.websocket = websocket
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=settings.observer_queue_frames)
+        self.task = asyncio.create_task(self._send_loop())
+    
+    def offer(self, frame: str) -> bool:
+        """Queue a frame; False if the socket failed or is too far behind"""
+        if self.task.done():
+            return False
+        try:
+            self.queue.put_nowait(frame)
+            return True
+        except asyncio.QueueFull:
+            return False
+    
+    async def _send_loop(self):
+        try:
+            while True:
+                await self.websocket.send_text(await self.queue.get())
+        except Exception:
+            pass  # Closed; the next offer reports it
+    
+    async def close(self, code: int, reason: str):
+        self.task.cancel()
+        try:
+            await self.websocket.close(code=code, reason=reason)
+        except Exception:
+            pass  # Connection already closed
+
+
+def _with_seq(frame: str, seq: int) -> str:
+    # Splice the field into the encoded frame rather than decoding it
+    return f'{{"seq":{seq},' + frame[1:]
+
+
+def session_channel(session_id: str) -> str:
+    return f"session:{session_id}"
+
+
 class VoiceConnectionManager:
+    """Voice sockets per session.
+    
+    Events sent through `send_message` are published on the session's event
+    bus channel, so they reach the candidate's socket and any observer sockets
+    whichever worker holds them. Each worker with a socket for the session
+    gives every event a sequence number and keeps it in the session's EventLog,
+    whether or not a socket is attached. A turn that loses its socket keeps
+    running; a client that reconnects to the same worker with `?last_seq=N`
+    receives the events after N, reply audio included, instead of resending
+    its input. Logs are dropped `replay_ttl_seconds` after the last socket
+    closes.
+    """
+    
     def __init__(self):
         self.active_connections: Dict[str, WebSocket] = {}
+        self.observers: Dict[str, Dict[WebSocket, ObserverFeed]] = {}  # Read-only sockets, e.g. a coach's dashboard
+        self.audio_formats: Dict[str, str] = {}  # Negotiated TTS output format per session
+        self.event_logs: Dict[str, EventLog] = {}
+        self.replayed_events = 0
+        self.replay_gaps = 0
+        self.slow_observers = 0
+        self._closing: Set[asyncio.Task] = set()
     
-    async def connect(self, websocket: WebSocket, session_id: str):
-        """Accept WebSocket connection for voice communication"""
+    async def connect(
+        self,
+        websocket: WebSocket,
+        session_id: str,
+        audio_format: Optional[str] = None,
+        last_seq: Optional[int] = None
+    ):
+        """Accept WebSocket connection for voice communication, replaying missed events on resume"""
         await websocket.accept()
-        self.active_connections[session_id] = websocket
+        if audio_format or session_id not in self.audio_formats:
+            self.audio_formats[session_id] = negotiate_output_format(audio_format)
         
-        # Send welcome message
-        await websocket.send_text(json.dumps({
+        await self._attach(websocket, session_id, last_seq, {
             "type": "connection",
             "status": "connected",
             "message": "Voice connection established",
+            "session_id": session_id,
+            "audio_format": self.audio_formats[session_id],
+            "supported_audio_formats": list(OUTPUT_FORMATS)
+        })
+    
+    async def connect_observer(self, websocket: WebSocket, session_id: str, last_seq: Optional[int] = None):
+        """Accept a read-only socket that receives every event of a session"""
+        await websocket.accept()
+        await self._attach(websocket, session_id, last_seq, {
+            "type": "connection",
+            "status": "observing",
+            "message": "Observing session events",
             "session_id": session_id
-        }))
-    
-    def disconnect(self, session_id: str):
-        """Remove WebSocket connection"""
-        if session_id in self.active_connections:
-            del self.active_connections[session_id]
-    
-    async def send_message(self, session_id: str, message: Dict[str, Any]):
-        """Send message to specific session"""
-        if session_id in self.active_connections:
-            websocket = self.active_connections[session_id]
-            try:
-                await websocket.send_text(json.dumps(message))
-            except Exception as e:
-                print(f"Failed to send message to {session_id}: {e}")
-                # Remove dead connection
-                self.disconnect(session_id)
-    
-    async def send_audio(self, session_id: str, audio_data: bytes, text: str):
-        """Send audio data to client"""
-        if session_id in self.active_connections:
-            # Convert audio to base64 for transmission
-            audio_base64 = base64.b64encode(audio_data).decode('utf-8')
+        }, observer=True)
+    
+    async def _attach(
+        self,
+        websocket: WebSocket,
+        session_id: str,
+        last_seq: Optional[int],
+        welcome: Dict[str, Any],
+        observer: bool = False
+    ):
+        log = self.event_logs.get(session_id)
+        if log is None:
+            log = self.event_logs[session_id] = EventLog()
+            event_bus.subscribe(session_channel(session_id), self._on_event)
+        if log.expiry:
+            log.expiry.cancel()
+            log.expiry = None
+        
+        async with log.lock:
+            # Send welcome message
+            await websocket.send_text(dumps({**welcome, "last_seq": log.last_seq}))
+            
+            if last_seq is not None and last_seq < log.last_seq:
+                if last_seq + 1 < log.first_seq():
+                    # Some missed events have already been evicted
+                    self.replay_gaps += 1
+                    await websocket.send_text(dumps({
+                        "type": "replay_gap",
+                        "last_seq": last_seq,
+                        "first_available_seq": log.first_seq()
+                    }))
+                missed = log.since(last_seq)
+                for frame in missed:
+                    await websocket.send_text(frame)
+                self.replayed_events += len(missed)
+            
+            # Attach only after the replay so live events can't overtake it
+            if observer:
+                self.observers.setdefault(session_id, {})[websocket] = ObserverFeed(websocket)
+            else:
+                self.active_connections[session_id] = websocket
+    
+    def disconnect(self, session_id: str, websocket: Optional[WebSocket] = None):
+        """Remove WebSocket connection; the event log is kept for a while for a reconnect"""
+        if websocket is not None and self.active_connections.get(session_id) is not websocket:
+            return  # Already replaced by a newer connection
+        self.active_connections.pop(session_id, None)
+        self._schedule_expiry(session_id)
+    
+    def disconnect_observer(self, session_id: str, websocket: WebSocket):
+        observers = self.observers.get(session_id)
+        if observers:
+            feed = observers.pop(websocket, None)
+            if feed:
+                feed.task.cancel()
+            if not observers:
+                del self.observers[session_id]
+        self._schedule_expiry(session_id)
+    
+    def _schedule_expiry(self, session_id: str):
+        log = self.event_logs.get(session_id)
+        if log and not log.expiry and not self._attached(session_id):
+            loop = asyncio.get_running_loop()
+            log.expiry = loop.call_later(settings.replay_ttl_seconds, self._expire, session_id)
+    
+    def _attached(self, session_id: str) -> bool:
+        return session_id in self.active_connections or session_id in self.observers
+    
+    def _expire(self, session_id: str):
+        if self._attached(session_id):
+            return
+        if self.event_logs.pop(session_id, None):
+            event_bus.unsubscribe(session_channel(session_id), self._on_event)
+        self.audio_formats.pop(session_id, None)
+    
+    def get_audio_format(self, session_id: str) -> str:
+        """TTS output format negotiated for a session"""
+        return self.audio_formats.get(session_id) or negotiate_output_format(None)
+    
+    async def send_message(self, session_id: str, message: Union[str, Dict[str, Any]]):
+        """Publish an event to every socket of the session; `message` is a dict or a pre-encoded frame.
+        
+        Never raises: if a socket is gone the event stays in its worker's log for replay.
+        """
+        frame = message if isinstance(message, str) else dumps(message)
+        await event_bus.publish(session_channel(session_id), frame)
+    
+    async def _on_event(self, channel: str, frame: str):
+        """Sequence, log and send one event to this worker's sockets for the session"""
+        session_id = channel.split(":", 1)[1]
+        log = self.event_logs.get(session_id)
+        if log is None:
+            return
+        
+        async with log.lock:
+            seq = log.next_seq()
+            frame = _with_seq(frame, seq)
+            log.append(seq, frame)
             
-            message = {
-                "type": "audio_response",
-                "audio_data": audio_base64,
-                "text": text,
-                "timestamp": datetime.now().isoformat()
-            }
+            websocket = self.active_connections.get(session_id)
+            if websocket is not None:
+                try:
+                    await websocket.send_text(frame)
+                except Exception as e:
+                    print(f"Failed to send message to {session_id}: {e}")
+                    # Remove dead connection
+                    self.disconnect(session_id, websocket)
             
-            await self.send_message(session_id, message)
+            for observer, feed in list(self.observers.get(session_id, {}).items()):
+                if not feed.offer(frame):
+                    self.disconnect_observer(session_id, observer)
+                    if not feed.task.done():
+                        self.slow_observers += 1
+                        closing = asyncio.create_task(feed.close(1013, "Observer too far behind, resume with last_seq"))
+                        self._closing.add(closing)
+                        closing.add_done_callback(self._closing.discard)
+    
+    async def send_audio(self, session_id: str, audio_data: bytes, text: str, message_type: str = "audio_response"):
+        """Send audio data to client"""
+        # Convert audio to base64 for transmission
+        audio_base64 = base64.b64encode(audio_data).decode('utf-8')
+        
+        audio_format = self.get_audio_format(session_id)
+        message = {
+            "type": message_type,
+            "audio_data": audio_base64,
+            "audio_format": audio_format,
+            "mime_type": OUTPUT_FORMATS[audio_format],
+            "text": text,
+            "timestamp": datetime.now()
+        }
+        
+        await self.send_message(session_id, message)
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "connections": len(self.active_connections),
+            "observers": sum(len(sockets) for sockets in self.observers.values()),
+            "replay_sessions": len(self.event_logs),
+            "replay_buffered_bytes": sum(log.size for log in self.event_logs.values()),
+            "replayed_events": self.replayed_events,
+            "replay_gaps": self.replay_gaps,
+            "slow_observers": self.slow_observers
+        }
 
 
 voice_manager = VoiceConnectionManager()
 
 
+async def notify_feedback_ready(job: FeedbackJob):
+    """Push finished feedback to the session's voice socket, if still connected"""
+    await voice_manager.send_message(job.session_id, {
+        "type": "feedback_ready",
+        **job.to_response().model_dump(),
+        "timestamp": datetime.now()
+    })
+
+
+feedback_jobs.add_listener(notify_feedback_ready)
+
+
+def reconnect_message() -> Dict[str, Any]:
+    return {
+        "type": "reconnect",
+        "reason": "server_restarting",
+        "retry_after_ms": settings.drain_reconnect_delay_ms
+    }
+
+
+async def close_for_drain():
+    """Tell this worker's sockets to reconnect elsewhere, then close them"""
+    sockets = list(voice_manager.active_connections.values())
+    sockets += [ws for observers in voice_manager.observers.values() for ws in observers]
+    frame = dumps(reconnect_message())
+    for websocket in sockets:
+        try:
+            await websocket.send_text(frame)
+            await websocket.close(code=1012, reason="Server restarting")
+        except Exception:
+            pass  # Connection already closed
+
+
+drain_controller.add_listener(close_for_drain)
+
+
 async def handle_voice_websocket(websocket: WebSocket, session_id: str):
     """Handle WebSocket connection for voice communication"""
     
     # Validate session exists and is active
-    session = session_manager.get_session(session_id)
+    session = await session_manager.find_session(session_id)
     if not session:
         await websocket.close(code=4004, reason="Session not found")
         return
@@ -76,30 +367,71 @@ async def handle_voice_websocket(websocket: WebSocket, session_id: str):
         await websocket.close(code=4003, reason="Session not active")
         return
     
-    # Connect to voice manager
-    await voice_manager.connect(websocket, session_id)
+    if drain_controller.draining:
+        await websocket.close(code=1012, reason="Server restarting")
+        return
+    
+    # Tag every stage timing recorded for this connection
+    set_turn_labels(session.config.persona_id.value, session.config.interview_type.value)
+    
+    # Connect to voice manager; clients may ask for a TTS format, e.g. ?audio_format=opus,mp3-low,
+    # and resume after a drop with the last sequence number they received, e.g. ?last_seq=42
+    await voice_manager.connect(
+        websocket,
+        session_id,
+        websocket.query_params.get("audio_format"),
+        _last_seq(websocket)
+    )
+    filler_audio.warm(session.config.persona_id, voice_manager.get_audio_format(session_id))
+    # Bill this connection's provider calls to the session (fillers are shared, so they aren't)
+    usage_meter.bind(session)
     
     try:
         while True:
             # Receive message from client
             data = await websocket.receive_text()
-            message_data = json.loads(data)
+            message_data = loads(data)
             
             await process_voice_message(session_id, message_data, websocket)
     
     except WebSocketDisconnect:
         print(f"WebSocket disconnected for session: {session_id}")
-        voice_manager.disconnect(session_id)
+        voice_manager.disconnect(session_id, websocket)
+        speculative_drafts.discard(session)
     except Exception as e:
         print(f"WebSocket error for session {session_id}: {e}")
         try:
-            await websocket.send_text(json.dumps({
+            await websocket.send_text(dumps({
                 "type": "error",
                 "message": f"Voice processing error: {str(e)}"
             }))
         except:
             pass  # Connection already closed
-        voice_manager.disconnect(session_id)
+        voice_manager.disconnect(session_id, websocket)
+        speculative_drafts.discard(session)
+
+
+async def handle_observer_websocket(websocket: WebSocket, session_id: str):
+    """Read-only feed of a session's events, from whichever worker produces them.
+    
+    The session may live on another worker, so it is not looked up here.
+    """
+    await voice_manager.connect_observer(websocket, session_id, _last_seq(websocket))
+    try:
+        while True:
+            message_data = loads(await websocket.receive_text())
+            if message_data.get("type") == "ping":
+                await websocket.send_text(dumps({"type": "pong", "timestamp": datetime.now()}))
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        print(f"Observer socket error for session {session_id}: {e}")
+    voice_manager.disconnect_observer(session_id, websocket)
+
+
+def _last_seq(websocket: WebSocket) -> Optional[int]:
+    last_seq = websocket.query_params.get("last_seq")
+    return int(last_seq) if last_seq and last_seq.isdigit() else None
 
 
 async def process_voice_message(session_id: str, message_data: Dict[str, Any], websocket: WebSocket):
@@ -107,23 +439,48 @@ async def process_voice_message(session_id: str, message_data: Dict[str, Any], w
     message_type = message_data.get("type")
     
     try:
-        if message_type == "audio_chunk":
+        if message_type in ("audio_chunk", "text_message") and drain_controller.draining:
+            # Too late to start a turn here; the client resends after reconnecting
+            await websocket.send_text(dumps(reconnect_message()))
+        
+        elif message_type == "audio_chunk":
             # Handle audio from candidate
-            await handle_audio_input(session_id, message_data, websocket)
+            with drain_controller.turn():
+                await handle_audio_input(session_id, message_data, websocket)
         
         elif message_type == "text_message":
             # Handle text message from candidate
-            await handle_text_input(session_id, message_data, websocket)
+            with drain_controller.turn():
+                await handle_text_input(session_id, message_data, websocket)
+        
+        elif message_type == "partial_transcript":
+            # Interim speech recognition result; may start a speculative reply draft
+            session = session_manager.get_session(session_id)
+            if session:
+                speculative_drafts.on_partial(session, message_data.get("text", ""))
+        
+        elif message_type == "configure":
+            # Renegotiate the TTS output format mid-session
+            audio_format = negotiate_output_format(message_data.get("audio_format"))
+            voice_manager.audio_formats[session_id] = audio_format
+            session = session_manager.get_session(session_id)
+            if session:
+                filler_audio.warm(session.config.persona_id, audio_format)
+            await websocket.send_text(dumps({
+                "type": "configured",
+                "audio_format": audio_format,
+                "mime_type": OUTPUT_FORMATS[audio_format]
+            }))
         
         elif message_type == "ping":
             # Handle ping for connection keep-alive
-            await websocket.send_text(json.dumps({
+            await websocket.send_text(dumps({
                 "type": "pong",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": datetime.now()
             }))
         
         else:
-            await websocket.send_text(json.dumps({
+            await websocket.send_text(dumps({
                 "type": "error",
                 "message": f"Unknown message type: {message_type}"
             }))
@@ -131,7 +488,7 @@ async def process_voice_message(session_id: str, message_data: Dict[str, Any], w
     except Exception as e:
         print(f"Error processing voice message: {e}")
         try:
-            await websocket.send_text(json.dumps({
+            await websocket.send_text(dumps({
                 "type": "error",
                 "message": f"Processing error: {str(e)}"
             }))
@@ -145,143 +502,175 @@ async def handle_audio_input(session_id: str, message_data: Dict[str, Any], webs
     if not session:
         return
     
+    turn_started = time.perf_counter()
     try:
         # Get audio data
         audio_base64 = message_data.get("audio_data", "")
         audio_bytes = base64.b64decode(audio_base64)
         
+        # Resample, trim silence and compress; clips without speech never reach Whisper
+        with span("audio_ingest"):
+            prepared = await audio_ingest.prepare(audio_bytes, message_data.get("format", "wav"))
+        if not prepared.has_speech:
+            await voice_manager.send_message(session_id, NO_SPEECH_FRAME)
+            return
+        
         # Send processing status
-        try:
-            await websocket.send_text(json.dumps({
-                "type": "status",
-                "message": "Processing audio...",
-                "status": "transcribing"
-            }))
-        except:
-            return  # Connection closed
+        await voice_manager.send_message(session_id, TRANSCRIBING_FRAME)
         
         # Transcribe audio using OpenAI Whisper
-        transcribed_text = await openai_service.transcribe_audio(audio_bytes)
+        with span("transcription"):
+            transcribed_text, word_timings = await openai_service.transcribe_audio_with_timings(
+                prepared.upload_data,
+                format=prepared.format
+            )
+        
+        # Measure speech delivery in the background for feedback scoring
+        if word_timings and prepared.pcm is not None:
+            speech_metrics.submit(session_id, prepared.pcm, transcribed_text, word_timings)
         
         # Send transcription result
-        try:
-            await websocket.send_text(json.dumps({
-                "type": "transcription",
-                "text": transcribed_text,
-                "timestamp": datetime.now().isoformat()
-            }))
-        except:
-            return  # Connection closed
+        await voice_manager.send_message(session_id, {
+            "type": "transcription",
+            "text": transcribed_text,
+            "timestamp": datetime.now()
+        })
         
         # Process the transcribed text
-        await process_candidate_response(session_id, transcribed_text, websocket)
+        await process_candidate_response(session_id, transcribed_text, websocket, turn_started)
     
     except Exception as e:
         print(f"Audio processing error: {e}")
-        try:
-            await websocket.send_text(json.dumps({
-                "type": "error",
-                "message": "Failed to process audio input"
-            }))
-        except:
-            pass  # Connection already closed
+        await voice_manager.send_message(session_id, {
+            "type": "error",
+            "message": "Failed to process audio input"
+        })
 
 
 async def handle_text_input(session_id: str, message_data: Dict[str, Any], websocket: WebSocket):
     """Handle text input from candidate"""
+    turn_started = time.perf_counter()
     text_content = message_data.get("content", "")
-    await process_candidate_response(session_id, text_content, websocket)
+    await process_candidate_response(session_id, text_content, websocket, turn_started)
 
 
-async def process_candidate_response(session_id: str, content: str, websocket: WebSocket):
+async def send_filler_if_slow(session_id: str, session: InterviewSession, elapsed: float):
+    """Send a pre-rendered persona filler when the turn's projected latency is over threshold.
+    
+    Only for turns that will wait on the LLM: `elapsed` is the time already
+    spent (e.g. transcribing), plus the projected completion and synthesis.
+    """
+    if not settings.filler_enabled:
+        return
+    
+    if elapsed + filler_audio.projected_latency(include_transcription=False) < settings.filler_latency_threshold_seconds:
+        return
+    
+    clip = filler_audio.pick(session_id, session.config.persona_id, voice_manager.get_audio_format(session_id))
+    if clip:
+        text, audio_data = clip
+        await voice_manager.send_audio(session_id, audio_data, text, message_type="filler_audio")
+
+
+async def process_candidate_response(
+    session_id: str,
+    content: str,
+    websocket: WebSocket,
+    turn_started: Optional[float] = None
+):
     """Process candidate response and generate interviewer reply"""
     session = session_manager.get_session(session_id)
     if not session:
         return
     
     try:
+        # A draft started from partial transcripts is used if it still matches
+        drafted_response = await speculative_drafts.take(session, content)
+        
         # Add candidate message to conversation
-        candidate_message = ConversationMessage(
-            role=ConversationRole.CANDIDATE,
-            content=content,
-            timestamp=datetime.now()
-        )
-        session_manager.add_message(session_id, candidate_message)
+        session_manager.add_turn(session_id, ConversationRole.CANDIDATE, content)
         
         # Send thinking status
-        try:
-            await websocket.send_text(json.dumps({
-                "type": "status",
-                "message": "Generating response...",
-                "status": "thinking"
-            }))
-        except:
-            return  # Connection closed
+        await voice_manager.send_message(session_id, THINKING_FRAME)
         
-        # Generate system prompt
-        system_prompt = persona_service.build_system_prompt(session)
+        # Recurring short turns may be answered from the response cache
+        cache_probe = None if drafted_response else response_cache.probe(session, content)
         
-        # Generate interviewer response
-        interviewer_response = await openai_service.generate_interview_response(
-            system_prompt=system_prompt,
-            conversation_history=session.conversation_history,
-            max_tokens=200
-        )
+        if drafted_response:
+            interviewer_response = drafted_response
+        elif cache_probe and cache_probe.hit:
+            interviewer_response = cache_probe.entry.reply
+        else:
+            # Cover the dead air before a slow reply; drafts and cache hits are instant, and
+            # a text-only session has nothing to play
+            if usage_meter.level(session) < BudgetLevel.TEXT_ONLY:
+                elapsed = time.perf_counter() - turn_started if turn_started is not None else 0.0
+                await send_filler_if_slow(session_id, session, elapsed)
+            
+            # Generate system prompt
+            with span("prompt_build"):
+                system_prompt = persona_service.build_system_prompt(session)
+            
+            # Generate interviewer response
+            with span("llm_completion"):
+                interviewer_response = await openai_service.generate_interview_response(
+                    system_prompt=system_prompt,
+                    conversation_history=session.conversation_history,
+                    max_tokens=200
+                )
+            if cache_probe:
+                response_cache.store(cache_probe, interviewer_response, session)
         
         # Add interviewer message to conversation
-        interviewer_message = ConversationMessage(
-            role=ConversationRole.INTERVIEWER,
-            content=interviewer_response,
-            timestamp=datetime.now()
-        )
-        session_manager.add_message(session_id, interviewer_message)
+        session_manager.add_turn(session_id, ConversationRole.INTERVIEWER, interviewer_response)
+        
+        # Get a head start on feedback for long interviews
+        feedback_segmenter.observe(session)
         
         # Send text response first
-        try:
-            await websocket.send_text(json.dumps({
-                "type": "text_response",
-                "text": interviewer_response,
-                "question_count": session.question_count,
-                "timestamp": datetime.now().isoformat()
-            }))
-        except:
-            return  # Connection closed
+        await voice_manager.send_message(session_id, {
+            "type": "text_response",
+            "text": interviewer_response,
+            "question_count": session.question_count,
+            "timestamp": datetime.now()
+        })
         
         # Generate voice response
-        try:
-            await websocket.send_text(json.dumps({
-                "type": "status",
-                "message": "Converting to speech...",
-                "status": "generating_voice"
-            }))
-        except:
-            return  # Connection closed
+        budget_level = usage_meter.level(session)
+        if budget_level < BudgetLevel.TEXT_ONLY:
+            await voice_manager.send_message(session_id, GENERATING_VOICE_FRAME)
         
         # Convert to speech using ElevenLabs
-        audio_data = await elevenlabs_service.text_to_speech(
-            interviewer_response, 
-            session.config.persona_id
-        )
+        audio_format = voice_manager.get_audio_format(session_id)
+        audio_data = response_cache.audio_for(cache_probe, audio_format) if budget_level < BudgetLevel.TEXT_ONLY else None
+        if not audio_data:
+            with span("tts_completion"):
+                audio_data = await elevenlabs_service.text_to_speech(
+                    interviewer_response, 
+                    session.config.persona_id,
+                    output_format=audio_format
+                )
+            response_cache.store_audio(cache_probe, audio_format, audio_data)
         
         if audio_data:
             # Send audio response
-            await voice_manager.send_audio(session_id, audio_data, interviewer_response)
+            with span("socket_send"):
+                await voice_manager.send_audio(session_id, audio_data, interviewer_response)
+            if turn_started is not None:
+                observe_turn(time.perf_counter() - turn_started)
+        elif budget_level >= BudgetLevel.CACHED_AUDIO:
+            # Synthesis skipped to stay within budget
+            await voice_manager.send_message(session_id, TEXT_ONLY_FRAME)
         else:
             # Fallback if TTS fails
-            try:
-                await websocket.send_text(json.dumps({
-                    "type": "error",
-                    "message": "Failed to generate voice response, but text response is available"
-                }))
-            except:
-                pass  # Connection already closed
+            await voice_manager.send_message(session_id, {
+                "type": "error",
+                "message": "Failed to generate voice response, but text response is available"
+            })
     
     except Exception as e:
         print(f"Response generation error: {e}")
-        try:
-            await websocket.send_text(json.dumps({
-                "type": "error",
-                "message": "Failed to generate interviewer response"
-            }))
-        except:
-            pass  # Connection already closed
\ No newline at end of file
+        await voice_manager.send_message(session_id, {
+            "type": "error",
+            "message": "Failed to generate interviewer response"
+        })
\ No newline at end of file
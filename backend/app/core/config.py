@@ -1,21 +1,138 @@
 from pydantic_settings import BaseSettings
+from typing import Optional
 
 
 class Settings(BaseSettings):
-    # API Keys
-    openai_api_key: str
-    elevenlabs_api_key: str
+    # API Keys (checked when a provider client is first used, so the app can start without them)
+    openai_api_key: Optional[str] = None
+    elevenlabs_api_key: Optional[str] = None
     
     # CORS Configuration
     cors_origins: str = "http://localhost:5173,http://localhost:3000,http://localhost:8080"
     
     # Session Configuration
     max_session_duration: int = 3600  # 1 hour in seconds
-    max_concurrent_sessions: int = 10
+    max_concurrent_sessions: int = 100  # Hard ceiling; admission control sizes capacity below it
+    session_idle_timeout_seconds: float = 600.0  # End a live session with no new message for this long
+    session_sweep_seconds: float = 30.0  # How often expired and abandoned sessions are cleaned up
+    
+    # Admission Control
+    admission_min_sessions: int = 2  # Always admit at least this many, whatever the estimate
+    admission_target_utilization: float = 0.7  # Share of estimated provider throughput to plan for
+    admission_turn_interval_seconds: float = 20.0  # Seconds between a session's turns until observed
+    admission_recent_turn_seconds: float = 120.0  # Only sessions with a turn this recent inform the turn interval
+    admission_session_seconds: float = 900.0  # Typical interview length until observed; drives queue ETAs
+    admission_hold_seconds: float = 10.0  # Hold a queued /interview/start this long before answering 202
+    admission_max_wait_seconds: float = 300.0  # Give up on a queued start after this long
+    admission_ticket_ttl_seconds: float = 30.0  # Drop a queued ticket that isn't polled for this long
+    admission_max_queue: int = 100
+    admission_max_queued_per_tenant: int = 3  # Per X-Tenant-ID header, else per client IP
+    
+    # Usage Metering and Budgets (USD list prices; a budget of 0 disables it)
+    price_llm_input_per_million_tokens: float = 0.15
+    price_llm_output_per_million_tokens: float = 0.60
+    price_whisper_per_minute: float = 0.006
+    price_tts_per_thousand_characters: float = 0.18
+    session_budget_usd: float = 2.0
+    tenant_budget_usd: float = 0.0
+    tenant_budget_period_seconds: float = 86400.0  # Tenant usage resets every period; 0 never resets it
+    budget_reduce_tokens_at: float = 0.6  # Share of a budget after which replies are shortened
+    budget_reduced_max_tokens: int = 80
+    budget_cached_audio_at: float = 0.8  # ...after which only already-synthesized audio is played
+    budget_text_only_at: float = 0.95  # ...after which replies are sent as text only
+    
+    # Provider Rate Limits (0 disables a bucket)
+    openai_max_concurrency: int = 16
+    openai_requests_per_minute: int = 500
+    openai_tokens_per_minute: int = 200000
+    elevenlabs_max_concurrency: int = 4
+    elevenlabs_requests_per_minute: int = 120
+    elevenlabs_characters_per_minute: int = 20000
+    provider_background_share: float = 0.5  # Max share of concurrency for background work
+    provider_backoff_seconds: float = 5.0  # Pause after a 429 response
+    
+    # Provider Deadlines and Circuit Breaking
+    openai_base_url: Optional[str] = None  # Point at a local stub server for testing
+    elevenlabs_base_url: Optional[str] = None
+    openai_max_retries: int = 1
+    provider_warmup: bool = True  # Load provider SDKs in a worker thread in the background once the server is up
+    llm_deadline_seconds: float = 8.0
+    transcription_deadline_seconds: float = 10.0
+    tts_deadline_seconds: float = 10.0
+    feedback_deadline_seconds: float = 45.0
+    hedge_requests: bool = False  # Send a duplicate request after the p95 latency
+    hedge_min_delay_seconds: float = 0.5
+    breaker_failure_threshold: int = 5
+    breaker_reset_seconds: float = 30.0
+    tts_cache_size: int = 256  # Synthesized clips kept, keyed by voice, format and text
+    tts_default_output_format: str = "mp3_44100_128"
+    filler_enabled: bool = True  # Play a cached persona backchannel clip when a reply will be slow
+    filler_latency_threshold_seconds: float = 1.5  # Turn time so far plus projected LLM + TTS time
+    speculative_drafts: bool = False  # Draft the reply from partial transcripts before the final one
+    speculative_personas: str = ""  # Comma-separated persona ids to draft for; empty means all
+    speculative_similarity_threshold: float = 0.85  # Partial vs final transcript match needed to keep a draft
+    speculative_min_words: int = 6  # Don't draft from partials shorter than this
+    speculative_model: str = "gpt-4o-mini"  # Model for drafts; most are discarded, so a cheaper one may pay off
+    speculative_max_tokens: int = 120  # Below the 200 of a live reply; interviewer replies are 1-3 sentences
+    
+    # Feedback Jobs
+    feedback_job_ttl_seconds: int = 3600  # How long finished feedback is kept for polling
+    feedback_chunked_min_messages: int = 16  # Use map-reduce feedback from this transcript length
+    feedback_segment_messages: int = 8  # Messages per analyzed segment
+    feedback_segment_concurrency: int = 3
+    feedback_segment_max_tokens: int = 250
+    feedback_incremental: bool = True  # Analyze segments while the interview is running
+    
+    # Response Cache (replays replies to near-identical short candidate turns)
+    response_cache_enabled: bool = False
+    response_cache_personas: str = ""  # Comma-separated persona ids to cache for; empty means all
+    response_cache_similarity: float = 0.75  # Character-trigram Jaccard similarity needed for a hit
+    response_cache_max_words: int = 12  # Only candidate turns this short are looked up or stored
+    response_cache_ttl_seconds: float = 3600.0
+    response_cache_max_entries: int = 2000
+    response_cache_max_audio_bytes: int = 64_000_000
+    
+    # Audio Processing
+    audio_worker_threads: int = 2  # Worker pool for NumPy audio analysis
+    vad_enabled: bool = True  # Trim silence and skip silent clips before Whisper
+    vad_margin_db: float = 10.0  # Speech threshold above the clip's noise floor
+    vad_padding_seconds: float = 0.2  # Audio kept around detected speech
+    vad_min_speech_seconds: float = 0.25
+    upload_codec: str = "opus"  # "opus" (needs ffmpeg) or "wav"; audio is always 16 kHz mono
+    upload_bitrate_kbps: int = 24
+    transcode_timeout_seconds: float = 10.0
+    
+    # Voice Reconnects
+    replay_buffer_events: int = 64  # Sequenced events kept per session for ?last_seq= resume
+    replay_buffer_bytes: int = 4_000_000  # Per-session cap; reply audio dominates
+    replay_ttl_seconds: float = 120.0  # Keep a session's events this long after its socket closes
+    observer_queue_frames: int = 256  # Events queued per observer socket; a socket that falls further behind is closed
+    event_bus: str = "local"  # "local" (one worker) or "ipc" to fan session events out across workers
+    event_bus_path: str = "/tmp/interview-event-bus.sock"  # Unix socket for the "ipc" broker
+    event_bus_flush_ms: float = 5.0  # Cross-worker publishes are batched over this window
+    event_bus_max_buffer_bytes: int = 16_000_000  # Unsent bytes per broker connection before frames to it are dropped
+    
+    # Graceful Drain
+    drain_timeout_seconds: float = 20.0  # On SIGTERM, let running turns finish for up to this long
+    drain_reconnect_delay_ms: int = 1000  # Back-off suggested to clients in the reconnect message
+    session_store_dir: str = "./session_snapshots"  # Live sessions are saved here on drain; empty disables
+    session_restore_miss_ttl_seconds: float = 2.0  # Don't re-probe the store for an id without a snapshot for this long
+    
+    # Personas
+    personas_file: Optional[str] = None  # Persona registry JSON; defaults to app/data/personas.json
+    personas_reload_seconds: float = 2.0  # How often to check the file for edits; 0 disables hot reload
+    personas_max_age_seconds: int = 300  # Cache-Control max-age for /api/personas
+    
+    # Event Loop Monitoring
+    loop_monitor_enabled: bool = True
+    loop_monitor_interval_seconds: float = 0.1  # Lag sampling period
+    loop_block_threshold_seconds: float = 0.1  # Capture the loop's stack when blocked this long
+    loop_stall_history: int = 20  # Captured stalls kept for /api/debug/event-loop
     
     # Server Configuration
     host: str = "0.0.0.0"
     port: int = 8000
+    reload: bool = False  # Development auto-reload; disables graceful drain
     
     class Config:
         env_file = ".env"
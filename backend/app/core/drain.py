@@ -0,0 +1,89 @@
+"""Graceful drain for rolling restarts.
+
+On SIGTERM the launcher in main.py calls `drain_controller.drain()` before
+letting uvicorn shut down:
+
+1. New interviews are refused (`/interview/start` returns 503, health checks
+   report draining so the load balancer stops routing here).
+2. Turns already in progress get up to `drain_timeout_seconds` to finish.
+3. Live sessions are written to the session store, where another worker
+   picks them up on the client's next request.
+4. Listeners run, e.g. the voice sockets are told to reconnect and closed.
+"""
+import asyncio
+import time
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Dict, List, Optional
+from .config import settings
+from .session_manager import session_manager
+from .session_store import session_store
+
+DrainListener = Callable[[], Awaitable[None]]
+
+
+class DrainController:
+    def __init__(self):
+        self.draining = False
+        self.in_flight = 0
+        self._listeners: List[DrainListener] = []
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+        self.abandoned_turns = 0
+        self.saved_sessions = 0
+
+    def add_listener(self, listener: DrainListener):
+        """Run `listener` after sessions are saved, e.g. to notify connected clients"""
+        self._listeners.append(listener)
+
+    @contextmanager
+    def turn(self):
+        """Mark a candidate turn as in flight so a drain waits for it"""
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+
+    async def drain(self, timeout: Optional[float] = None):
+        """Stop taking new work, wait for running turns, save sessions and notify listeners"""
+        if self.draining:
+            return
+        self.draining = True
+        self._started_at = time.monotonic()
+        timeout = settings.drain_timeout_seconds if timeout is None else timeout
+        print(f"Draining: waiting up to {timeout:.0f}s for {self.in_flight} turn(s)")
+
+        deadline = self._started_at + timeout
+        while self.in_flight and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+        self.abandoned_turns = self.in_flight
+
+        if session_store.enabled:
+            self.saved_sessions = session_store.save_all(session_manager.get_active_sessions())
+
+        for listener in self._listeners:
+            try:
+                await listener()
+            except Exception as e:
+                print(f"Drain listener failed: {e}")
+
+        self._finished_at = time.monotonic()
+        print(
+            f"Drained in {self._finished_at - self._started_at:.1f}s: "
+            f"{self.saved_sessions} session(s) saved, {self.abandoned_turns} turn(s) cut off"
+        )
+
+    def stats(self) -> Dict:
+        end = self._finished_at or time.monotonic()
+        return {
+            "draining": self.draining,
+            "in_flight_turns": self.in_flight,
+            "drain_seconds": round(end - self._started_at, 2) if self._started_at else None,
+            "saved_sessions": self.saved_sessions,
+            "abandoned_turns": self.abandoned_turns,
+            "session_store": session_store.stats(),
+        }
+
+
+# Global drain controller instance
+drain_controller = DrainController()
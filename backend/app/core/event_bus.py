@@ -0,0 +1,271 @@
+"""Publish/subscribe for session events, within one process or across workers.
+
+`LocalEventBus` delivers to subscribers in the same process. `IPCEventBus`
+also relays through a small broker on a Unix socket so a frame published by
+one uvicorn worker reaches sockets held by the others. The worker holding the
+broker lock hosts the broker; the others connect to it, and if the host exits
+one of them takes over. Frames published in the same flush interval go to the
+broker as one batch per channel.
+
+Frames are opaque strings (already-encoded JSON); the broker never decodes
+them. Delivery across workers is best effort: frames published while a worker
+is reconnecting to the broker are dropped, and so are frames for a connection
+that already has `event_bus_max_buffer_bytes` unsent, so one stuck worker
+can't grow the broker's (or a publisher's) buffers without bound.
+"""
+import asyncio
+import fcntl
+import os
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+
+from .config import settings
+from .serialization import dumps, loads
+
+# Called with (channel, frame) for every frame published on a subscribed channel
+Subscriber = Callable[[str, str], Awaitable[None]]
+
+# Audio frames can be large; StreamReader's default 64 KiB line limit is not enough
+_LINE_LIMIT = 64 * 1024 * 1024
+
+
+class LocalEventBus:
+    """In-process pub/sub; the default for a single worker"""
+
+    backend = "local"
+
+    def __init__(self):
+        self._subscribers: Dict[str, List[Subscriber]] = {}
+        self.published = 0
+        self.delivered = 0
+
+    def subscribe(self, channel: str, callback: Subscriber):
+        self._subscribers.setdefault(channel, []).append(callback)
+
+    def unsubscribe(self, channel: str, callback: Subscriber):
+        callbacks = self._subscribers.get(channel)
+        if callbacks and callback in callbacks:
+            callbacks.remove(callback)
+            if not callbacks:
+                del self._subscribers[channel]
+
+    async def publish(self, channel: str, frame: str):
+        """Deliver to local subscribers; returns once they have all handled the frame"""
+        self.published += 1
+        await self._deliver(channel, frame)
+
+    async def _deliver(self, channel: str, frame: str):
+        for callback in list(self._subscribers.get(channel, ())):
+            try:
+                await callback(channel, frame)
+                self.delivered += 1
+            except Exception as e:
+                print(f"Event subscriber failed on {channel}: {e}")
+
+    async def start(self):
+        pass
+
+    async def stop(self):
+        pass
+
+    def stats(self) -> Dict:
+        return {
+            "backend": self.backend,
+            "channels": len(self._subscribers),
+            "published": self.published,
+            "delivered": self.delivered,
+        }
+
+
+class IPCEventBus(LocalEventBus):
+    """Pub/sub shared by the worker processes on one host.
+
+    Wire format, one line per message: `sub <channel>`, `unsub <channel>` and
+    `pub <channel> <JSON array of frames>`. The broker forwards `pub` lines
+    verbatim to every other connection subscribed to the channel.
+    """
+
+    backend = "ipc"
+
+    def __init__(self, path: str, flush_interval: float):
+        super().__init__()
+        self.path = path
+        self.flush_interval = flush_interval
+        self._pending: Dict[str, List[str]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._task: Optional[asyncio.Task] = None
+        # Broker state, only used by the hosting worker
+        self._lock_fd: Optional[int] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._routes: Dict[str, Set[asyncio.StreamWriter]] = {}
+        self.batches = 0
+        self.dropped = 0
+        self.broker_dropped = 0
+        self.received = 0
+
+    def subscribe(self, channel: str, callback: Subscriber):
+        first = channel not in self._subscribers
+        super().subscribe(channel, callback)
+        if first:
+            self._send_line(f"sub {channel}\n".encode())
+
+    def unsubscribe(self, channel: str, callback: Subscriber):
+        super().unsubscribe(channel, callback)
+        if channel not in self._subscribers:
+            self._send_line(f"unsub {channel}\n".encode())
+
+    async def publish(self, channel: str, frame: str):
+        self.published += 1
+        self._pending.setdefault(channel, []).append(frame)
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self.flush_interval, self._flush)
+        await self._deliver(channel, frame)
+
+    def _flush(self):
+        self._flush_handle = None
+        pending, self._pending = self._pending, {}
+        if self._writer is None:
+            self.dropped += sum(len(frames) for frames in pending.values())
+            return
+        for channel, frames in pending.items():
+            self._send_line(f"pub {channel} ".encode() + dumps(frames).encode() + b"\n")
+            self.batches += 1
+
+    def _send_line(self, line: bytes):
+        if self._writer is not None and not self._writer.is_closing():
+            if _backed_up(self._writer):
+                self.dropped += 1
+                return
+            self._writer.write(line)
+
+    async def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush()
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if self._writer:
+            self._writer.close()
+        if self._server:
+            self._server.close()
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = None
+
+    async def _run(self):
+        """Keep one connection to the broker, hosting it whenever nobody else does"""
+        while True:
+            try:
+                await self._host_if_free()
+                reader, writer = await asyncio.open_unix_connection(self.path, limit=_LINE_LIMIT)
+            except (FileNotFoundError, ConnectionRefusedError):
+                await asyncio.sleep(0.2)  # The host is starting up or has just exited
+                continue
+
+            self._writer = writer
+            for channel in self._subscribers:
+                writer.write(f"sub {channel}\n".encode())
+            try:
+                while line := await reader.readline():
+                    _, channel, payload = line.split(b" ", 2)
+                    channel = channel.decode()
+                    for frame in loads(payload):
+                        self.received += 1
+                        await self._deliver(channel, frame)
+            except (ConnectionError, ValueError) as e:
+                print(f"Event bus connection lost: {e}")
+            finally:
+                self._writer = None
+                writer.close()
+            await asyncio.sleep(0.2)
+
+    async def _host_if_free(self):
+        if self._server is not None:
+            return
+        fd = os.open(self.path + ".lock", os.O_CREAT | os.O_RDWR, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return  # Another worker is the broker
+        self._lock_fd = fd
+        try:
+            os.unlink(self.path)  # Left behind by a previous host
+        except FileNotFoundError:
+            pass
+        self._server = await asyncio.start_unix_server(self._serve, self.path, limit=_LINE_LIMIT)
+        print(f"Event bus broker listening on {self.path} (pid {os.getpid()})")
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Broker side of one worker connection"""
+        channels: Set[str] = set()
+        try:
+            while line := await reader.readline():
+                op, _, rest = line.partition(b" ")
+                if op == b"pub":
+                    channel = rest.split(b" ", 1)[0].decode()
+                    for peer in self._routes.get(channel, ()):
+                        if peer is writer or peer.is_closing():
+                            continue
+                        if _backed_up(peer):
+                            # Waiting for a stuck worker would stall every publisher
+                            self.broker_dropped += 1
+                            continue
+                        peer.write(line)
+                elif op in (b"sub", b"unsub"):
+                    channel = rest.strip().decode()
+                    peers = self._routes.setdefault(channel, set())
+                    if op == b"sub":
+                        peers.add(writer)
+                        channels.add(channel)
+                    else:
+                        peers.discard(writer)
+                        channels.discard(channel)
+                        if not peers:
+                            del self._routes[channel]
+        except ConnectionError:
+            pass
+        finally:
+            for channel in channels:
+                peers = self._routes.get(channel)
+                if peers is not None:
+                    peers.discard(writer)
+                    if not peers:
+                        del self._routes[channel]
+            writer.close()
+
+    def stats(self) -> Dict:
+        return {
+            **super().stats(),
+            "connected": self._writer is not None,
+            "broker": self._server is not None,
+            "batches": self.batches,
+            "received": self.received,
+            "dropped": self.dropped,
+            "broker_dropped": self.broker_dropped,
+        }
+
+
+def _backed_up(writer: asyncio.StreamWriter) -> bool:
+    return writer.transport.get_write_buffer_size() > settings.event_bus_max_buffer_bytes
+
+
+def create_event_bus() -> LocalEventBus:
+    if settings.event_bus == "ipc":
+        return IPCEventBus(settings.event_bus_path, settings.event_bus_flush_ms / 1000)
+    return LocalEventBus()
+
+
+# Global event bus instance
+event_bus = create_event_bus()
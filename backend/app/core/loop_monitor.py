@@ -0,0 +1,118 @@
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Optional
+from .config import settings
+from .metrics import metrics
+
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+MAX_STACK_FRAMES = 30
+
+loop_lag_seconds = metrics.histogram("event_loop_lag_seconds", "Delay of the loop monitor's periodic tick", (), LAG_BUCKETS)
+
+
+class LoopMonitor:
+    """Event-loop lag sampler with a watchdog thread that captures blocking stacks.
+
+    A coroutine wakes every `interval` seconds and records how late it woke up.
+    A daemon thread watches that heartbeat; if it stops for longer than
+    `threshold`, whatever the loop thread is executing is blocking every socket
+    on this worker, so its stack is captured while it is still running.
+    """
+
+    def __init__(self, interval: float, threshold: float, history: int = 20):
+        self.interval = interval
+        self.threshold = threshold
+        self.stalls: deque = deque(maxlen=history)
+        self.samples = 0
+        self.blocked = 0
+        self.max_lag = 0.0
+        self._heartbeat = 0.0
+        self._captured_for: Optional[float] = None
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    async def start(self):
+        if self._task:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.perf_counter()
+        self._stop.clear()
+        self._task = asyncio.create_task(self._sample())
+        self._thread = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._thread.start()
+
+    async def stop(self):
+        if not self._task:
+            return
+        self._stop.set()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._thread.join(timeout=1.0)
+        self._thread = None
+
+    async def _sample(self):
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.perf_counter()
+            lag = max(0.0, now - expected)
+            previous = self._heartbeat
+            self._heartbeat = now
+
+            self.samples += 1
+            self.max_lag = max(self.max_lag, lag)
+            loop_lag_seconds.observe(lag, ())
+            if lag >= self.threshold:
+                self.blocked += 1
+                # The watchdog saw this stall in progress; record how long it really lasted
+                if self._captured_for == previous and self.stalls:
+                    self.stalls[-1]["blocked_ms"] = round(lag * 1000, 1)
+
+    def _watch(self):
+        while not self._stop.wait(self.threshold / 2):
+            heartbeat = self._heartbeat
+            stalled = time.perf_counter() - heartbeat - self.interval
+            if stalled < self.threshold or heartbeat == self._captured_for:
+                continue
+
+            self._captured_for = heartbeat
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = traceback.format_stack(frame)[-MAX_STACK_FRAMES:] if frame else []
+            self.stalls.append({
+                "detected_at": datetime.now().isoformat(),
+                "blocked_ms": round(stalled * 1000, 1),
+                "stack": [line.rstrip() for line in stack],
+            })
+            print(f"Event loop blocked for {stalled * 1000:.0f} ms in: {stack[-1].strip() if stack else 'unknown'}")
+
+    def recent_stalls(self) -> List[Dict]:
+        return list(reversed(self.stalls))
+
+    def stats(self) -> Dict:
+        return {
+            "running": self._task is not None,
+            "threshold_ms": round(self.threshold * 1000, 1),
+            "samples": self.samples,
+            "blocked": self.blocked,
+            "max_lag_ms": round(self.max_lag * 1000, 1),
+            "stalls_captured": len(self.stalls),
+        }
+
+
+# Global monitor instance
+loop_monitor = LoopMonitor(
+    interval=settings.loop_monitor_interval_seconds,
+    threshold=settings.loop_block_threshold_seconds,
+    history=settings.loop_stall_history
+)
@@ -0,0 +1,148 @@
+import re
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+# Latency buckets in seconds, tuned for voice turns (sub-100 ms sends up to multi-second LLM calls)
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 15.0)
+
+
+class Histogram:
+    """Prometheus-style histogram keyed by label values.
+
+    Observations only bump a per-bucket count; cumulative counts are built at
+    render time so the hot path stays a bisect and three additions. Not
+    thread-safe: observe from the event loop, which is where it's rendered.
+    """
+
+    def __init__(self, name: str, help: str, label_names: Tuple[str, ...], buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.label_names = label_names
+        self.buckets = buckets
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, value: float, labels: Tuple[str, ...]):
+        # Layout: [count per bucket..., +Inf count, sum]
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for labels, series in sorted(self._series.items()):
+            label_text = ",".join(f'{k}="{_escape(v)}"' for k, v in zip(self.label_names, labels))
+            prefix = label_text + "," if label_text else ""
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{{prefix}le="{bound}"}} {cumulative}')
+            cumulative += series[-2]
+            lines.append(f'{self.name}_bucket{{{prefix}le="+Inf"}} {cumulative}')
+            suffix = f"{{{label_text}}}" if label_text else ""
+            lines.append(f"{self.name}_sum{suffix} {series[-1]:.6f}")
+            lines.append(f"{self.name}_count{suffix} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Histograms plus collectors that turn existing stats() dicts into gauges"""
+
+    def __init__(self, namespace: str = "interview"):
+        self.namespace = namespace
+        self._histograms: Dict[str, Histogram] = {}
+        self._collectors: List[Callable[[], Dict[str, Any]]] = []
+
+    def histogram(self, name: str, help: str, label_names: Tuple[str, ...], buckets: Tuple[float, ...] = LATENCY_BUCKETS) -> Histogram:
+        full_name = f"{self.namespace}_{name}"
+        if full_name not in self._histograms:
+            self._histograms[full_name] = Histogram(full_name, help, label_names, buckets)
+        return self._histograms[full_name]
+
+    def add_collector(self, collector: Callable[[], Dict[str, Any]]):
+        """Register a callable whose (nested) dict of numbers is exported as gauges on scrape"""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for histogram in self._histograms.values():
+            lines.extend(histogram.render())
+
+        for collector in self._collectors:
+            try:
+                values = collector()
+            except Exception as e:
+                print(f"Metrics collector error: {e}")
+                continue
+            for name, value in flatten_stats(self.namespace, values):
+                lines.append(f"# TYPE {name} gauge")
+                lines.append(f"{name} {value}")
+
+        return "\n".join(lines) + "\n"
+
+
+def flatten_stats(prefix: str, values: Dict[str, Any]) -> Iterable[Tuple[str, float]]:
+    """Yield (metric_name, number) for every numeric leaf; strings and None are skipped"""
+    for key, value in values.items():
+        name = f"{prefix}_{re.sub(r'[^a-zA-Z0-9_]', '_', str(key))}"
+        if isinstance(value, dict):
+            yield from flatten_stats(name, value)
+        elif isinstance(value, bool):
+            yield name, int(value)
+        elif isinstance(value, (int, float)):
+            yield name, value
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# Global registry
+metrics = MetricsRegistry()
+
+stage_seconds = metrics.histogram(
+    "stage_seconds",
+    "Duration of each voice pipeline stage",
+    ("stage", "persona", "interview_type")
+)
+turn_seconds = metrics.histogram(
+    "turn_seconds",
+    "End of candidate input to interviewer audio sent",
+    ("persona", "interview_type")
+)
+
+# Persona and interview type of the session being handled; copied into tasks and worker threads
+_turn_labels: ContextVar[Tuple[str, str]] = ContextVar("turn_labels", default=("unknown", "unknown"))
+
+
+def set_turn_labels(persona: str, interview_type: str):
+    """Tag stage timings recorded from this context with the session's persona and interview type"""
+    _turn_labels.set((persona, interview_type))
+
+
+def observe_stage(stage: str, seconds: float):
+    stage_seconds.observe(seconds, (stage,) + _turn_labels.get())
+
+
+def observe_turn(seconds: float):
+    turn_seconds.observe(seconds, _turn_labels.get())
+
+
+class span:
+    """Times a block into the stage histogram: `with span("tts_completion"): ...`"""
+
+    __slots__ = ("stage", "started")
+
+    def __init__(self, stage: str):
+        self.stage = stage
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        observe_stage(self.stage, time.perf_counter() - self.started)
+        return False
@@ -1,7 +1,10 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List, Dict
+from typing import Any, Iterator, Optional, List, Dict
 from datetime import datetime
 from enum import Enum
+from array import array
+import sys
+import time
 import uuid
 
 
@@ -35,6 +38,13 @@ class SessionStatus(str, Enum):
     ERROR = "error"
 
 
+class FeedbackJobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
 class ConversationRole(str, Enum):
     INTERVIEWER = "interviewer"
     CANDIDATE = "candidate"
@@ -56,15 +66,168 @@ class ConversationMessage(BaseModel):
     audio_url: Optional[str] = None
 
 
-class InterviewSession(BaseModel):
-    session_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    config: InterviewConfig
-    status: SessionStatus = SessionStatus.PENDING
-    start_time: Optional[datetime] = None
-    end_time: Optional[datetime] = None
-    conversation_history: List[ConversationMessage] = Field(default_factory=list)
-    current_question: Optional[str] = None
-    question_count: int = 0
+# In-memory session state. These are plain __slots__ classes rather than
+# Pydantic models to keep long interviews small; convert to ConversationMessage
+# only at API boundaries.
+
+_ROLES = (ConversationRole.INTERVIEWER, ConversationRole.CANDIDATE)
+_ROLE_CODES = {role: code for code, role in enumerate(_ROLES)}
+
+# Timestamps are stored as time.monotonic(); this converts them to wall-clock time
+_MONOTONIC_EPOCH = time.time() - time.monotonic()
+
+
+class Turn:
+    """One conversation message as read from a ConversationHistory"""
+
+    __slots__ = ("role", "content", "timestamp")
+
+    def __init__(self, role: ConversationRole, content: str, timestamp: Optional[float] = None):
+        self.role = role
+        self.content = content
+        self.timestamp = time.monotonic() if timestamp is None else timestamp
+
+    def to_message(self) -> ConversationMessage:
+        return ConversationMessage(
+            role=self.role,
+            content=self.content,
+            timestamp=datetime.fromtimestamp(self.timestamp + _MONOTONIC_EPOCH)
+        )
+
+
+class ConversationHistory:
+    """Column-oriented message list: role codes, monotonic timestamps and interned content.
+
+    Indexing and iteration yield Turn records built on demand, so code that
+    reads `.role` and `.content` works the same as with a list of messages.
+    """
+
+    __slots__ = ("_roles", "_timestamps", "_contents")
+
+    def __init__(self):
+        self._roles = array("B")
+        self._timestamps = array("d")
+        self._contents: List[str] = []
+
+    def append(self, role: ConversationRole, content: str, timestamp: Optional[float] = None):
+        self._roles.append(_ROLE_CODES[role])
+        self._timestamps.append(time.monotonic() if timestamp is None else timestamp)
+        self._contents.append(sys.intern(content))
+
+    def __len__(self) -> int:
+        return len(self._contents)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._turn(i) for i in range(*index.indices(len(self._contents)))]
+        if index < 0:
+            index += len(self._contents)
+        if not 0 <= index < len(self._contents):
+            raise IndexError("conversation history index out of range")
+        return self._turn(index)
+
+    def __iter__(self) -> Iterator[Turn]:
+        for i in range(len(self._contents)):
+            yield self._turn(i)
+
+    def last_timestamp(self) -> Optional[float]:
+        """Monotonic time of the latest message"""
+        return self._timestamps[-1] if self._timestamps else None
+
+    def _turn(self, i: int) -> Turn:
+        return Turn(_ROLES[self._roles[i]], self._contents[i], self._timestamps[i])
+
+    def to_messages(self) -> List[ConversationMessage]:
+        return [turn.to_message() for turn in self]
+
+
+class Usage:
+    """Provider usage and its list-price cost"""
+
+    __slots__ = ("input_tokens", "output_tokens", "whisper_seconds", "tts_characters", "cached_tts_characters", "cost_usd")
+
+    def __init__(self):
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.whisper_seconds = 0.0
+        self.tts_characters = 0
+        self.cached_tts_characters = 0
+        self.cost_usd = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "whisper_seconds": round(self.whisper_seconds, 1),
+            "tts_characters": self.tts_characters,
+            "cached_tts_characters": self.cached_tts_characters,
+            "cost_usd": round(self.cost_usd, 6),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Usage":
+        usage = cls()
+        for field in cls.__slots__:
+            if field in data:
+                setattr(usage, field, data[field])
+        return usage
+
+
+class InterviewSession:
+    __slots__ = ("session_id", "config", "status", "start_time", "end_time", "conversation_history", "question_count", "tenant", "usage")
+
+    def __init__(self, config: InterviewConfig, session_id: Optional[str] = None):
+        self.session_id = session_id or str(uuid.uuid4())
+        self.config = config
+        self.status = SessionStatus.PENDING
+        self.start_time: Optional[datetime] = None
+        self.end_time: Optional[datetime] = None
+        self.conversation_history = ConversationHistory()
+        self.question_count = 0
+        self.tenant: Optional[str] = None  # Client the session's provider usage is billed to
+        self.usage = Usage()  # Provider usage billed to this session, carried across drain hand-offs
+
+    @property
+    def current_question(self) -> Optional[str]:
+        """Latest interviewer message"""
+        history = self.conversation_history
+        for i in range(len(history) - 1, -1, -1):
+            turn = history[i]
+            if turn.role == ConversationRole.INTERVIEWER:
+                return turn.content
+        return None
+
+    def to_snapshot(self) -> Dict[str, Any]:
+        """JSON-ready state for the session store; turn timestamps become wall-clock seconds"""
+        return {
+            "session_id": self.session_id,
+            "config": self.config.model_dump(mode="json"),
+            "status": self.status.value,
+            "start_time": self.start_time.isoformat() if self.start_time else None,
+            "end_time": self.end_time.isoformat() if self.end_time else None,
+            "question_count": self.question_count,
+            "tenant": self.tenant,
+            "usage": self.usage.to_dict(),
+            "turns": [
+                [turn.role.value, turn.content, turn.timestamp + _MONOTONIC_EPOCH]
+                for turn in self.conversation_history
+            ],
+        }
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Dict[str, Any]) -> "InterviewSession":
+        session = cls(InterviewConfig(**snapshot["config"]), session_id=snapshot["session_id"])
+        session.status = SessionStatus(snapshot["status"])
+        if snapshot["start_time"]:
+            session.start_time = datetime.fromisoformat(snapshot["start_time"])
+        if snapshot["end_time"]:
+            session.end_time = datetime.fromisoformat(snapshot["end_time"])
+        session.question_count = snapshot["question_count"]
+        session.tenant = snapshot.get("tenant")
+        session.usage = Usage.from_dict(snapshot.get("usage") or {})
+        for role, content, wall_time in snapshot["turns"]:
+            session.conversation_history.append(ConversationRole(role), content, wall_time - _MONOTONIC_EPOCH)
+        return session
 
 
 # Response Models
@@ -84,6 +247,13 @@ class InterviewFeedback(BaseModel):
     completed_at: datetime = Field(default_factory=datetime.now)
 
 
+class FeedbackJobResponse(BaseModel):
+    session_id: str
+    status: FeedbackJobStatus
+    feedback: Optional[InterviewFeedback] = None
+    error_message: Optional[str] = None
+
+
 class SessionStartResponse(BaseModel):
     session_id: str
     initial_greeting: str
@@ -96,6 +266,7 @@ class SessionStatusResponse(BaseModel):
     question_count: int
     duration: str
     current_question: Optional[str] = None
+    usage: Optional[Dict[str, Any]] = None
 
 
 class PersonaInfo(BaseModel):
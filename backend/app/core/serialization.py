@@ -0,0 +1,65 @@
+"""JSON encoding for WebSocket frames and REST responses.
+
+Uses orjson when it is installed and falls back to the stdlib `json` module
+otherwise. Both paths accept datetimes, enums and Pydantic models, so callers
+can pass `datetime.now()` directly instead of pre-formatting it.
+"""
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # Optional speedup
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    BACKEND = "orjson"
+
+    def dumps_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_default)
+
+    def dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=_default).decode()
+
+    def loads(data):
+        return orjson.loads(data)
+else:
+    BACKEND = "json"
+    _encoder = json.JSONEncoder(default=_default, ensure_ascii=False, separators=(",", ":"))
+
+    def dumps_bytes(obj: Any) -> bytes:
+        return _encoder.encode(obj).encode()
+
+    def dumps(obj: Any) -> str:
+        return _encoder.encode(obj)
+
+    def loads(data):
+        return json.loads(data)
+
+
+def static_frame(message: Dict[str, Any]) -> str:
+    """Encode a fixed message once at import time; send the returned string as-is"""
+    return dumps(message)
+
+
+class FastJSONResponse(JSONResponse):
+    """Default REST response class, encoded with the same serializer as socket frames"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps_bytes(content)
@@ -1,14 +1,21 @@
 from typing import Dict, Optional, List
+from collections import OrderedDict
 from datetime import datetime
+import asyncio
 import threading
-from .models import InterviewSession, InterviewConfig, ConversationMessage, SessionStatus
+import time
+from .models import InterviewSession, InterviewConfig, ConversationMessage, ConversationRole, SessionStatus
 from .config import settings
+from .session_store import session_store
+
+MAX_REMEMBERED_MISSES = 10000
 
 
 class SessionManager:
     def __init__(self):
         self._sessions: Dict[str, InterviewSession] = {}
         self._lock = threading.Lock()
+        self._missing: "OrderedDict[str, float]" = OrderedDict()  # Ids with no snapshot, when last probed
     
     def create_session(self, config: InterviewConfig) -> str:
         """Create a new interview session"""
@@ -26,10 +33,39 @@ class SessionManager:
             return session.session_id
     
     def get_session(self, session_id: str) -> Optional[InterviewSession]:
-        """Get session by ID"""
+        """Get session by ID from this worker's memory"""
         with self._lock:
             return self._sessions.get(session_id)
     
+    async def find_session(self, session_id: str) -> Optional[InterviewSession]:
+        """Get session by ID, restoring it if another worker saved it while draining.
+        
+        For request entry points. The snapshot is claimed in a worker thread,
+        outside the lock; ids found to have no snapshot aren't probed again for
+        `session_restore_miss_ttl_seconds`, so polls for unknown ids stay cheap.
+        """
+        session = self.get_session(session_id)
+        if session is not None or not session_store.enabled:
+            return session
+        
+        now = time.monotonic()
+        missed_at = self._missing.get(session_id)
+        if missed_at is not None and now - missed_at < settings.session_restore_miss_ttl_seconds:
+            return None
+        
+        restored = await asyncio.to_thread(session_store.claim, session_id)
+        if restored is None:
+            self._missing[session_id] = time.monotonic()
+            self._missing.move_to_end(session_id)
+            while len(self._missing) > MAX_REMEMBERED_MISSES:
+                self._missing.popitem(last=False)
+            return None
+        
+        with self._lock:
+            self._missing.pop(session_id, None)
+            # Another request may have restored it meanwhile; only one claim can succeed, but keep the first
+            return self._sessions.setdefault(session_id, restored)
+    
     def update_session(self, session_id: str, updates: dict) -> bool:
         """Update session with provided data"""
         with self._lock:
@@ -57,20 +93,23 @@ class SessionManager:
             "end_time": datetime.now()
         })
     
-    def add_message(self, session_id: str, message: ConversationMessage) -> bool:
-        """Add message to conversation history"""
+    def add_turn(self, session_id: str, role: ConversationRole, content: str) -> bool:
+        """Append a message to the conversation history"""
         with self._lock:
             session = self._sessions.get(session_id)
             if not session:
                 return False
             
-            session.conversation_history.append(message)
-            if message.role.value == "interviewer":
-                session.current_question = message.content
+            session.conversation_history.append(role, content)
+            if role == ConversationRole.INTERVIEWER:
                 session.question_count += 1
             
             return True
     
+    def add_message(self, session_id: str, message: ConversationMessage) -> bool:
+        """Add an API-level message to conversation history"""
+        return self.add_turn(session_id, message.role, message.content)
+    
     def delete_session(self, session_id: str) -> bool:
         """Delete a session"""
         with self._lock:
@@ -85,34 +124,54 @@ class SessionManager:
             return [s for s in self._sessions.values() 
                    if s.status in [SessionStatus.PENDING, SessionStatus.ACTIVE]]
     
-    def cleanup_expired_sessions(self):
-        """Remove sessions that have exceeded max duration"""
+    def cleanup_expired_sessions(self) -> List[InterviewSession]:
+        """Remove sessions past max duration, and live sessions idle past the idle timeout.
+        
+        Returns the removed sessions so their slots and per-session state can be released.
+        """
         with self._lock:
             now = datetime.now()
+            now_monotonic = time.monotonic()
             expired_sessions = []
             
             for session_id, session in self._sessions.items():
-                if session.start_time:
-                    duration = now - session.start_time
-                    if duration.total_seconds() > settings.max_session_duration:
+                if not session.start_time:
+                    continue
+                duration = now - session.start_time
+                if duration.total_seconds() > settings.max_session_duration:
+                    expired_sessions.append(session_id)
+                elif session.status == SessionStatus.ACTIVE:
+                    # A closed tab never calls stop; its last message tells when it was abandoned
+                    last_activity = session.conversation_history.last_timestamp()
+                    idle = (
+                        now_monotonic - last_activity if last_activity is not None
+                        else duration.total_seconds()
+                    )
+                    if idle > settings.session_idle_timeout_seconds:
                         expired_sessions.append(session_id)
             
-            for session_id in expired_sessions:
-                del self._sessions[session_id]
+            return [self._sessions.pop(session_id) for session_id in expired_sessions]
     
     def get_session_duration(self, session_id: str) -> str:
         """Get formatted session duration"""
         session = self.get_session(session_id)
-        if not session or not session.start_time:
+        if not session:
             return "00:00"
-        
-        end_time = session.end_time or datetime.now()
-        duration = end_time - session.start_time
-        
-        minutes = int(duration.total_seconds() // 60)
-        seconds = int(duration.total_seconds() % 60)
-        
-        return f"{minutes:02d}:{seconds:02d}"
+        return format_duration(session)
+
+
+def format_duration(session: InterviewSession) -> str:
+    """Session duration as MM:SS, up to now if it is still running"""
+    if not session.start_time:
+        return "00:00"
+    
+    end_time = session.end_time or datetime.now()
+    duration = end_time - session.start_time
+    
+    minutes = int(duration.total_seconds() // 60)
+    seconds = int(duration.total_seconds() % 60)
+    
+    return f"{minutes:02d}:{seconds:02d}"
 
 
 # Global session manager instance
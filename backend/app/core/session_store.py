@@ -0,0 +1,87 @@
+import os
+from typing import Iterable, Optional
+from .models import InterviewSession
+from .serialization import dumps_bytes, loads
+from .config import settings
+
+
+class SessionStore:
+    """Session snapshots on disk, one JSON file per session.
+
+    A draining worker saves its live sessions here; whichever worker next
+    sees a request for one of them claims the file and carries on with the
+    interview. Claiming renames the file first, so with several workers
+    sharing the directory only one of them restores a given session.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.saved = 0
+        self.restored = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.directory)
+
+    def _path(self, session_id: str) -> str:
+        # Session ids are UUIDs; reject anything that could escape the directory
+        if not session_id or os.sep in session_id or session_id.startswith("."):
+            raise ValueError(f"Invalid session id: {session_id!r}")
+        return os.path.join(self.directory, f"{session_id}.json")
+
+    def save(self, session: InterviewSession):
+        """Write a snapshot atomically"""
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(session.session_id)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(dumps_bytes(session.to_snapshot()))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        self.saved += 1
+
+    def save_all(self, sessions: Iterable[InterviewSession]) -> int:
+        count = 0
+        for session in sessions:
+            try:
+                self.save(session)
+                count += 1
+            except Exception as e:
+                print(f"Failed to snapshot session {session.session_id}: {e}")
+        return count
+
+    def claim(self, session_id: str) -> Optional[InterviewSession]:
+        """Load and remove a session's snapshot, or None if there isn't one"""
+        if not self.enabled:
+            return None
+        try:
+            path = self._path(session_id)
+        except ValueError:
+            return None
+        claimed_path = f"{path}.{os.getpid()}.claimed"
+        try:
+            os.rename(path, claimed_path)
+        except FileNotFoundError:
+            return None  # No snapshot, or another worker got it first
+
+        try:
+            with open(claimed_path, "rb") as f:
+                session = InterviewSession.from_snapshot(loads(f.read()))
+        except Exception as e:
+            print(f"Failed to restore session {session_id}, kept {claimed_path}: {e}")
+            return None
+        os.unlink(claimed_path)
+        self.restored += 1
+        return session
+
+    def stats(self):
+        return {
+            "directory": self.directory,
+            "saved": self.saved,
+            "restored": self.restored,
+        }
+
+
+# Global session store instance
+session_store = SessionStore(settings.session_store_dir)
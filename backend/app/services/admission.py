@@ -0,0 +1,260 @@
+import asyncio
+import math
+import time
+import uuid
+from collections import OrderedDict, deque
+from typing import Deque, Dict, List, Optional
+from ..core.config import settings
+from ..core.session_manager import session_manager
+from .elevenlabs_service import elevenlabs_service
+from .openai_service import openai_service
+from .provider_scheduler import elevenlabs_scheduler, openai_scheduler
+from .resilience import LatencyTracker
+
+# Used until the providers have reported real latencies
+DEFAULT_LLM_SECONDS = 1.5
+DEFAULT_TRANSCRIPTION_SECONDS = 1.0
+DEFAULT_TTS_SECONDS = 1.0
+REPLY_CHARACTERS = 200  # Typical synthesized reply length, for the character budget
+
+
+class AdmissionRejected(Exception):
+    """A start request that can't be queued; retry after `retry_after` seconds"""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class Ticket:
+    """A queued request to start an interview"""
+
+    __slots__ = ("ticket_id", "tenant", "enqueued_at", "last_seen", "granted")
+
+    def __init__(self, tenant: str):
+        self.ticket_id = uuid.uuid4().hex
+        self.tenant = tenant
+        self.enqueued_at = time.monotonic()
+        self.last_seen = self.enqueued_at
+        self.granted = asyncio.Event()
+
+
+class AdmissionController:
+    """Admits new interviews up to a capacity estimated from provider throughput.
+
+    Capacity is the number of sessions whose turns the providers can serve at
+    `admission_target_utilization`: sustainable turns per second (from each
+    provider's concurrency, rate limits and observed latency) times the
+    observed seconds between a session's turns. `max_concurrent_sessions`
+    remains a hard ceiling.
+
+    Requests over capacity wait in per-tenant queues served round-robin, so
+    one tenant or IP can't take every slot that frees up. A request is held
+    for up to `admission_hold_seconds`; if it is still queued the caller gets
+    its ticket with a position and ETA and polls again with it.
+    """
+
+    def __init__(self):
+        self._queues: "OrderedDict[str, Deque[Ticket]]" = OrderedDict()
+        self._tickets: Dict[str, Ticket] = {}
+        self._reserved = 0  # Granted tickets whose session hasn't been created yet
+        self._session_seconds = settings.admission_session_seconds
+        self.wait_latency = LatencyTracker()
+        self.admitted = 0
+        self.requests = 0
+        self.rejected = 0
+        self.timed_out = 0
+
+    def turns_per_second(self) -> float:
+        """Sustainable candidate turns per second across both providers"""
+        llm = openai_service.chat_latency.percentile(50) or DEFAULT_LLM_SECONDS
+        stt = openai_service.transcription_latency.percentile(50) or DEFAULT_TRANSCRIPTION_SECONDS
+        tts = elevenlabs_service.tts_latency.percentile(50) or DEFAULT_TTS_SECONDS
+
+        limits = [
+            openai_scheduler.max_concurrency / (llm + stt),
+            elevenlabs_scheduler.max_concurrency / tts,
+        ]
+        # A turn is a transcription and a completion, then one synthesis
+        if openai_scheduler.requests.enabled:
+            limits.append(openai_scheduler.requests.rate / 2)
+        if elevenlabs_scheduler.requests.enabled:
+            limits.append(elevenlabs_scheduler.requests.rate)
+        if elevenlabs_scheduler.characters.enabled:
+            limits.append(elevenlabs_scheduler.characters.rate / REPLY_CHARACTERS)
+        return min(limits)
+
+    def turn_interval(self) -> float:
+        """Average seconds between one session's turns, from sessions with a recent turn.
+
+        Measured up to each session's latest message, so an abandoned or paused
+        session doesn't stretch the interval (and so inflate capacity).
+        """
+        seconds = 0.0
+        turns = 0
+        recent = time.monotonic() - settings.admission_recent_turn_seconds
+        for session in session_manager.get_active_sessions():
+            history = session.conversation_history
+            last_turn = history.last_timestamp()
+            if session.question_count < 2 or last_turn is None or last_turn < recent:
+                continue
+            seconds += last_turn - history[0].timestamp
+            turns += session.question_count - 1
+        return seconds / turns if turns and seconds > 0 else settings.admission_turn_interval_seconds
+
+    def capacity(self) -> int:
+        estimate = math.floor(
+            settings.admission_target_utilization * self.turns_per_second() * self.turn_interval()
+        )
+        return max(settings.admission_min_sessions, min(settings.max_concurrent_sessions, estimate))
+
+    def _in_use(self) -> int:
+        return len(session_manager.get_active_sessions()) + self._reserved
+
+    def queued(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    async def acquire(self, tenant: str, ticket_id: Optional[str] = None) -> Ticket:
+        """Reserve a slot for a new session, waiting in the tenant's queue if needed.
+
+        Returns a ticket: if `ticket.granted` is set the caller must create the
+        session and then call `release(ticket)`; otherwise the caller should
+        report `queue_status(ticket)` and come back with the ticket id.
+        """
+        self._expire_stale()
+        ticket = self._tickets.get(ticket_id) if ticket_id else None
+        if ticket is None or ticket.tenant != tenant:
+            ticket = self._enqueue(tenant)
+        ticket.last_seen = time.monotonic()
+        self._dispatch()
+
+        deadline = time.monotonic() + settings.admission_hold_seconds
+        while not ticket.granted.is_set():
+            if time.monotonic() - ticket.enqueued_at > settings.admission_max_wait_seconds:
+                self._remove(ticket)
+                self.timed_out += 1
+                raise AdmissionRejected("Timed out waiting for interview capacity", self.eta_seconds(1))
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                # Capacity follows latency, so re-check at least once a second
+                await asyncio.wait_for(ticket.granted.wait(), timeout=min(1.0, remaining))
+            except asyncio.TimeoutError:
+                self._dispatch()
+            except asyncio.CancelledError:
+                self._remove(ticket)  # Client went away
+                raise
+            ticket.last_seen = time.monotonic()
+        return ticket
+
+    def _enqueue(self, tenant: str) -> Ticket:
+        queue = self._queues.get(tenant)
+        if queue is not None and len(queue) >= settings.admission_max_queued_per_tenant:
+            self.rejected += 1
+            raise AdmissionRejected("Too many queued interview starts for this client", self.eta_seconds(len(queue)))
+        if self.queued() >= settings.admission_max_queue:
+            self.rejected += 1
+            raise AdmissionRejected("Interview queue is full", self.eta_seconds(self.queued()))
+
+        ticket = Ticket(tenant)
+        self._tickets[ticket.ticket_id] = ticket
+        self._queues.setdefault(tenant, deque()).append(ticket)
+        self.requests += 1
+        return ticket
+
+    def _dispatch(self):
+        """Grant queued tickets while there is capacity, one tenant at a time"""
+        free = self.capacity() - self._in_use()
+        while free > 0 and self._queues:
+            tenant, queue = next(iter(self._queues.items()))
+            ticket = queue.popleft()
+            if queue:
+                self._queues.move_to_end(tenant)
+            else:
+                del self._queues[tenant]
+            self._reserved += 1
+            ticket.granted.set()
+            self.wait_latency.record(time.monotonic() - ticket.enqueued_at)
+            free -= 1
+
+    def release(self, ticket: Ticket):
+        """The granted ticket's session was created (or creating it failed)"""
+        if self._tickets.pop(ticket.ticket_id, None) is not None and ticket.granted.is_set():
+            self._reserved -= 1
+            self.admitted += 1
+
+    def _remove(self, ticket: Ticket):
+        self._tickets.pop(ticket.ticket_id, None)
+        if ticket.granted.is_set():
+            self._reserved -= 1
+            return
+        queue = self._queues.get(ticket.tenant)
+        if queue and ticket in queue:
+            queue.remove(ticket)
+            if not queue:
+                del self._queues[ticket.tenant]
+
+    def _expire_stale(self):
+        """Drop tickets whose client stopped polling, returning any reserved slot"""
+        cutoff = time.monotonic() - settings.admission_ticket_ttl_seconds
+        for ticket in [t for t in self._tickets.values() if t.last_seen < cutoff]:
+            self._remove(ticket)
+
+    def session_ended(self, duration_seconds: float):
+        """A session freed its slot; also tunes the ETA estimate"""
+        self._session_seconds += 0.2 * (duration_seconds - self._session_seconds)
+        self._expire_stale()
+        self._dispatch()
+
+    def position(self, ticket: Ticket) -> int:
+        """1-based place in the round-robin serving order"""
+        queues: List[List[Ticket]] = [list(queue) for queue in self._queues.values()]
+        position = 0
+        for depth in range(max((len(queue) for queue in queues), default=0)):
+            for queue in queues:
+                if depth < len(queue):
+                    position += 1
+                    if queue[depth] is ticket:
+                        return position
+        return 0
+
+    def eta_seconds(self, position: int) -> float:
+        """Expected wait for a given queue position, from how often slots free up"""
+        if position <= 0:
+            return 0.0
+        return round(position * self._session_seconds / self.capacity(), 1)
+
+    def queue_status(self, ticket: Ticket) -> Dict:
+        position = self.position(ticket)
+        return {
+            "status": "queued",
+            "ticket_id": ticket.ticket_id,
+            "position": position,
+            "queue_length": self.queued(),
+            "eta_seconds": self.eta_seconds(position),
+            "poll_after_seconds": min(settings.admission_ticket_ttl_seconds / 2, settings.admission_hold_seconds),
+        }
+
+    def stats(self) -> Dict:
+        wait_p95 = self.wait_latency.percentile(95)
+        return {
+            "capacity": self.capacity(),
+            "in_use": self._in_use(),
+            "reserved": self._reserved,
+            "queued": self.queued(),
+            "queued_tenants": len(self._queues),
+            "turns_per_second": round(self.turns_per_second(), 2),
+            "turn_interval_seconds": round(self.turn_interval(), 1),
+            "session_seconds": round(self._session_seconds, 1),
+            "eta_seconds_for_new": self.eta_seconds(self.queued() + 1) if self._queues else 0.0,
+            "admitted": self.admitted,
+            "requests": self.requests,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "wait_p95_ms": round(wait_p95 * 1000, 1) if wait_p95 is not None else None,
+        }
+
+
+# Global admission controller instance
+admission_controller = AdmissionController()
@@ -0,0 +1,126 @@
+import asyncio
+import shutil
+import subprocess
+import time
+from typing import Dict, Optional, Tuple
+from ..core.config import settings
+from ..utils.audio import TARGET_SAMPLE_RATE, PcmAudio, audio_executor, decode_wav
+from .voice_activity import trim_silence, voice_activity
+
+FFMPEG = shutil.which("ffmpeg")
+
+
+class PreparedAudio:
+    """Candidate audio ready for transcription"""
+
+    def __init__(
+        self,
+        upload_data: bytes,
+        format: str,
+        pcm: Optional[PcmAudio] = None,
+        has_speech: bool = True,
+        trimmed_seconds: float = 0.0
+    ):
+        self.upload_data = upload_data
+        self.format = format
+        self.pcm = pcm
+        self.has_speech = has_speech
+        self.trimmed_seconds = trimmed_seconds
+
+
+def decode_to_pcm(audio_data: bytes) -> Optional[PcmAudio]:
+    """Decode any supported input to 16 kHz mono PCM (WAV natively, others via ffmpeg)"""
+    pcm = decode_wav(audio_data)
+    if pcm is None and FFMPEG:
+        pcm = _ffmpeg_decode(audio_data)
+    return pcm
+
+
+def encode_for_upload(pcm: PcmAudio) -> Tuple[bytes, str]:
+    """Encode PCM to the configured upload codec; falls back to 16 kHz WAV"""
+    if settings.upload_codec == "opus" and FFMPEG:
+        encoded = _ffmpeg_encode_opus(pcm)
+        if encoded:
+            return encoded, "ogg"
+    return pcm.to_wav(), "wav"
+
+
+def prepare_audio(audio_data: bytes, format: str = "wav") -> PreparedAudio:
+    """Decode, trim silence and re-encode one clip (runs on the audio worker pool)"""
+    pcm = decode_to_pcm(audio_data)
+    if pcm is None:
+        # Unknown container and no ffmpeg - forward the original bytes
+        return PreparedAudio(audio_data, format)
+
+    trimmed_seconds = 0.0
+    if settings.vad_enabled:
+        trimmed, trimmed_seconds = trim_silence(pcm)
+        if trimmed is None:
+            return PreparedAudio(b"", format, has_speech=False, trimmed_seconds=trimmed_seconds)
+        pcm = trimmed
+
+    upload_data, upload_format = encode_for_upload(pcm)
+    return PreparedAudio(upload_data, upload_format, pcm=pcm, trimmed_seconds=trimmed_seconds)
+
+
+def _ffmpeg_decode(audio_data: bytes) -> Optional[PcmAudio]:
+    result = subprocess.run(
+        [FFMPEG, "-hide_banner", "-loglevel", "error", "-i", "pipe:0",
+         "-f", "s16le", "-ac", "1", "-ar", str(TARGET_SAMPLE_RATE), "pipe:1"],
+        input=audio_data, capture_output=True, timeout=settings.transcode_timeout_seconds
+    )
+    if result.returncode != 0 or not result.stdout:
+        return None
+    return PcmAudio(memoryview(result.stdout), TARGET_SAMPLE_RATE)
+
+
+def _ffmpeg_encode_opus(pcm: PcmAudio) -> Optional[bytes]:
+    result = subprocess.run(
+        [FFMPEG, "-hide_banner", "-loglevel", "error",
+         "-f", "s16le", "-ac", "1", "-ar", str(pcm.sample_rate), "-i", "pipe:0",
+         "-c:a", "libopus", "-b:a", f"{settings.upload_bitrate_kbps}k", "-application", "voip",
+         "-f", "ogg", "pipe:1"],
+        input=pcm.data, capture_output=True, timeout=settings.transcode_timeout_seconds
+    )
+    if result.returncode != 0 or not result.stdout:
+        return None
+    return result.stdout
+
+
+class AudioIngestService:
+    """Runs the ingest stage off the event loop and measures upload size per turn"""
+
+    def __init__(self):
+        self.turns = 0
+        self.bytes_received = 0
+        self.bytes_uploaded = 0
+        self.processing_seconds = 0.0
+
+    async def prepare(self, audio_data: bytes, format: str = "wav") -> PreparedAudio:
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        try:
+            prepared = await loop.run_in_executor(audio_executor, prepare_audio, audio_data, format)
+        except Exception as e:
+            print(f"Audio ingest error: {e}")
+            prepared = PreparedAudio(audio_data, format)
+
+        self.turns += 1
+        self.bytes_received += len(audio_data)
+        self.bytes_uploaded += len(prepared.upload_data)
+        self.processing_seconds += time.perf_counter() - started
+        voice_activity.record(prepared.has_speech, prepared.trimmed_seconds)
+        return prepared
+
+    def stats(self) -> Dict:
+        return {
+            "turns": self.turns,
+            "codec": "opus" if settings.upload_codec == "opus" and FFMPEG else "wav",
+            "bytes_per_turn_before": self.bytes_received // self.turns if self.turns else 0,
+            "bytes_per_turn_after": self.bytes_uploaded // self.turns if self.turns else 0,
+            "processing_ms_per_turn": round(self.processing_seconds / self.turns * 1000, 1) if self.turns else 0.0,
+        }
+
+
+# Global service instance
+audio_ingest = AudioIngestService()
@@ -1,53 +1,218 @@
-from elevenlabs.client import ElevenLabs
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from collections import OrderedDict
 import asyncio
+import contextvars
+import time
 from ..core.config import settings
 from ..core.models import PersonaId
+from .provider_scheduler import elevenlabs_scheduler, Priority, is_rate_limit_error
+from .resilience import CircuitBreaker, CircuitOpenError, LatencyTracker, resilient_call
+from .usage import BudgetLevel, usage_meter
+from .persona_service import persona_service
+from ..core.metrics import observe_stage
+
+if TYPE_CHECKING:
+    from elevenlabs.client import ElevenLabs
+
+# ElevenLabs output formats offered to clients, with the MIME type to play them
+OUTPUT_FORMATS = {
+    "mp3_44100_128": "audio/mpeg",
+    "mp3_44100_64": "audio/mpeg",
+    "mp3_22050_32": "audio/mpeg",
+    "opus_48000_64": "audio/ogg; codecs=opus",
+    "opus_48000_32": "audio/ogg; codecs=opus",
+    "pcm_16000": "audio/L16; rate=16000",
+    "pcm_24000": "audio/L16; rate=24000",
+}
+
+# Short names clients may use instead of the full format string
+OUTPUT_FORMAT_ALIASES = {
+    "mp3": "mp3_44100_128",
+    "mp3-low": "mp3_22050_32",
+    "opus": "opus_48000_32",
+    "pcm": "pcm_16000",
+}
+
+
+def negotiate_output_format(requested: Optional[str]) -> str:
+    """Pick the first supported format from a comma-separated preference list"""
+    for candidate in (requested or "").split(","):
+        candidate = candidate.strip().lower()
+        candidate = OUTPUT_FORMAT_ALIASES.get(candidate, candidate)
+        if candidate in OUTPUT_FORMATS:
+            return candidate
+    return settings.tts_default_output_format
+
+
+class FormatStats:
+    """Size and latency of synthesized audio for one output format"""
+
+    def __init__(self):
+        self.requests = 0
+        self.cache_hits = 0
+        self.bytes = 0
+        self.characters = 0
+        self.latency_seconds = 0.0
+
+    def stats(self) -> Dict:
+        return {
+            "requests": self.requests,
+            "cache_hits": self.cache_hits,
+            "avg_bytes": self.bytes // self.requests if self.requests else 0,
+            "bytes_per_character": round(self.bytes / self.characters, 1) if self.characters else 0.0,
+            "avg_latency_ms": round(self.latency_seconds / self.requests * 1000, 1) if self.requests else 0.0,
+        }
 
 
 class ElevenLabsService:
     def __init__(self):
-        self.client = ElevenLabs(api_key=settings.elevenlabs_api_key)
+        self._client: Optional["ElevenLabs"] = None
+        self._loading: Optional[asyncio.Future] = None
         
-        # Map personas to ElevenLabs voice IDs
-        self.persona_voices = {
-            PersonaId.HR_FRIENDLY: "21m00Tcm4TlvDq8ikWAM",  # Rachel - warm female voice
-            PersonaId.MANAGER_CRITICAL: "8sZxD42zKDvoEXNxBTdX",  # Robert Martinez - authoritative male
-            PersonaId.TECH_EXPERT: "pNInz6obpgDQGcFmaJgB",  # Adam - clear male voice
-            PersonaId.STRESS_INTERVIEWER: "DMyrgzQFny3JI1Y1paM5",  # Marcus Thompson - intense male
-            PersonaId.CEO_EXECUTIVE: "TX3LPaxmHKxFdv7VOQHJ",  # Liam - professional male
-        }
+        # Health and latency tracking used for deadlines and hedging
+        self.breaker = CircuitBreaker(
+            "elevenlabs",
+            failure_threshold=settings.breaker_failure_threshold,
+            reset_timeout=settings.breaker_reset_seconds
+        )
+        self.tts_latency = LatencyTracker()
+        
+        # Recently synthesized audio, served when the provider is unavailable
+        self._audio_cache: "OrderedDict[Tuple[str, str, str], bytes]" = OrderedDict()
+        self.format_stats: Dict[str, FormatStats] = {}
+    
+    @property
+    def client(self) -> "ElevenLabs":
+        """API client, created on first use so importing the app doesn't load the SDK"""
+        if self._client is None:
+            if not settings.elevenlabs_api_key:
+                raise RuntimeError("ELEVENLABS_API_KEY is not set")
+            from elevenlabs.client import ElevenLabs
+            self._client = ElevenLabs(
+                api_key=settings.elevenlabs_api_key,
+                base_url=settings.elevenlabs_base_url
+            )
+        return self._client
+    
+    async def ensure_client(self) -> "ElevenLabs":
+        """API client for code on the event loop; the first import runs in a worker thread"""
+        if self._client is None:
+            if self._loading is None or self._loading.done():
+                # A failed load (e.g. no API key) is retried by the next caller
+                self._loading = asyncio.ensure_future(asyncio.to_thread(lambda: self.client))
+            await asyncio.shield(self._loading)
+        return self._client
     
-    async def text_to_speech(self, text: str, persona_id: PersonaId) -> bytes:
-        """Convert text to speech using ElevenLabs"""
+    async def text_to_speech(
+        self,
+        text: str,
+        persona_id: PersonaId,
+        priority: Priority = Priority.INTERACTIVE,
+        output_format: Optional[str] = None
+    ) -> bytes:
+        """Convert text to speech using ElevenLabs; returns b"" when the session's budget rules it out"""
+        output_format = output_format or settings.tts_default_output_format
+        format_stats = self.format_stats.setdefault(output_format, FormatStats())
+        budget_level = usage_meter.level()
+        if budget_level >= BudgetLevel.TEXT_ONLY:
+            usage_meter.count_downgrade(BudgetLevel.TEXT_ONLY)
+            return b""
+        
         try:
-            voice_id = self.persona_voices.get(persona_id, self.persona_voices[PersonaId.HR_FRIENDLY])
+            voice_id = self.get_persona_voice_id(persona_id)
             
-            # Use the correct API method
-            audio = self.client.text_to_speech.convert(
-                text=text,
-                voice_id=voice_id,
-                model_id="eleven_multilingual_v2",
-                output_format="mp3_44100_128"
-            )
+            cached = self._audio_cache.get((voice_id, output_format, text))
+            if cached:
+                self._audio_cache.move_to_end((voice_id, output_format, text))
+                format_stats.cache_hits += 1
+                usage_meter.record_tts(len(text), cached=True)
+                return cached
+            if budget_level >= BudgetLevel.CACHED_AUDIO:
+                usage_meter.count_downgrade(BudgetLevel.CACHED_AUDIO)
+                return b""
+            
+            client = await self.ensure_client()
+            loop = asyncio.get_running_loop()
             
-            # Convert generator/iterator to bytes if needed
-            if hasattr(audio, '__iter__') and not isinstance(audio, bytes):
-                audio_bytes = b"".join(audio)
-            else:
-                audio_bytes = audio
+            def convert() -> bytes:
+                # Use the correct API method
+                audio = client.text_to_speech.convert(
+                    text=text,
+                    voice_id=voice_id,
+                    model_id="eleven_multilingual_v2",
+                    output_format=output_format
+                )
                 
+                # Convert generator/iterator to bytes if needed
+                if hasattr(audio, '__iter__') and not isinstance(audio, bytes):
+                    chunks = []
+                    for chunk in audio:
+                        if not chunks and priority == Priority.INTERACTIVE:
+                            # Histograms are only touched on the loop, where /metrics renders them
+                            loop.call_soon_threadsafe(
+                                observe_stage, "tts_first_byte", time.monotonic() - started,
+                                context=contextvars.copy_context()
+                            )
+                        chunks.append(chunk)
+                    return b"".join(chunks)
+                return audio
+            
+            async def synthesize() -> bytes:
+                # The SDK client is synchronous; run it off the event loop, holding the slot until it
+                # returns. The latency is recorded on the loop, where hedging and admission read it.
+                return await elevenlabs_scheduler.run_sync(
+                    convert, priority, characters=len(text), latency=self.tts_latency
+                )
+            
+            started = time.monotonic()
+            audio_bytes = await resilient_call(
+                synthesize,
+                breaker=self.breaker,
+                latency=self.tts_latency,
+                deadline=settings.tts_deadline_seconds,
+                hedge=settings.hedge_requests,
+                hedge_min_delay=settings.hedge_min_delay_seconds
+            )
+            
+            format_stats.requests += 1
+            format_stats.bytes += len(audio_bytes)
+            format_stats.characters += len(text)
+            format_stats.latency_seconds += time.monotonic() - started
+            usage_meter.record_tts(len(text))
+            
+            self._cache_audio(voice_id, output_format, text, audio_bytes)
             return audio_bytes
         
+        except CircuitOpenError:
+            # Provider unhealthy - fall back to text-only
+            return b""
+        except asyncio.TimeoutError:
+            print(f"ElevenLabs TTS timeout after {settings.tts_deadline_seconds}s")
+            return b""
         except Exception as e:
+            if is_rate_limit_error(e):
+                elevenlabs_scheduler.backoff(settings.provider_backoff_seconds)
             print(f"ElevenLabs TTS error: {e}")
             # Return empty bytes on error
             return b""
     
+    def _cache_audio(self, voice_id: str, output_format: str, text: str, audio_bytes: bytes):
+        """Remember synthesized audio so repeated lines skip the provider"""
+        if not audio_bytes:
+            return
+        
+        key = (voice_id, output_format, text)
+        self._audio_cache[key] = audio_bytes
+        self._audio_cache.move_to_end(key)
+        while len(self._audio_cache) > settings.tts_cache_size:
+            self._audio_cache.popitem(last=False)
+    
     async def get_available_voices(self) -> List[Dict]:
         """Get list of available voices from ElevenLabs"""
         try:
-            voices = self.client.voices.get_all()
+            client = await self.ensure_client()
+            async with elevenlabs_scheduler.slot(Priority.BACKGROUND):
+                voices = await asyncio.to_thread(client.voices.get_all)
             
             voice_list = []
             for voice in voices.voices:
@@ -66,25 +231,32 @@ class ElevenLabsService:
     
     def get_persona_voice_id(self, persona_id: PersonaId) -> str:
         """Get voice ID for a specific persona"""
-        return self.persona_voices.get(persona_id, self.persona_voices[PersonaId.HR_FRIENDLY])
+        return persona_service.get_voice_id(persona_id)
     
     async def stream_text_to_speech(self, text: str, persona_id: PersonaId):
         """Stream text to speech for real-time applications"""
         try:
-            voice_id = self.persona_voices.get(persona_id, self.persona_voices[PersonaId.HR_FRIENDLY])
-            
-            # Generate streaming audio
-            audio_stream = self.client.text_to_speech.stream(
-                text=text,
-                voice_id=voice_id,
-                model_id="eleven_multilingual_v2"
-            )
+            voice_id = self.get_persona_voice_id(persona_id)
+            if usage_meter.level() >= BudgetLevel.CACHED_AUDIO:
+                return
+            usage_meter.record_tts(len(text))
+            client = await self.ensure_client()
             
-            for chunk in audio_stream:
-                if isinstance(chunk, bytes):
-                    yield chunk
+            async with elevenlabs_scheduler.slot(Priority.INTERACTIVE, characters=len(text)):
+                # Generate streaming audio
+                audio_stream = client.text_to_speech.stream(
+                    text=text,
+                    voice_id=voice_id,
+                    model_id="eleven_multilingual_v2"
+                )
+                
+                for chunk in audio_stream:
+                    if isinstance(chunk, bytes):
+                        yield chunk
         
         except Exception as e:
+            if is_rate_limit_error(e):
+                elevenlabs_scheduler.backoff(settings.provider_backoff_seconds)
             print(f"ElevenLabs streaming error: {e}")
             yield b""
 
@@ -0,0 +1,114 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+from ..core.models import InterviewSession, InterviewFeedback, FeedbackJobStatus, FeedbackJobResponse
+from ..core.config import settings
+from .openai_service import openai_service
+from .feedback_segments import feedback_segmenter
+from .provider_scheduler import openai_scheduler, is_rate_limit_error
+from .speech_metrics import speech_metrics
+
+
+class FeedbackJob:
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        self.status = FeedbackJobStatus.PENDING
+        self.feedback: Optional[InterviewFeedback] = None
+        self.error_message: Optional[str] = None
+        self.created_at = time.monotonic()
+        self.finished_at: Optional[float] = None
+        self.task: Optional[asyncio.Task] = None
+
+    def to_response(self) -> FeedbackJobResponse:
+        return FeedbackJobResponse(
+            session_id=self.session_id,
+            status=self.status,
+            feedback=self.feedback,
+            error_message=self.error_message
+        )
+
+
+class FeedbackJobManager:
+    """Runs feedback generation in the background, one job per session.
+
+    Submitting twice for the same session returns the existing job, so retried
+    stop requests share a single (expensive) feedback computation.
+    """
+
+    def __init__(self):
+        self._jobs: Dict[str, FeedbackJob] = {}
+        self._listeners: List[Callable[[FeedbackJob], Awaitable[None]]] = []
+
+    def add_listener(self, listener: Callable[[FeedbackJob], Awaitable[None]]):
+        """Register a coroutine called whenever a job finishes"""
+        self._listeners.append(listener)
+
+    def submit(self, session: InterviewSession) -> FeedbackJob:
+        """Start feedback generation for a session (idempotent; failed jobs are retried)"""
+        self._cleanup_expired()
+
+        job = self._jobs.get(session.session_id)
+        if job and job.status != FeedbackJobStatus.FAILED:
+            return job
+
+        job = FeedbackJob(session.session_id)
+        job.task = asyncio.create_task(self._run(job, session))
+        self._jobs[session.session_id] = job
+        return job
+
+    def get_job(self, session_id: str) -> Optional[FeedbackJob]:
+        """Get feedback job by session ID"""
+        return self._jobs.get(session_id)
+
+    async def _run(self, job: FeedbackJob, session: InterviewSession):
+        job.status = FeedbackJobStatus.RUNNING
+        try:
+            delivery = await speech_metrics.summary(session.session_id)
+            
+            if len(session.conversation_history) >= settings.feedback_chunked_min_messages:
+                # Map-reduce: most segments were already analyzed during the interview
+                analyses = await feedback_segmenter.collect(session)
+                job.feedback = await openai_service.request_feedback(
+                    session, segment_analyses=analyses, delivery_metrics=delivery
+                )
+            else:
+                feedback_segmenter.discard(session.session_id)
+                job.feedback = await openai_service.request_feedback(session, delivery_metrics=delivery)
+            
+            speech_metrics.discard(session.session_id)
+            job.status = FeedbackJobStatus.COMPLETED
+        except Exception as e:
+            # Provider errors fail the job rather than storing placeholder scores; the next stop retries it
+            if is_rate_limit_error(e):
+                openai_scheduler.backoff(settings.provider_backoff_seconds)
+            print(f"Feedback job error for {job.session_id}: {e}")
+            job.status = FeedbackJobStatus.FAILED
+            job.error_message = str(e)
+        finally:
+            job.finished_at = time.monotonic()
+
+        for listener in self._listeners:
+            try:
+                await listener(job)
+            except Exception as e:
+                print(f"Feedback listener error for {job.session_id}: {e}")
+
+    def _cleanup_expired(self):
+        """Drop finished jobs older than the configured TTL"""
+        now = time.monotonic()
+        expired = [
+            session_id for session_id, job in self._jobs.items()
+            if job.finished_at and now - job.finished_at > settings.feedback_job_ttl_seconds
+        ]
+        for session_id in expired:
+            del self._jobs[session_id]
+
+    def stats(self) -> Dict:
+        counts = {status.value: 0 for status in FeedbackJobStatus}
+        for job in self._jobs.values():
+            counts[job.status.value] += 1
+        return counts
+
+
+# Global feedback job manager instance
+feedback_jobs = FeedbackJobManager()
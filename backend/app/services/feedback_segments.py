@@ -0,0 +1,67 @@
+import asyncio
+from typing import Any, Dict, List
+from ..core.models import InterviewSession
+from ..core.config import settings
+from .openai_service import openai_service
+
+
+class FeedbackSegmenter:
+    """Map step of chunked feedback for long transcripts.
+
+    The conversation is split into fixed segments of `feedback_segment_messages`
+    messages. Each completed segment is analyzed in the background while the
+    interview is still running, so by the time the session is stopped only the
+    last partial segment and the final reduce call remain.
+    """
+
+    def __init__(self):
+        self._segments: Dict[str, Dict[int, asyncio.Task]] = {}
+        self._semaphore = asyncio.Semaphore(settings.feedback_segment_concurrency)
+
+    def observe(self, session: InterviewSession):
+        """Schedule analysis of any newly completed segments"""
+        if not settings.feedback_incremental:
+            return
+
+        # Short interviews use single-prompt feedback; don't spend tokens early
+        if len(session.conversation_history) < settings.feedback_chunked_min_messages:
+            return
+
+        size = settings.feedback_segment_messages
+        complete_segments = len(session.conversation_history) // size
+        for index in range(complete_segments):
+            self._schedule(session, index)
+
+    async def collect(self, session: InterviewSession) -> List[Dict[str, Any]]:
+        """Analyze all remaining segments and return every analysis in order"""
+        size = settings.feedback_segment_messages
+        total_segments = -(-len(session.conversation_history) // size)
+        for index in range(total_segments):
+            self._schedule(session, index)
+
+        tasks = self._segments.pop(session.session_id, {})
+        results = await asyncio.gather(*(tasks[i] for i in sorted(tasks)), return_exceptions=True)
+        return [r for r in results if isinstance(r, dict) and r]
+
+    def discard(self, session_id: str):
+        """Cancel outstanding analyses for a session"""
+        for task in self._segments.pop(session_id, {}).values():
+            task.cancel()
+
+    def _schedule(self, session: InterviewSession, index: int):
+        tasks = self._segments.setdefault(session.session_id, {})
+        if index in tasks:
+            return
+
+        size = settings.feedback_segment_messages
+        # Copy the slice - the history keeps growing while the task waits
+        messages = list(session.conversation_history[index * size:(index + 1) * size])
+        tasks[index] = asyncio.create_task(self._analyze(session, messages))
+
+    async def _analyze(self, session: InterviewSession, messages) -> Dict[str, Any]:
+        async with self._semaphore:
+            return await openai_service.analyze_segment(session, messages)
+
+
+# Global feedback segmenter instance
+feedback_segmenter = FeedbackSegmenter()
@@ -0,0 +1,87 @@
+import asyncio
+import contextvars
+from typing import Dict, List, Optional, Set, Tuple
+from ..core.config import settings
+from ..core.models import PersonaId
+from .elevenlabs_service import elevenlabs_service
+from .openai_service import openai_service
+from .persona_service import persona_service
+from .provider_scheduler import Priority
+
+
+class FillerAudioService:
+    """Pre-rendered backchannel clips that mask dead air while a reply is prepared.
+
+    Each persona's filler phrases are synthesized once per output format in the
+    background (when a voice connection opens) and kept here for the lifetime
+    of the process. Sending a filler only ever uses these local clips, so it
+    adds no provider calls to the turn itself.
+    """
+
+    def __init__(self):
+        self._clips: Dict[Tuple[PersonaId, str], List[Tuple[str, bytes]]] = {}
+        self._warming: Dict[Tuple[PersonaId, str], asyncio.Task] = {}
+        self._used: Dict[str, Set[str]] = {}
+        self.sent = 0
+        self.skipped = 0
+
+    def warm(self, persona_id: PersonaId, output_format: str):
+        """Start rendering a persona's fillers in the background (no-op if done or running)"""
+        key = (persona_id, output_format)
+        if not settings.filler_enabled or key in self._clips or key in self._warming:
+            return
+
+        # Fresh context: clips are shared across sessions, so the caller's session
+        # (bound for usage metering and budgets) must not carry over to the render
+        task = contextvars.Context().run(asyncio.create_task, self._render(persona_id, output_format))
+        self._warming[key] = task
+        task.add_done_callback(lambda _: self._warming.pop(key, None))
+
+    async def _render(self, persona_id: PersonaId, output_format: str):
+        clips = []
+        for phrase in persona_service.get_filler_phrases(persona_id):
+            audio = await elevenlabs_service.text_to_speech(
+                phrase, persona_id, priority=Priority.BACKGROUND, output_format=output_format
+            )
+            if audio:
+                clips.append((phrase, audio))
+
+        # Leave the key unset when nothing rendered so the next connection retries
+        if clips:
+            self._clips[(persona_id, output_format)] = clips
+
+    def projected_latency(self, include_transcription: bool = True) -> float:
+        """Expected seconds until interviewer audio, from recent median provider latencies"""
+        trackers = [openai_service.chat_latency, elevenlabs_service.tts_latency]
+        if include_transcription:
+            trackers.append(openai_service.transcription_latency)
+        return sum(tracker.percentile(50) or 0.0 for tracker in trackers)
+
+    def pick(self, session_id: str, persona_id: PersonaId, output_format: str) -> Optional[Tuple[str, bytes]]:
+        """Next unused clip for this session, or None if the pool is empty or exhausted"""
+        used = self._used.setdefault(session_id, set())
+        for phrase, audio in self._clips.get((persona_id, output_format), []):
+            if phrase not in used:
+                used.add(phrase)
+                self.sent += 1
+                return phrase, audio
+
+        self.skipped += 1
+        return None
+
+    def discard(self, session_id: str):
+        self._used.pop(session_id, None)
+
+    def stats(self) -> Dict:
+        return {
+            "enabled": settings.filler_enabled,
+            "threshold_ms": round(settings.filler_latency_threshold_seconds * 1000, 1),
+            "projected_ms": round(self.projected_latency() * 1000, 1),
+            "pools": len(self._clips),
+            "sent": self.sent,
+            "skipped": self.skipped,
+        }
+
+
+# Global service instance
+filler_audio = FillerAudioService()
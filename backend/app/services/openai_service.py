@@ -1,71 +1,268 @@
-import openai
-from typing import List, Dict, Any
-from ..core.models import InterviewSession, InterviewFeedback, ConversationMessage
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Sequence, Tuple
+from ..core.models import InterviewSession, InterviewFeedback, Turn
+from ..core.session_manager import format_duration
 from ..core.config import settings
+from .provider_scheduler import openai_scheduler, Priority, estimate_tokens, is_rate_limit_error
+from .resilience import CircuitBreaker, CircuitOpenError, LatencyTracker, resilient_call, timed
+from .usage import usage_meter
+from ..core.metrics import observe_stage
 import json
+import time
 import asyncio
 
+if TYPE_CHECKING:
+    import openai
+
+FEEDBACK_MAX_TOKENS = 500
+# Interviewer reply used when the LLM call fails
+FALLBACK_REPLY = "I apologize, but I'm experiencing some technical difficulties. Could you please repeat your response?"
+
 
 class OpenAIService:
     def __init__(self):
-        self.client = openai.AsyncOpenAI(api_key=settings.openai_api_key)
+        self._client: Optional["openai.AsyncOpenAI"] = None
+        self._loading: Optional[asyncio.Future] = None
+        
+        # Health and latency tracking used for deadlines and hedging
+        self.breaker = CircuitBreaker(
+            "openai",
+            failure_threshold=settings.breaker_failure_threshold,
+            reset_timeout=settings.breaker_reset_seconds
+        )
+        self.chat_latency = LatencyTracker()
+        self.transcription_latency = LatencyTracker()
+        self.feedback_latency = LatencyTracker()
+        self.draft_latency = LatencyTracker()  # Speculative drafts, kept apart from live replies
+    
+    @property
+    def client(self) -> "openai.AsyncOpenAI":
+        """API client, created on first use; importing `openai` is a large share of startup time"""
+        if self._client is None:
+            if not settings.openai_api_key:
+                raise RuntimeError("OPENAI_API_KEY is not set")
+            import openai
+            self._client = openai.AsyncOpenAI(
+                api_key=settings.openai_api_key,
+                base_url=settings.openai_base_url,
+                max_retries=settings.openai_max_retries  # Deadlines bound the total wait
+            )
+        return self._client
+    
+    async def ensure_client(self) -> "openai.AsyncOpenAI":
+        """API client for code on the event loop; the first import runs in a worker thread"""
+        if self._client is None:
+            if self._loading is None or self._loading.done():
+                # A failed load (e.g. no API key) is retried by the next caller
+                self._loading = asyncio.ensure_future(asyncio.to_thread(lambda: self.client))
+            await asyncio.shield(self._loading)
+        return self._client
     
     async def generate_interview_response(
         self, 
         system_prompt: str, 
-        conversation_history: List[ConversationMessage],
-        max_tokens: int = 150
+        conversation_history: Sequence[Turn],
+        max_tokens: int = 150,
+        priority: Priority = Priority.INTERACTIVE
     ) -> str:
         """Generate interviewer response using GPT-4"""
         try:
-            messages = [{"role": "system", "content": system_prompt}]
-            
-            # Add conversation history
-            for msg in conversation_history[-10:]:  # Keep last 10 messages for context
-                messages.append({
-                    "role": "assistant" if msg.role.value == "interviewer" else "user",
-                    "content": msg.content
-                })
-            
-            response = await self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=messages,
-                max_tokens=max_tokens,
-                temperature=0.7,
-                presence_penalty=0.6,
-                frequency_penalty=0.3
-            )
-            
-            return response.choices[0].message.content.strip()
+            reply, _ = await self._interview_completion(system_prompt, conversation_history, max_tokens, priority)
+            return reply
         
+        except CircuitOpenError:
+            return FALLBACK_REPLY
+        except asyncio.TimeoutError:
+            print(f"OpenAI API timeout after {settings.llm_deadline_seconds}s")
+            return FALLBACK_REPLY
         except Exception as e:
+            if is_rate_limit_error(e):
+                openai_scheduler.backoff(settings.provider_backoff_seconds)
             print(f"OpenAI API error: {e}")
-            return "I apologize, but I'm experiencing some technical difficulties. Could you please repeat your response?"
+            return FALLBACK_REPLY
+    
+    async def draft_interview_response(
+        self,
+        system_prompt: str,
+        conversation_history: Sequence[Turn],
+        max_tokens: int = 150
+    ) -> Tuple[str, int]:
+        """Speculative reply from a partial transcript; returns (reply, tokens used) and raises on failure.
+        
+        Drafts use `speculative_model` and their own latency tracker, so they
+        don't skew the chat p95 used for hedging or the p50 used for admission.
+        A draft cut off by its lower token cap is rejected rather than spoken.
+        """
+        return await self._interview_completion(
+            system_prompt,
+            conversation_history,
+            max_tokens,
+            Priority.BACKGROUND,
+            latency=self.draft_latency,
+            model=settings.speculative_model,
+            allow_truncated=False
+        )
+    
+    def build_chat_messages(self, system_prompt: str, conversation_history: Sequence[Turn]) -> List[Dict[str, str]]:
+        """Chat messages sent for an interviewer turn"""
+        messages = [{"role": "system", "content": system_prompt}]
+        
+        # Add conversation history
+        for msg in conversation_history[-10:]:  # Keep last 10 messages for context
+            messages.append({
+                "role": "assistant" if msg.role.value == "interviewer" else "user",
+                "content": msg.content
+            })
+        
+        return messages
+    
+    async def _interview_completion(
+        self,
+        system_prompt: str,
+        conversation_history: Sequence[Turn],
+        max_tokens: int,
+        priority: Priority,
+        latency: Optional[LatencyTracker] = None,
+        model: str = "gpt-4o-mini",
+        allow_truncated: bool = True
+    ) -> Tuple[str, int]:
+        latency = self.chat_latency if latency is None else latency
+        messages = self.build_chat_messages(system_prompt, conversation_history)
+        max_tokens = usage_meter.max_tokens(max_tokens)
+        prompt_tokens = sum(estimate_tokens(m["content"]) for m in messages)
+        estimated_tokens = prompt_tokens + max_tokens
+        started = time.perf_counter()
+        first_token_seen = False
+        
+        async def complete():
+            nonlocal first_token_seen
+            client = await self.ensure_client()
+            async with openai_scheduler.slot(priority, tokens=estimated_tokens):
+                with timed(latency):
+                    # Streamed so time-to-first-token can be measured; the reply is still used whole
+                    stream = await client.chat.completions.create(
+                        model=model,
+                        messages=messages,
+                        max_tokens=max_tokens,
+                        temperature=0.7,
+                        presence_penalty=0.6,
+                        frequency_penalty=0.3,
+                        stream=True,
+                        stream_options={"include_usage": True}
+                    )
+                    
+                    parts, usage, finish_reason = [], None, None
+                    async for chunk in stream:
+                        if chunk.choices and chunk.choices[0].delta.content:
+                            if not first_token_seen and priority == Priority.INTERACTIVE:
+                                first_token_seen = True
+                                observe_stage("llm_first_token", time.perf_counter() - started)
+                            parts.append(chunk.choices[0].delta.content)
+                        if chunk.choices and chunk.choices[0].finish_reason:
+                            finish_reason = chunk.choices[0].finish_reason
+                        if chunk.usage:
+                            usage = chunk.usage
+                    return "".join(parts), usage, finish_reason
+        
+        reply, usage, finish_reason = await resilient_call(
+            complete,
+            breaker=self.breaker,
+            latency=latency,
+            deadline=settings.llm_deadline_seconds,
+            hedge=settings.hedge_requests and priority == Priority.INTERACTIVE,
+            hedge_min_delay=settings.hedge_min_delay_seconds
+        )
+        
+        tokens_used = estimated_tokens
+        if usage:
+            openai_scheduler.adjust_tokens(estimated_tokens, usage.total_tokens)
+            tokens_used = usage.total_tokens
+            usage_meter.record_llm(usage.prompt_tokens, usage.completion_tokens)
+        else:
+            usage_meter.record_llm(prompt_tokens, estimate_tokens(reply))
+        
+        if finish_reason == "length" and not allow_truncated:
+            raise ValueError(f"Reply cut off at {max_tokens} tokens")
+        return reply.strip(), tokens_used
     
-    async def generate_feedback(self, session: InterviewSession) -> InterviewFeedback:
-        """Generate comprehensive interview feedback"""
+    async def generate_feedback(
+        self,
+        session: InterviewSession,
+        segment_analyses: Optional[List[Dict[str, Any]]] = None,
+        delivery_metrics: Optional[Dict[str, Any]] = None
+    ) -> InterviewFeedback:
+        """Generate comprehensive interview feedback
+        
+        With `segment_analyses` (map step output from analyze_segment) this is
+        the reduce step: the model merges the per-segment notes instead of
+        reading the whole transcript. `delivery_metrics` are measured from the
+        candidate's audio and ground the confidence score.
+        """
         try:
+            return await self.request_feedback(session, segment_analyses, delivery_metrics)
+        
+        except Exception as e:
+            if is_rate_limit_error(e):
+                openai_scheduler.backoff(settings.provider_backoff_seconds)
+            print(f"Feedback generation error: {e}")
+            # Return default feedback on error
+            return InterviewFeedback(
+                session_id=session.session_id,
+                scores={"confidence": 7.0, "clarity": 7.0, "overall_fit": 7.0},
+                improvements=[
+                    "Practice speaking more confidently during interviews",
+                    "Provide more specific examples when discussing experience",
+                    "Work on structuring responses more clearly"
+                ],
+                conversation_summary="Interview session completed. Continue practicing to improve your skills.",
+                duration=format_duration(session),
+                total_questions=session.question_count
+            )
+    
+    async def request_feedback(
+        self,
+        session: InterviewSession,
+        segment_analyses: Optional[List[Dict[str, Any]]] = None,
+        delivery_metrics: Optional[Dict[str, Any]] = None
+    ) -> InterviewFeedback:
+        """Like generate_feedback, but raises instead of returning default feedback"""
+        feedback_prompt = self.build_feedback_prompt(session, segment_analyses, delivery_metrics)
+        response = await self._complete_background(
+            feedback_prompt, max_tokens=FEEDBACK_MAX_TOKENS, latency=self.feedback_latency
+        )
+        return self.parse_feedback(session, response.choices[0].message.content)
+    
+    def build_feedback_prompt(
+        self,
+        session: InterviewSession,
+        segment_analyses: Optional[List[Dict[str, Any]]] = None,
+        delivery_metrics: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """The feedback rubric prompt; also used by the offline rescoring tool"""
+        if segment_analyses:
+            notes = "\n".join(
+                f"Segment {i + 1}: {json.dumps(analysis)}" for i, analysis in enumerate(segment_analyses)
+            )
+            conversation_section = f"Analyses of consecutive interview segments:\n{notes}"
+        else:
             # Prepare conversation context
-            conversation_text = ""
-            candidate_responses = []
-            
-            for msg in session.conversation_history:
-                if msg.role.value == "interviewer":
-                    conversation_text += f"Interviewer: {msg.content}\n"
-                else:
-                    conversation_text += f"Candidate: {msg.content}\n"
-                    candidate_responses.append(msg.content)
-            
-            # Create feedback prompt
-            feedback_prompt = f"""
+            conversation_section = f"Conversation:\n{self._format_conversation(session.conversation_history)}"
+        
+        if delivery_metrics:
+            conversation_section += (
+                "\n\nSpeech delivery measured from the candidate's audio "
+                "(typical: 120-160 words/min, filler ratio under 0.03):\n"
+                + json.dumps(delivery_metrics)
+            )
+        
+        # Create feedback prompt
+        return f"""
 You are an expert interview coach. Analyze this interview conversation and provide detailed feedback.
 
 Job Description: {session.config.job_description}
 Interview Type: {session.config.interview_type}
 Persona: {session.config.persona_id}
 
-Conversation:
-{conversation_text}
+{conversation_section}
 
 Please provide feedback in this exact JSON format:
 {{
@@ -81,81 +278,177 @@ Please provide feedback in this exact JSON format:
 }}
 
 Scoring criteria:
-- Confidence: Body language, tone, assertiveness, hesitation
+- Confidence: Body language, tone, assertiveness, hesitation (use the measured speech delivery when provided)
 - Clarity: Communication skills, structure, articulation
 - Overall_fit: Relevant experience, cultural alignment, role suitability
 
 Focus on actionable, specific feedback that will help the candidate improve.
 """
-            
-            response = await self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": feedback_prompt}],
-                max_tokens=500,
-                temperature=0.3
-            )
-            
-            # Parse JSON response
-            feedback_data = json.loads(response.choices[0].message.content.strip())
-            
-            from ..core.session_manager import session_manager
-            duration = session_manager.get_session_duration(session.session_id)
-            
-            return InterviewFeedback(
-                session_id=session.session_id,
-                scores=feedback_data["scores"] if "scores" in feedback_data else {
-                    "confidence": feedback_data.get("confidence", 7.0),
-                    "clarity": feedback_data.get("clarity", 7.0),
-                    "overall_fit": feedback_data.get("overall_fit", 7.0)
-                },
-                improvements=feedback_data.get("improvements", [
-                    "Practice speaking more confidently",
-                    "Provide more specific examples",
-                    "Improve technical communication"
-                ]),
-                conversation_summary=feedback_data.get("conversation_summary", "Interview completed successfully."),
-                duration=duration,
-                total_questions=session.question_count
+    
+    def parse_feedback(self, session: InterviewSession, content: str) -> InterviewFeedback:
+        """Build InterviewFeedback from the model's JSON reply; raises ValueError if it isn't JSON"""
+        return InterviewFeedback(
+            session_id=session.session_id,
+            duration=format_duration(session),
+            total_questions=session.question_count,
+            **self.feedback_fields(content)
+        )
+    
+    def feedback_fields(self, content: str) -> Dict[str, Any]:
+        """Scores, improvements and summary from the model's JSON reply"""
+        feedback_data = json.loads(content.strip())
+        
+        return {
+            "scores": feedback_data["scores"] if "scores" in feedback_data else {
+                "confidence": feedback_data.get("confidence", 7.0),
+                "clarity": feedback_data.get("clarity", 7.0),
+                "overall_fit": feedback_data.get("overall_fit", 7.0)
+            },
+            "improvements": feedback_data.get("improvements", [
+                "Practice speaking more confidently",
+                "Provide more specific examples",
+                "Improve technical communication"
+            ]),
+            "conversation_summary": feedback_data.get("conversation_summary", "Interview completed successfully."),
+        }
+    
+    async def analyze_segment(self, session: InterviewSession, messages: Sequence[Turn]) -> Dict[str, Any]:
+        """Map step of chunked feedback: short structured notes on one transcript segment"""
+        segment_prompt = f"""
+You are an expert interview coach. Assess the candidate in this excerpt of a {session.config.interview_type} interview.
+
+Job Description: {session.config.job_description}
+
+Excerpt:
+{self._format_conversation(messages)}
+
+Respond in this exact JSON format:
+{{
+    "confidence": <score 0-10>,
+    "clarity": <score 0-10>,
+    "overall_fit": <score 0-10>,
+    "strengths": ["..."],
+    "weaknesses": ["..."],
+    "key_points": "One or two sentences on what was discussed"
+}}
+"""
+        try:
+            response = await self._complete_background(
+                segment_prompt,
+                max_tokens=settings.feedback_segment_max_tokens,
+                latency=self.feedback_latency
             )
+            content = response.choices[0].message.content.strip()
+            try:
+                return json.loads(content)
+            except json.JSONDecodeError:
+                return {"key_points": content}
         
         except Exception as e:
-            print(f"Feedback generation error: {e}")
-            # Return default feedback on error
-            from ..core.session_manager import session_manager
-            duration = session_manager.get_session_duration(session.session_id)
-            
-            return InterviewFeedback(
-                session_id=session.session_id,
-                scores={"confidence": 7.0, "clarity": 7.0, "overall_fit": 7.0},
-                improvements=[
-                    "Practice speaking more confidently during interviews",
-                    "Provide more specific examples when discussing experience",
-                    "Work on structuring responses more clearly"
-                ],
-                conversation_summary="Interview session completed. Continue practicing to improve your skills.",
-                duration=duration,
-                total_questions=session.question_count
-            )
+            if is_rate_limit_error(e):
+                openai_scheduler.backoff(settings.provider_backoff_seconds)
+            print(f"Segment analysis error: {e}")
+            return {}
+    
+    async def _complete_background(self, prompt: str, max_tokens: int, latency: LatencyTracker):
+        """Single-prompt completion for feedback work; yields to interactive calls"""
+        estimated_tokens = estimate_tokens(prompt) + max_tokens
+        
+        async def complete():
+            client = await self.ensure_client()
+            async with openai_scheduler.slot(Priority.BACKGROUND, tokens=estimated_tokens):
+                with timed(latency):
+                    return await client.chat.completions.create(**self.background_request(prompt, max_tokens))
+        
+        # Never hedged - a duplicate feedback call is too expensive
+        response = await resilient_call(
+            complete,
+            breaker=self.breaker,
+            latency=latency,
+            deadline=settings.feedback_deadline_seconds
+        )
+        
+        if response.usage:
+            openai_scheduler.adjust_tokens(estimated_tokens, response.usage.total_tokens)
+            usage_meter.record_llm(response.usage.prompt_tokens, response.usage.completion_tokens)
+        else:
+            usage_meter.record_llm(estimated_tokens - max_tokens, max_tokens)
+        
+        return response
+    
+    def background_request(self, prompt: str, max_tokens: int) -> Dict[str, Any]:
+        """Chat completion parameters for feedback work, also written to provider batch files"""
+        return {
+            "model": "gpt-4o-mini",
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": max_tokens,
+            "temperature": 0.3
+        }
+    
+    def _format_conversation(self, messages: Sequence[Turn]) -> str:
+        """Render messages as an Interviewer/Candidate transcript"""
+        conversation_text = ""
+        for msg in messages:
+            if msg.role.value == "interviewer":
+                conversation_text += f"Interviewer: {msg.content}\n"
+            else:
+                conversation_text += f"Candidate: {msg.content}\n"
+        return conversation_text
     
     async def transcribe_audio(self, audio_data: bytes, format: str = "wav") -> str:
         """Transcribe audio using OpenAI Whisper"""
+        transcript, _ = await self.transcribe_audio_with_timings(audio_data, format)
+        return transcript
+    
+    async def transcribe_audio_with_timings(
+        self,
+        audio_data: bytes,
+        format: str = "wav"
+    ) -> Tuple[str, List[Dict[str, Any]]]:
+        """Transcribe audio and return word timings ({"word", "start", "end"}) alongside the text"""
         try:
-            # Create a temporary file-like object
-            import io
-            audio_file = io.BytesIO(audio_data)
-            audio_file.name = f"audio.{format}"
+            # Upload as a (filename, bytes) tuple so a hedged retry can resend it
+            filename = f"audio.{format}"
+            
+            async def transcribe():
+                client = await self.ensure_client()
+                async with openai_scheduler.slot(Priority.INTERACTIVE):
+                    with timed(self.transcription_latency):
+                        return await client.audio.transcriptions.create(
+                            model="whisper-1",
+                            file=(filename, audio_data),
+                            response_format="verbose_json",
+                            timestamp_granularities=["word"]
+                        )
             
-            transcript = await self.client.audio.transcriptions.create(
-                model="whisper-1",
-                file=audio_file,
-                response_format="text"
+            transcript = await resilient_call(
+                transcribe,
+                breaker=self.breaker,
+                latency=self.transcription_latency,
+                deadline=settings.transcription_deadline_seconds,
+                hedge=settings.hedge_requests,
+                hedge_min_delay=settings.hedge_min_delay_seconds
             )
             
-            return transcript.strip()
+            words = [
+                {"word": w.word, "start": w.start, "end": w.end}
+                for w in (transcript.words or [])
+            ]
+            # Whisper bills by audio length
+            duration = getattr(transcript, "duration", None) or (words[-1]["end"] if words else 0.0)
+            usage_meter.record_transcription(float(duration))
+            return transcript.text.strip(), words
         
+        except CircuitOpenError:
+            return "Sorry, I couldn't understand that. Could you please speak clearly?", []
+        except asyncio.TimeoutError:
+            print(f"Whisper transcription timeout after {settings.transcription_deadline_seconds}s")
+            return "Sorry, I couldn't understand that. Could you please speak clearly?", []
         except Exception as e:
+            if is_rate_limit_error(e):
+                openai_scheduler.backoff(settings.provider_backoff_seconds)
             print(f"Whisper transcription error: {e}")
-            return "Sorry, I couldn't understand that. Could you please speak clearly?"
+            return "Sorry, I couldn't understand that. Could you please speak clearly?", []
 
 
 # Global service instance
@@ -1,4 +1,3 @@
-import PyPDF2
 import io
 from typing import Optional
 import re
@@ -11,6 +10,9 @@ class PDFService:
     def extract_text_from_pdf(self, file_bytes: bytes) -> str:
         """Extract text from PDF bytes"""
         try:
+            # Imported here so only CV uploads pay for loading the PDF parser
+            import PyPDF2
+            
             # Create PDF reader from bytes
             pdf_file = io.BytesIO(file_bytes)
             pdf_reader = PyPDF2.PdfReader(pdf_file)
@@ -1,64 +1,127 @@
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+import hashlib
+import os
+import time
+from ..core.config import settings
 from ..core.models import PersonaId, InterviewType, InterviewSession, PersonaInfo
+from ..core.serialization import dumps_bytes, loads
+
+DEFAULT_PERSONAS_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "personas.json")
 
 
 class PersonaService:
-    def __init__(self):
-        self.personas = {
-            PersonaId.HR_FRIENDLY: {
-                "name": "Sarah Chen",
-                "description": "Warm and encouraging HR manager who focuses on getting to know you as a person. Creates a comfortable environment to discuss your background and motivations.",
-                "style": "Supportive and conversational",
-                "difficulty": "Easy",
-                "voice_id": "21m00Tcm4TlvDq8ikWAM"
-            },
-            PersonaId.MANAGER_CRITICAL: {
-                "name": "Robert Martinez", 
-                "description": "Experienced hiring manager with high standards. Asks challenging questions about your experience and expects detailed, well-thought-out responses.",
-                "style": "Direct and analytical",
-                "difficulty": "Hard",
-                "voice_id": "8sZxD42zKDvoEXNxBTdX"
-            },
-            PersonaId.TECH_EXPERT: {
-                "name": "Dr. Emily Watson",
-                "description": "Technical lead with deep expertise. Focuses on problem-solving abilities, technical knowledge, and how you approach complex challenges.",
-                "style": "Technical and precise", 
-                "difficulty": "Medium",
-                "voice_id": "pNInz6obpgDQGcFmaJgB"
-            },
-            PersonaId.STRESS_INTERVIEWER: {
-                "name": "Marcus Thompson",
-                "description": "Tests your performance under pressure with rapid-fire questions and challenging scenarios. Designed to see how you handle stress and think on your feet.",
-                "style": "Intense and fast-paced",
-                "difficulty": "Hard",
-                "voice_id": "DMyrgzQFny3JI1Y1paM5"
-            },
-            PersonaId.CEO_EXECUTIVE: {
-                "name": "James Wilson",
-                "description": "Senior executive who evaluates strategic thinking and leadership potential. Focuses on big-picture thinking and cultural fit at the executive level.",
-                "style": "Strategic and visionary",
-                "difficulty": "Medium", 
-                "voice_id": "TX3LPaxmHKxFdv7VOQHJ"
+    """Persona registry loaded from a JSON data file.
+
+    Everything that doesn't depend on the session (greetings, instructions per
+    interview type, the /api/personas body and its ETag) is built once per
+    load. The file is re-read when its mtime or size changes, checked at most
+    every `personas_reload_seconds`; a file that fails to load leaves the
+    previous registry in place.
+    
+    Sessions, metrics labels and per-persona settings use the PersonaId enum,
+    so the file can edit personas but a new id also needs a PersonaId member;
+    until then its entry is skipped with a warning and the rest still loads.
+    """
+    
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or DEFAULT_PERSONAS_FILE
+        self.personas: Dict[PersonaId, Dict] = {}
+        self.persona_info: List[PersonaInfo] = []
+        self.personas_json = b"[]"
+        self.etag = ""
+        self.reloads = 0
+        self._file_version: Optional[Tuple[int, int]] = None
+        self._checked_at = 0.0
+        self.load()
+    
+    def _version(self) -> Tuple[int, int]:
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+    
+    def load(self):
+        """(Re)build the registry from the data file; raises if the file is invalid"""
+        version = self._version()
+        with open(self.path, "rb") as f:
+            data = loads(f.read())
+        
+        personas = {}
+        for entry in data["personas"]:
+            try:
+                persona_id = PersonaId(entry["id"])
+            except ValueError:
+                print(f"Skipping persona {entry['id']!r} in {self.path}: not a known PersonaId")
+                continue
+            instructions = entry.get("instructions", {})
+            base = instructions.get("base", "")
+            personas[persona_id] = {
+                **entry,
+                "greeting": entry["greeting"].replace("{name}", entry["name"]),
+                "type_instructions": {
+                    interview_type: f"{base} {instructions.get(interview_type.value, '')}".strip()
+                    for interview_type in InterviewType
+                },
+                "fillers": entry.get("fillers", []),
             }
-        }
+        if PersonaId.HR_FRIENDLY not in personas:
+            raise ValueError(f"{self.path} must define the default persona {PersonaId.HR_FRIENDLY.value}")
+        
+        info = [
+            PersonaInfo(
+                id=persona_id,
+                name=persona["name"],
+                description=persona["description"],
+                style=persona["style"],
+                difficulty=persona["difficulty"],
+                voice_id=persona["voice_id"]
+            )
+            for persona_id, persona in personas.items()
+        ]
+        self.personas = personas
+        self.persona_info = info
+        self.personas_json = dumps_bytes(info)
+        self.etag = f'"{hashlib.sha256(self.personas_json).hexdigest()[:20]}"'
+        self._file_version = version
+        self.reloads += 1
+    
+    def _reload_if_changed(self):
+        if settings.personas_reload_seconds <= 0:
+            return
+        now = time.monotonic()
+        if now - self._checked_at < settings.personas_reload_seconds:
+            return
+        self._checked_at = now
+        try:
+            version = self._version()
+            if version == self._file_version:
+                return
+            self._file_version = version  # A broken file is only retried once it changes again
+            self.load()
+            print(f"Reloaded personas from {self.path}")
+        except Exception as e:
+            print(f"Failed to reload personas from {self.path}, keeping the previous set: {e}")
     
     def get_all_personas(self) -> List[PersonaInfo]:
         """Get all available personas"""
-        personas_list = []
-        for persona_id, data in self.personas.items():
-            personas_list.append(PersonaInfo(
-                id=persona_id,
-                name=data["name"],
-                description=data["description"],
-                style=data["style"],
-                difficulty=data["difficulty"],
-                voice_id=data["voice_id"]
-            ))
-        return personas_list
+        self._reload_if_changed()
+        return list(self.persona_info)
+    
+    def get_personas_response(self) -> Tuple[bytes, str]:
+        """Serialized /api/personas body and its ETag"""
+        self._reload_if_changed()
+        return self.personas_json, self.etag
     
     def get_persona_config(self, persona_id: PersonaId) -> Dict:
         """Get configuration for a specific persona"""
-        return self.personas.get(persona_id, self.personas[PersonaId.HR_FRIENDLY])
+        self._reload_if_changed()
+        return self.personas.get(persona_id) or self.personas[PersonaId.HR_FRIENDLY]
+    
+    def get_voice_id(self, persona_id: PersonaId) -> str:
+        """ElevenLabs voice for a persona"""
+        return self.get_persona_config(persona_id)["voice_id"]
+    
+    def get_filler_phrases(self, persona_id: PersonaId) -> List[str]:
+        """Short backchannel lines the persona can say while a reply is being prepared"""
+        return self.get_persona_config(persona_id)["fillers"]
     
     def build_system_prompt(self, session: InterviewSession) -> str:
         """Build dynamic system prompt for the interview"""
@@ -102,44 +165,7 @@ Current question count: {session.question_count}
     
     def _get_persona_instructions(self, persona_id: PersonaId, interview_type: InterviewType) -> str:
         """Get specific instructions for persona and interview type combination"""
-        instructions = {
-            PersonaId.HR_FRIENDLY: {
-                "base": "Be warm and encouraging. Focus on cultural fit, motivations, and personal experiences.",
-                InterviewType.FIRST_ROUND: "Start with icebreaker questions and basic background.",
-                InterviewType.CULTURAL_FIT: "Explore values, work style preferences, and team collaboration.",
-                InterviewType.SALARY_NEGOTIATION: "Be supportive but realistic about compensation discussions."
-            },
-            PersonaId.MANAGER_CRITICAL: {
-                "base": "Be direct and analytical. Challenge responses and dig deeper into specifics.",
-                InterviewType.TECHNICAL: "Focus on problem-solving methodology and technical depth.",
-                InterviewType.FINAL_ROUND: "Evaluate leadership potential and decision-making skills.",
-                InterviewType.GENERAL: "Ask challenging behavioral questions with follow-ups."
-            },
-            PersonaId.TECH_EXPERT: {
-                "base": "Focus on technical competency, problem-solving approach, and system design.",
-                InterviewType.TECHNICAL: "Ask detailed technical questions and coding problems.",
-                InterviewType.FIRST_ROUND: "Assess fundamental technical knowledge.",
-                InterviewType.GENERAL: "Balance technical and soft skills evaluation."
-            },
-            PersonaId.STRESS_INTERVIEWER: {
-                "base": "Create pressure through rapid-fire questions and challenging scenarios.",
-                InterviewType.TECHNICAL: "Present complex problems with time pressure.",
-                InterviewType.FINAL_ROUND: "Test decision-making under stress.",
-                InterviewType.GENERAL: "Use interruptions and follow-up questions to create pressure."
-            },
-            PersonaId.CEO_EXECUTIVE: {
-                "base": "Evaluate strategic thinking, leadership, and long-term vision.",
-                InterviewType.FINAL_ROUND: "Focus on executive presence and strategic decision-making.",
-                InterviewType.CULTURAL_FIT: "Assess alignment with company vision and values.",
-                InterviewType.GENERAL: "Explore big-picture thinking and industry insights."
-            }
-        }
-        
-        persona_instructions = instructions.get(persona_id, instructions[PersonaId.HR_FRIENDLY])
-        base_instruction = persona_instructions["base"]
-        specific_instruction = persona_instructions.get(interview_type, "")
-        
-        return f"{base_instruction} {specific_instruction}".strip()
+        return self.get_persona_config(persona_id)["type_instructions"][InterviewType(interview_type)]
     
     def _extract_cv_summary(self, cv_text: str) -> str:
         """Extract key information from CV text"""
@@ -162,18 +188,16 @@ Current question count: {session.question_count}
     
     def get_initial_greeting(self, session: InterviewSession) -> str:
         """Generate initial greeting based on persona"""
-        persona_config = self.get_persona_config(session.config.persona_id)
-        
-        greetings = {
-            PersonaId.HR_FRIENDLY: f"Hello! I'm {persona_config['name']}, and I'm excited to speak with you today. How are you feeling about this interview?",
-            PersonaId.MANAGER_CRITICAL: f"Good day. I'm {persona_config['name']}, the hiring manager for this position. Let's dive right in - tell me about your most relevant experience for this role.",
-            PersonaId.TECH_EXPERT: f"Hi there, I'm {persona_config['name']}. I'll be evaluating your technical skills today. Are you ready to discuss some challenging problems?",
-            PersonaId.STRESS_INTERVIEWER: f"I'm {persona_config['name']}. This will be a fast-paced interview - I hope you're prepared. What's your biggest weakness?",
-            PersonaId.CEO_EXECUTIVE: f"Welcome. I'm {persona_config['name']}, and I'm here to understand your strategic thinking. What's your vision for this industry in the next 5 years?"
+        return self.get_persona_config(session.config.persona_id)["greeting"]
+    
+    def stats(self) -> Dict:
+        return {
+            "path": self.path,
+            "personas": len(self.personas),
+            "etag": self.etag,
+            "reloads": self.reloads,
         }
-        
-        return greetings.get(session.config.persona_id, greetings[PersonaId.HR_FRIENDLY])
 
 
 # Global service instance  
-persona_service = PersonaService()
\ No newline at end of file
+persona_service = PersonaService(settings.personas_file)
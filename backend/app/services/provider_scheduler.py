@@ -0,0 +1,275 @@
+import asyncio
+import contextvars
+import functools
+import heapq
+import itertools
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import Callable, Dict, List, Optional, TypeVar
+from ..core.config import settings
+from .resilience import LatencyTracker
+
+T = TypeVar("T")
+
+
+class Priority(IntEnum):
+    INTERACTIVE = 0  # Live interview turns - a candidate is waiting
+    BACKGROUND = 1  # Feedback generation and other deferred work
+
+
+class TokenBucket:
+    """Token bucket refilled continuously up to a per-minute limit"""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    @property
+    def enabled(self) -> bool:
+        return self.capacity > 0
+
+    def _refill(self, now: float):
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated = now
+
+    def delay_for(self, amount: float, now: float) -> float:
+        """Seconds until `amount` tokens are available (0 if available now)"""
+        if not self.enabled or amount <= 0:
+            return 0.0
+        self._refill(now)
+        # A single request larger than the bucket waits for a full bucket
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def consume(self, amount: float, now: float):
+        if not self.enabled or amount <= 0:
+            return
+        self._refill(now)
+        self.tokens -= min(amount, self.capacity)
+
+    def refund(self, amount: float):
+        """Return (or, if negative, charge) tokens after the real cost is known"""
+        if not self.enabled:
+            return
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class _Waiter:
+    __slots__ = ("priority", "seq", "tokens", "characters", "future", "enqueued_at")
+
+    def __init__(self, priority: Priority, seq: int, tokens: int, characters: int, future: asyncio.Future):
+        self.priority = priority
+        self.seq = seq
+        self.tokens = tokens
+        self.characters = characters
+        self.future = future
+        self.enqueued_at = time.monotonic()
+
+    def __lt__(self, other: "_Waiter") -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class ProviderScheduler:
+    """Admission gate for calls to a single upstream provider.
+
+    Requests wait in a priority queue until a concurrency slot is free and the
+    requests/tokens/characters per-minute buckets allow them through. Interactive
+    work is always dispatched ahead of background work, and background work may
+    only use a share of the concurrency so live turns keep some headroom.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int,
+        requests_per_minute: float = 0,
+        tokens_per_minute: float = 0,
+        characters_per_minute: float = 0,
+        background_share: float = 0.5,
+    ):
+        self.name = name
+        self.max_concurrency = max(1, max_concurrency)
+        self.background_limit = max(1, int(self.max_concurrency * background_share))
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.characters = TokenBucket(characters_per_minute)
+
+        self._queue: List[_Waiter] = []
+        self._seq = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._paused_until = 0.0
+        self._in_flight: Dict[Priority, int] = {p: 0 for p in Priority}
+        self._granted: Dict[Priority, int] = {p: 0 for p in Priority}
+        self._wait_times: Dict[Priority, deque] = {p: deque(maxlen=500) for p in Priority}
+        self._rate_limited = 0
+
+    @asynccontextmanager
+    async def slot(self, priority: Priority = Priority.INTERACTIVE, tokens: int = 0, characters: int = 0):
+        """Hold a provider slot for the duration of the block"""
+        await self._acquire(priority, tokens, characters)
+        try:
+            yield
+        finally:
+            self._release(priority)
+
+    async def run_sync(
+        self,
+        func: Callable[[], T],
+        priority: Priority = Priority.INTERACTIVE,
+        tokens: int = 0,
+        characters: int = 0,
+        latency: Optional[LatencyTracker] = None
+    ) -> T:
+        """Run a blocking SDK call in a worker thread while holding a slot.
+
+        Cancelling the caller (a deadline, a losing hedge) can't stop the
+        thread, so the slot is only released once the thread returns; otherwise
+        abandoned calls would run beyond `max_concurrency` and tie up the
+        default executor. A successful call's run time, excluding the wait for
+        the slot, is recorded in `latency` from the event loop.
+        """
+        await self._acquire(priority, tokens, characters)
+        try:
+            context = contextvars.copy_context()
+            started = time.monotonic()
+            future = asyncio.get_running_loop().run_in_executor(None, functools.partial(context.run, func))
+        except BaseException:
+            self._release(priority)
+            raise
+
+        def finished(done: asyncio.Future):
+            self._release(priority)
+            if not done.cancelled() and done.exception() is None and latency is not None:
+                latency.record(time.monotonic() - started)
+
+        future.add_done_callback(finished)
+        return await asyncio.shield(future)
+
+    def adjust_tokens(self, estimated: int, actual: int):
+        """Correct the token bucket once the provider reports real usage"""
+        self.tokens.refund(estimated - actual)
+
+    def backoff(self, seconds: float):
+        """Pause dispatching after the provider answered 429"""
+        self._rate_limited += 1
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    async def _acquire(self, priority: Priority, tokens: int, characters: int):
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(priority, next(self._seq), tokens, characters, loop.create_future())
+        heapq.heappush(self._queue, waiter)
+        self._dispatch()
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            # Granted just before we were cancelled - give the slot back
+            if waiter.future.done() and not waiter.future.cancelled():
+                self._release(priority)
+            else:
+                waiter.future.cancel()
+                self._dispatch()
+            raise
+
+    def _release(self, priority: Priority):
+        self._in_flight[priority] -= 1
+        self._dispatch()
+
+    def _has_slot(self, priority: Priority) -> bool:
+        if sum(self._in_flight.values()) >= self.max_concurrency:
+            return False
+        if priority == Priority.BACKGROUND:
+            return self._in_flight[Priority.BACKGROUND] < self.background_limit
+        return True
+
+    def _dispatch(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        while self._queue:
+            waiter = self._queue[0]
+            if waiter.future.done():
+                heapq.heappop(self._queue)
+                continue
+
+            if not self._has_slot(waiter.priority):
+                return  # A release will dispatch again
+
+            now = time.monotonic()
+            delay = max(
+                self._paused_until - now,
+                self.requests.delay_for(1, now),
+                self.tokens.delay_for(waiter.tokens, now),
+                self.characters.delay_for(waiter.characters, now),
+            )
+            if delay > 0:
+                self._timer = asyncio.get_running_loop().call_later(delay, self._dispatch)
+                return
+
+            heapq.heappop(self._queue)
+            self.requests.consume(1, now)
+            self.tokens.consume(waiter.tokens, now)
+            self.characters.consume(waiter.characters, now)
+            self._in_flight[waiter.priority] += 1
+            self._granted[waiter.priority] += 1
+            self._wait_times[waiter.priority].append(now - waiter.enqueued_at)
+            waiter.future.set_result(None)
+
+    def stats(self) -> Dict:
+        """Queue depth, in-flight and wait-time metrics per priority lane"""
+        lanes = {}
+        for priority in Priority:
+            waits = sorted(self._wait_times[priority])
+            lanes[priority.name.lower()] = {
+                "queued": sum(1 for w in self._queue if w.priority == priority and not w.future.done()),
+                "in_flight": self._in_flight[priority],
+                "granted": self._granted[priority],
+                "wait_avg_ms": round(sum(waits) / len(waits) * 1000, 1) if waits else 0.0,
+                "wait_p95_ms": round(waits[min(len(waits) - 1, int(len(waits) * 0.95))] * 1000, 1) if waits else 0.0,
+                "wait_max_ms": round(waits[-1] * 1000, 1) if waits else 0.0,
+            }
+
+        return {
+            "provider": self.name,
+            "max_concurrency": self.max_concurrency,
+            "rate_limited": self._rate_limited,
+            "paused": self._paused_until > time.monotonic(),
+            "lanes": lanes,
+        }
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Whether a provider SDK exception is an HTTP 429"""
+    return getattr(error, "status_code", None) == 429
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token) for rate limiting"""
+    return len(text) // 4 + 1
+
+
+# Global scheduler instances
+openai_scheduler = ProviderScheduler(
+    "openai",
+    max_concurrency=settings.openai_max_concurrency,
+    requests_per_minute=settings.openai_requests_per_minute,
+    tokens_per_minute=settings.openai_tokens_per_minute,
+    background_share=settings.provider_background_share,
+)
+
+elevenlabs_scheduler = ProviderScheduler(
+    "elevenlabs",
+    max_concurrency=settings.elevenlabs_max_concurrency,
+    requests_per_minute=settings.elevenlabs_requests_per_minute,
+    characters_per_minute=settings.elevenlabs_characters_per_minute,
+    background_share=settings.provider_background_share,
+)
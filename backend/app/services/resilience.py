@@ -0,0 +1,174 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a provider whose circuit is open"""
+
+
+class LatencyTracker:
+    """Sliding window of recent call latencies (seconds)"""
+
+    def __init__(self, window: int = 200):
+        self._samples: deque = deque(maxlen=window)
+
+    def record(self, seconds: float):
+        self._samples.append(seconds)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+
+@contextmanager
+def timed(latency: LatencyTracker):
+    """Record how long the block took if it completes.
+
+    Wrap only the provider request, inside the scheduler slot, so queue wait
+    doesn't inflate the latencies used for hedging and admission. Use it on the
+    event loop only: trackers are read there and aren't thread-safe.
+    """
+    started = time.monotonic()
+    yield
+    latency.record(time.monotonic() - started)
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one provider.
+
+    After `failure_threshold` failures in a row the circuit opens and calls fail
+    fast. Once `reset_timeout` has passed a single trial call is let through
+    (half-open); its outcome closes or re-opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self.rejected = 0
+
+    def allow(self) -> bool:
+        """Whether a call may be attempted right now"""
+        if self.state == self.CLOSED:
+            return True
+
+        if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self.state = self.HALF_OPEN
+            self._trial_in_flight = False
+
+        if self.state == self.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+
+        self.rejected += 1
+        return False
+
+    def record_success(self):
+        self.state = self.CLOSED
+        self._failures = 0
+        self._trial_in_flight = False
+
+    def record_cancelled(self):
+        """The caller gave up; let another trial call through if half-open"""
+        self._trial_in_flight = False
+
+    def record_failure(self):
+        self._failures += 1
+        self._trial_in_flight = False
+        if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+
+    def stats(self) -> Dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "rejected": self.rejected,
+        }
+
+
+async def resilient_call(
+    call: Callable[[], Awaitable[T]],
+    breaker: CircuitBreaker,
+    latency: LatencyTracker,
+    deadline: float,
+    hedge: bool = False,
+    hedge_min_delay: float = 0.5,
+    hedge_min_samples: int = 20,
+) -> T:
+    """Run a provider call under a deadline and circuit breaker.
+
+    `call` is a zero-argument factory so the request can be issued twice: with
+    `hedge` enabled, a duplicate is started once the first attempt has taken
+    longer than the observed p95 latency, and whichever finishes first wins.
+    `call` records its own provider latency into `latency` (see `timed`).
+    Raises CircuitOpenError, asyncio.TimeoutError or the provider's exception.
+    """
+    if not breaker.allow():
+        raise CircuitOpenError(f"{breaker.name} circuit is open")
+
+    try:
+        result = await asyncio.wait_for(
+            _hedged(call, latency, hedge, hedge_min_delay, hedge_min_samples),
+            timeout=deadline
+        )
+    except asyncio.CancelledError:
+        breaker.record_cancelled()
+        raise
+    except Exception:
+        breaker.record_failure()
+        raise
+
+    breaker.record_success()
+    return result
+
+
+async def _hedged(
+    call: Callable[[], Awaitable[T]],
+    latency: LatencyTracker,
+    hedge: bool,
+    hedge_min_delay: float,
+    hedge_min_samples: int,
+) -> T:
+    p95 = latency.percentile(95)
+    if not hedge or p95 is None or len(latency) < hedge_min_samples:
+        return await call()
+
+    attempts = [asyncio.ensure_future(call())]
+    try:
+        done, _ = await asyncio.wait(attempts, timeout=max(p95, hedge_min_delay))
+        if not done:
+            attempts.append(asyncio.ensure_future(call()))
+
+        # First successful attempt wins; only fail once every attempt has failed
+        pending = set(attempts)
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in attempts:
+            if not task.done():
+                task.cancel()
@@ -0,0 +1,293 @@
+import random
+import re
+import time
+import zlib
+from collections import OrderedDict
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+from ..core.config import settings
+from ..core.models import InterviewSession, PersonaId
+from .openai_service import FALLBACK_REPLY
+from .usage import usage_meter
+
+NUM_PERM = 32  # MinHash signature length
+BAND_ROWS = 4  # Signature rows per LSH band; 8 bands find ~95% of pairs at 0.75 similarity
+_PRIME = (1 << 61) - 1
+# "I'm ready" and "I'm not ready" are similar strings with opposite answers
+NEGATIONS = frozenset({"no", "not", "never", "nope", "don't", "dont", "can't", "cant", "isn't", "won't", "haven't", "didn't"})
+
+Scope = Tuple[str, str, str, int, int, str]
+
+
+def normalize(text: str) -> str:
+    """Lowercase words without punctuation, single-spaced"""
+    return " ".join(re.findall(r"[a-z0-9']+", text.lower()))
+
+
+def shingles(text: str) -> FrozenSet[str]:
+    """Character trigrams of normalized text; short turns have too few words for word n-grams"""
+    padded = f" {text} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def negated(text: str) -> bool:
+    return not NEGATIONS.isdisjoint(text.split())
+
+
+def proper_nouns(text: str) -> Set[str]:
+    """Capitalized words: names, employers, schools"""
+    return set(re.findall(r"\b[A-Z][a-zA-Z]{2,}\b", text))
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+class MinHasher:
+    def __init__(self, num_perm: int = NUM_PERM, seed: int = 1):
+        rng = random.Random(seed)
+        self._params = [(rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(num_perm)]
+
+    def signature(self, grams: FrozenSet[str]) -> Tuple[int, ...]:
+        hashes = [zlib.crc32(gram.encode()) for gram in grams]
+        return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in self._params)
+
+
+class CachedResponse:
+    """An interviewer reply, and its audio per output format once synthesized"""
+
+    __slots__ = ("entry_id", "scope", "grams", "signature", "negated", "reply", "audio", "created_at", "hits")
+
+    def __init__(self, entry_id: int, probe: "Probe", reply: str):
+        self.entry_id = entry_id
+        self.scope = probe.scope
+        self.grams = probe.grams
+        self.signature = probe.signature
+        self.negated = probe.negated
+        self.reply = reply
+        self.audio: Dict[str, bytes] = {}
+        self.created_at = time.monotonic()
+        self.hits = 0
+
+    def audio_bytes(self) -> int:
+        return sum(len(audio) for audio in self.audio.values())
+
+
+class Probe:
+    """Result of looking up one candidate turn; pass it back to store the reply on a miss"""
+
+    __slots__ = ("scope", "grams", "signature", "negated", "entry", "hit", "similarity")
+
+    def __init__(self, scope: Scope, grams: FrozenSet[str], signature: Tuple[int, ...], negated: bool):
+        self.scope = scope
+        self.grams = grams
+        self.signature = signature
+        self.negated = negated
+        self.entry: Optional[CachedResponse] = None
+        self.hit = False
+        self.similarity = 0.0
+
+
+class CacheStats:
+    """Outcome counters for one persona"""
+
+    def __init__(self):
+        self.lookups = 0
+        self.hits = 0
+        self.audio_hits = 0
+        self.stored = 0
+        self.similarity_sum = 0.0
+
+    def stats(self) -> Dict:
+        return {
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "hit_rate": round(self.hits / self.lookups, 3) if self.lookups else 0.0,
+            "audio_hits": self.audio_hits,
+            "avg_hit_similarity": round(self.similarity_sum / self.hits, 3) if self.hits else 0.0,
+            "stored": self.stored,
+        }
+
+
+class ResponseCache:
+    """Reuses interviewer replies to near-identical short candidate turns.
+
+    Turns like "Can you repeat the question?" or "I'm ready" recur across
+    sessions, and each costs a full LLM and TTS round trip. A reply is only
+    reused within the same scope: tenant, persona, interview type and length,
+    question number and the interviewer message being answered. Within a
+    scope, candidate turns are matched on the Jaccard similarity of their
+    character trigrams, with candidates found through MinHash LSH buckets.
+    Replies that mention names or other proper nouns from the candidate's CV
+    are never stored, so one candidate's details aren't replayed to another.
+
+    Entries expire after `response_cache_ttl_seconds`, and the least recently
+    used are evicted beyond `response_cache_max_entries` or
+    `response_cache_max_audio_bytes`. Caching is opt-in
+    (`response_cache_enabled`) and can be limited to some personas, so
+    interviewers whose variety matters never repeat themselves.
+    """
+
+    def __init__(self):
+        self._hasher = MinHasher()
+        self._entries: "OrderedDict[int, CachedResponse]" = OrderedDict()
+        self._buckets: Dict[Tuple, Set[int]] = {}
+        self._next_id = 0
+        self._audio_bytes = 0
+        self._stats: Dict[PersonaId, CacheStats] = {}
+        self._expired_at = 0.0
+        self.evictions = 0
+        self.expirations = 0
+        self.personal_replies = 0  # Not stored because they mention the candidate's CV
+
+    def enabled_for(self, persona_id: PersonaId) -> bool:
+        if not settings.response_cache_enabled:
+            return False
+        personas = [p.strip() for p in settings.response_cache_personas.split(",") if p.strip()]
+        return not personas or persona_id.value in personas
+
+    def _scope(self, session: InterviewSession) -> Scope:
+        config = session.config
+        question = normalize(session.current_question or "")
+        return (
+            config.persona_id.value,
+            config.interview_type.value,
+            config.interview_length.value,
+            session.question_count,
+            zlib.crc32(question.encode()),
+            session.tenant or "",
+        )
+
+    def _band_keys(self, scope: Scope, signature: Tuple[int, ...]) -> List[Tuple]:
+        return [
+            (scope, start, signature[start:start + BAND_ROWS])
+            for start in range(0, len(signature), BAND_ROWS)
+        ]
+
+    def probe(self, session: InterviewSession, candidate_text: str) -> Optional[Probe]:
+        """Look up a candidate turn; None if caching doesn't apply to it.
+
+        Call before the interviewer's reply is added to the history.
+        """
+        if not self.enabled_for(session.config.persona_id):
+            return None
+        text = normalize(candidate_text)
+        if not text or len(text.split()) > settings.response_cache_max_words:
+            return None
+
+        self._expire()
+        grams = shingles(text)
+        probe = Probe(self._scope(session), grams, self._hasher.signature(grams), negated(text))
+        stats = self._persona_stats(session.config.persona_id)
+        stats.lookups += 1
+
+        candidates: Set[int] = set()
+        for key in self._band_keys(probe.scope, probe.signature):
+            candidates |= self._buckets.get(key, set())
+        for entry_id in candidates:
+            entry = self._entries[entry_id]
+            if entry.negated != probe.negated:
+                continue
+            similarity = jaccard(grams, entry.grams)
+            if similarity > probe.similarity:
+                probe.entry, probe.similarity = entry, similarity
+
+        if probe.entry and probe.similarity >= settings.response_cache_similarity:
+            probe.hit = True
+            probe.entry.hits += 1
+            self._entries.move_to_end(probe.entry.entry_id)
+            stats.hits += 1
+            stats.similarity_sum += probe.similarity
+        else:
+            probe.entry = None
+        return probe
+
+    def store(self, probe: Probe, reply: str, session: InterviewSession):
+        """Remember the reply generated after a miss, unless it is specific to this candidate"""
+        if probe.hit or not reply or reply == FALLBACK_REPLY:
+            return
+        if session.config.cv_text:
+            # Terms from the job description are shared by every candidate for it
+            personal = proper_nouns(session.config.cv_text) - proper_nouns(session.config.job_description)
+            if not personal.isdisjoint(proper_nouns(reply)):
+                self.personal_replies += 1
+                return
+        self._next_id += 1
+        entry = CachedResponse(self._next_id, probe, reply)
+        self._entries[entry.entry_id] = entry
+        for key in self._band_keys(entry.scope, entry.signature):
+            self._buckets.setdefault(key, set()).add(entry.entry_id)
+        probe.entry = entry
+        self._stats.setdefault(PersonaId(probe.scope[0]), CacheStats()).stored += 1
+        self._evict()
+
+    def audio_for(self, probe: Optional[Probe], output_format: str) -> Optional[bytes]:
+        """Cached audio for a hit in this format, if it was synthesized before"""
+        if probe is None or not probe.hit:
+            return None
+        audio = probe.entry.audio.get(output_format)
+        if audio:
+            self._stats[PersonaId(probe.scope[0])].audio_hits += 1
+            usage_meter.record_tts(len(probe.entry.reply), cached=True)
+        return audio
+
+    def store_audio(self, probe: Optional[Probe], output_format: str, audio: bytes):
+        if probe is None or probe.entry is None or not audio:
+            return
+        entry = probe.entry
+        if entry.entry_id not in self._entries or output_format in entry.audio:
+            return
+        entry.audio[output_format] = audio
+        self._audio_bytes += len(audio)
+        self._evict()
+
+    def _remove(self, entry: CachedResponse):
+        del self._entries[entry.entry_id]
+        self._audio_bytes -= entry.audio_bytes()
+        for key in self._band_keys(entry.scope, entry.signature):
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.discard(entry.entry_id)
+                if not bucket:
+                    del self._buckets[key]
+
+    def _expire(self):
+        """Drop entries past their TTL; hits reorder entries, so this scans them all, once a second at most"""
+        now = time.monotonic()
+        if now - self._expired_at < 1.0:
+            return
+        self._expired_at = now
+        cutoff = now - settings.response_cache_ttl_seconds
+        for entry in [e for e in self._entries.values() if e.created_at < cutoff]:
+            self._remove(entry)
+            self.expirations += 1
+
+    def _evict(self):
+        while self._entries and (
+            len(self._entries) > settings.response_cache_max_entries
+            or self._audio_bytes > settings.response_cache_max_audio_bytes
+        ):
+            self._remove(next(iter(self._entries.values())))
+            self.evictions += 1
+
+    def _persona_stats(self, persona_id: PersonaId) -> CacheStats:
+        return self._stats.setdefault(persona_id, CacheStats())
+
+    def stats(self) -> Dict:
+        lookups = sum(s.lookups for s in self._stats.values())
+        hits = sum(s.hits for s in self._stats.values())
+        return {
+            "enabled": settings.response_cache_enabled,
+            "entries": len(self._entries),
+            "audio_bytes": self._audio_bytes,
+            "lookups": lookups,
+            "hits": hits,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "personal_replies": self.personal_replies,
+            "personas": {persona.value: s.stats() for persona, s in self._stats.items()},
+        }
+
+
+# Global response cache instance
+response_cache = ResponseCache()
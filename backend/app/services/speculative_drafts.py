@@ -0,0 +1,162 @@
+import asyncio
+import re
+import time
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional
+from ..core.models import ConversationRole, InterviewSession, PersonaId, Turn
+from ..core.config import settings
+from .openai_service import openai_service
+from .persona_service import persona_service
+from .provider_scheduler import estimate_tokens
+
+
+def transcript_similarity(a: str, b: str) -> float:
+    """Word-level similarity ratio (0-1), ignoring case and punctuation"""
+    words_a = re.findall(r"[a-z0-9']+", a.lower())
+    words_b = re.findall(r"[a-z0-9']+", b.lower())
+    if not words_a and not words_b:
+        return 1.0
+    return SequenceMatcher(None, words_a, words_b, autojunk=False).ratio()
+
+
+class Draft:
+    """A speculative interviewer reply started from a partial transcript"""
+
+    def __init__(self, partial: str, history_length: int, task: asyncio.Task, estimated_tokens: int):
+        self.partial = partial
+        self.history_length = history_length
+        self.task = task
+        self.estimated_tokens = estimated_tokens
+        self.started_at = time.monotonic()
+        self.finished_at: Optional[float] = None
+
+    def tokens_used(self) -> int:
+        """Actual tokens if the draft finished, otherwise the estimate"""
+        if self.task.done() and not self.task.cancelled() and self.task.exception() is None:
+            return self.task.result()[1]
+        return self.estimated_tokens
+
+
+class DraftStats:
+    """Outcome counters for one persona"""
+
+    def __init__(self):
+        self.drafts = 0
+        self.hits = 0
+        self.misses = 0
+        self.saved_seconds = 0.0
+        self.wasted_tokens = 0
+
+    def stats(self) -> Dict:
+        decided = self.hits + self.misses
+        return {
+            "drafts": self.drafts,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / decided, 3) if decided else 0.0,
+            "avg_saved_ms": round(self.saved_seconds / self.hits * 1000, 1) if self.hits else 0.0,
+            "wasted_tokens": self.wasted_tokens,
+        }
+
+
+class SpeculativeDrafter:
+    """Drafts the next interviewer reply while the candidate is still speaking.
+
+    Each `partial_transcript` from the client may start a background draft. A
+    new draft only replaces the current one once the partial has drifted below
+    `speculative_similarity_threshold`, which bounds the number of redrafts.
+    When the final transcript arrives the draft is used if it still matches;
+    otherwise it is cancelled and its tokens are counted as wasted.
+    """
+
+    def __init__(self):
+        self._drafts: Dict[str, Draft] = {}
+        self._stats: Dict[PersonaId, DraftStats] = {}
+
+    def enabled_for(self, persona_id: PersonaId) -> bool:
+        if not settings.speculative_drafts:
+            return False
+        personas = [p.strip() for p in settings.speculative_personas.split(",") if p.strip()]
+        return not personas or persona_id.value in personas
+
+    def on_partial(self, session: InterviewSession, partial: str):
+        """Start or refresh the draft for a session from the latest partial transcript"""
+        if not self.enabled_for(session.config.persona_id):
+            return
+        if len(partial.split()) < settings.speculative_min_words:
+            return
+
+        current = self._drafts.get(session.session_id)
+        if current and current.history_length == len(session.conversation_history):
+            if transcript_similarity(current.partial, partial) >= settings.speculative_similarity_threshold:
+                return  # The running draft still fits
+        if current:
+            self._discard(session, current)
+
+        history = session.conversation_history[-9:] + [Turn(ConversationRole.CANDIDATE, partial)]
+        system_prompt = persona_service.build_system_prompt(session)
+        task = asyncio.create_task(openai_service.draft_interview_response(system_prompt, history, max_tokens=settings.speculative_max_tokens))
+        estimated = sum(estimate_tokens(m.content) for m in history[-10:]) + estimate_tokens(system_prompt)
+        draft = Draft(partial, len(session.conversation_history), task, estimated)
+        task.add_done_callback(lambda _: setattr(draft, "finished_at", time.monotonic()))
+
+        self._drafts[session.session_id] = draft
+        self._persona_stats(session).drafts += 1
+
+    async def take(self, session: InterviewSession, final_transcript: str) -> Optional[str]:
+        """Use the pending draft for the final transcript if it still matches, else discard it.
+
+        Must be called before the candidate's message is added to the history.
+        """
+        draft = self._drafts.pop(session.session_id, None)
+        if draft is None:
+            return None
+
+        stats = self._persona_stats(session)
+        matches = (
+            draft.history_length == len(session.conversation_history)
+            and transcript_similarity(draft.partial, final_transcript) >= settings.speculative_similarity_threshold
+        )
+        if not matches:
+            self._discard(session, draft)
+            return None
+
+        # Latency saved is however long the draft had already been running
+        saved = (draft.finished_at or time.monotonic()) - draft.started_at
+        try:
+            reply, _ = await draft.task
+        except Exception as e:
+            print(f"Speculative draft failed for {session.session_id}: {e}")
+            stats.misses += 1
+            stats.wasted_tokens += draft.estimated_tokens
+            return None
+
+        stats.hits += 1
+        stats.saved_seconds += saved
+        return reply
+
+    def discard(self, session: InterviewSession):
+        """Drop any pending draft, e.g. when the voice connection closes"""
+        draft = self._drafts.pop(session.session_id, None)
+        if draft:
+            self._discard(session, draft)
+
+    def _discard(self, session: InterviewSession, draft: Draft):
+        stats = self._persona_stats(session)
+        stats.misses += 1
+        stats.wasted_tokens += draft.tokens_used()
+        draft.task.cancel()
+
+    def _persona_stats(self, session: InterviewSession) -> DraftStats:
+        return self._stats.setdefault(session.config.persona_id, DraftStats())
+
+    def stats(self) -> Dict:
+        return {
+            "enabled": settings.speculative_drafts,
+            "pending": len(self._drafts),
+            "personas": {persona.value: s.stats() for persona, s in self._stats.items()},
+        }
+
+
+# Global drafter instance
+speculative_drafts = SpeculativeDrafter()
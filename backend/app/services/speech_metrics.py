@@ -0,0 +1,188 @@
+import asyncio
+import re
+import time
+from typing import Any, Dict, List, Optional, Set
+import numpy as np
+from ..utils.audio import FRAME_SECONDS, PcmAudio, audio_executor, frame_energy_db
+
+MIN_PAUSE_SECONDS = 0.25  # Shorter gaps are normal articulation
+PAUSE_BUCKETS = [MIN_PAUSE_SECONDS, 0.5, 1.0, 2.0, float("inf")]
+
+# True disfluencies; content words like "actually" or "basically" are not counted
+FILLER_WORDS = {"um", "umm", "uh", "uhh", "erm", "er", "ah", "hmm", "mm"}
+# Also ordinary words ("I'd like to", "do you know"), so only counted when set off by a comma
+DISCOURSE_MARKERS = {("like",), ("you", "know"), ("i", "mean")}
+
+
+def _silent_runs(voiced: np.ndarray) -> np.ndarray:
+    """Lengths (in frames) of unvoiced runs that sit between voiced frames"""
+    if not voiced.any():
+        return np.empty(0, dtype=np.int64)
+
+    first, last = np.flatnonzero(voiced)[[0, -1]]
+    inner = voiced[first:last + 1].astype(np.int8)
+    edges = np.diff(inner)
+    starts = np.flatnonzero(edges == -1) + 1
+    ends = np.flatnonzero(edges == 1) + 1
+    return ends - starts
+
+
+def _normalize_words(words: List[str]) -> List[str]:
+    return [w for w in (re.sub(r"[^a-z']", "", word.lower()) for word in words) if w]
+
+
+def count_fillers(words: List[str]) -> int:
+    raw = [word for word in words if re.sub(r"[^a-zA-Z']", "", word)]
+    tokens = _normalize_words(raw)
+    fillers = sum(1 for token in tokens if token in FILLER_WORDS)
+    for marker in DISCOURSE_MARKERS:
+        size = len(marker)
+        for i in range(len(tokens) - size + 1):
+            if tuple(tokens[i:i + size]) != marker:
+                continue
+            # "It was, like, huge" or "You know, I..." but not "I'd like to"
+            if (i > 0 and raw[i - 1].endswith(",")) or raw[i + size - 1].endswith(","):
+                fillers += 1
+    return fillers
+
+
+def analyze_delivery(
+    samples: Optional[np.ndarray],
+    sample_rate: int,
+    transcript: str,
+    word_timings: Optional[List[Dict[str, Any]]] = None
+) -> Dict[str, Any]:
+    """Speaking rate, pauses, energy variance and filler ratio for one clip"""
+    word_timings = word_timings or []
+    words = [w["word"] for w in word_timings] if word_timings else transcript.split()
+
+    energy_db = np.empty(0, dtype=np.float32)
+    voiced = np.empty(0, dtype=bool)
+    duration = 0.0
+    if samples is not None and len(samples):
+        duration = len(samples) / sample_rate
+        energy_db = frame_energy_db(samples, sample_rate)
+        if len(energy_db):
+            # Adaptive threshold: 10 dB over the clip's noise floor
+            threshold = max(float(np.percentile(energy_db, 10)) + 10.0, -60.0)
+            voiced = energy_db > threshold
+
+    voiced_db = energy_db[voiced] if len(voiced) else energy_db
+
+    if word_timings:
+        starts = np.fromiter((w["start"] for w in word_timings), dtype=np.float64, count=len(word_timings))
+        ends = np.fromiter((w["end"] for w in word_timings), dtype=np.float64, count=len(word_timings))
+        speaking_seconds = float(ends[-1] - starts[0])
+        gaps = starts[1:] - ends[:-1]
+        pauses = gaps[gaps >= MIN_PAUSE_SECONDS]
+    else:
+        speaking_seconds = float(voiced.sum()) * FRAME_SECONDS
+        pauses = _silent_runs(voiced) * FRAME_SECONDS
+        pauses = pauses[pauses >= MIN_PAUSE_SECONDS]
+
+    return {
+        "audio_seconds": duration,
+        "speaking_seconds": speaking_seconds,
+        "words": len(words),
+        # The transcript keeps the punctuation that word timings drop
+        "fillers": count_fillers(transcript.split() if transcript else words),
+        "pause_histogram": np.histogram(pauses, bins=PAUSE_BUCKETS)[0].tolist(),
+        "pause_total_seconds": float(pauses.sum()),
+        "energy_count": int(len(voiced_db)),
+        "energy_mean_db": float(voiced_db.mean()) if len(voiced_db) else 0.0,
+        "energy_m2": float(np.square(voiced_db - voiced_db.mean()).sum()) if len(voiced_db) else 0.0,
+    }
+
+
+class SessionDeliveryStats:
+    """Running aggregates of delivery metrics over a session's clips"""
+
+    def __init__(self):
+        self.clips = 0
+        self.audio_seconds = 0.0
+        self.speaking_seconds = 0.0
+        self.words = 0
+        self.fillers = 0
+        self.pause_histogram = [0] * (len(PAUSE_BUCKETS) - 1)
+        self.pause_total_seconds = 0.0
+        self.energy_count = 0
+        self.energy_mean_db = 0.0
+        self.energy_m2 = 0.0
+        self.processing_seconds = 0.0
+
+    def add(self, clip: Dict[str, Any], processing_seconds: float):
+        self.clips += 1
+        self.audio_seconds += clip["audio_seconds"]
+        self.speaking_seconds += clip["speaking_seconds"]
+        self.words += clip["words"]
+        self.fillers += clip["fillers"]
+        self.pause_histogram = [a + b for a, b in zip(self.pause_histogram, clip["pause_histogram"])]
+        self.pause_total_seconds += clip["pause_total_seconds"]
+        self.processing_seconds += processing_seconds
+
+        # Merge energy variance across clips (Chan et al. parallel update)
+        count = clip["energy_count"]
+        if count:
+            total = self.energy_count + count
+            delta = clip["energy_mean_db"] - self.energy_mean_db
+            self.energy_mean_db += delta * count / total
+            self.energy_m2 += clip["energy_m2"] + delta * delta * self.energy_count * count / total
+            self.energy_count = total
+
+    def summary(self) -> Dict[str, Any]:
+        pauses = sum(self.pause_histogram)
+        return {
+            "clips": self.clips,
+            "words_per_minute": round(self.words / (self.speaking_seconds / 60), 1) if self.speaking_seconds else 0.0,
+            "filler_ratio": round(self.fillers / self.words, 3) if self.words else 0.0,
+            "pauses_per_minute": round(pauses / (self.speaking_seconds / 60), 1) if self.speaking_seconds else 0.0,
+            "mean_pause_seconds": round(self.pause_total_seconds / pauses, 2) if pauses else 0.0,
+            "long_pauses": sum(self.pause_histogram[2:]),  # 1s and longer
+            "energy_std_db": round(float(np.sqrt(self.energy_m2 / self.energy_count)), 2) if self.energy_count else 0.0,
+        }
+
+
+class SpeechMetricsService:
+    """Computes delivery metrics off the event loop and keeps per-session aggregates"""
+
+    def __init__(self):
+        self._sessions: Dict[str, SessionDeliveryStats] = {}
+        self._pending: Dict[str, Set[asyncio.Task]] = {}
+
+    def submit(self, session_id: str, pcm: PcmAudio, transcript: str, word_timings: List[Dict[str, Any]]):
+        """Analyze a clip in the background without delaying the turn"""
+        task = asyncio.create_task(self.analyze(session_id, pcm, transcript, word_timings))
+        pending = self._pending.setdefault(session_id, set())
+        pending.add(task)
+        task.add_done_callback(pending.discard)
+
+    async def analyze(self, session_id: str, pcm: PcmAudio, transcript: str, word_timings: List[Dict[str, Any]]):
+        loop = asyncio.get_running_loop()
+        try:
+            started = time.perf_counter()
+            clip = await loop.run_in_executor(audio_executor, _analyze_clip, pcm, transcript, word_timings)
+            elapsed = time.perf_counter() - started
+            self._sessions.setdefault(session_id, SessionDeliveryStats()).add(clip, elapsed)
+        except Exception as e:
+            print(f"Speech metrics error for {session_id}: {e}")
+
+    async def summary(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Aggregated delivery metrics, waiting for clips still being analyzed"""
+        pending = self._pending.get(session_id)
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        stats = self._sessions.get(session_id)
+        return stats.summary() if stats and stats.clips else None
+
+    def discard(self, session_id: str):
+        self._sessions.pop(session_id, None)
+        self._pending.pop(session_id, None)
+
+
+def _analyze_clip(pcm: PcmAudio, transcript: str, word_timings: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return analyze_delivery(pcm.as_float(), pcm.sample_rate, transcript, word_timings)
+
+
+# Global service instance
+speech_metrics = SpeechMetricsService()
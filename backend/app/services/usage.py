@@ -0,0 +1,157 @@
+import time
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Dict, Optional
+from ..core.config import settings
+from ..core.models import InterviewSession, Usage
+
+
+class BudgetLevel(IntEnum):
+    """How far a session has been downgraded to stay within its budget"""
+    NORMAL = 0
+    REDUCED_TOKENS = 1  # Shorter interviewer replies
+    CACHED_AUDIO = 2  # Only previously synthesized audio is played
+    TEXT_ONLY = 3  # No speech synthesis
+
+
+# Session that provider calls in the current task are billed to
+_current_session: ContextVar[Optional[InterviewSession]] = ContextVar("usage_session", default=None)
+
+
+class UsageMeter:
+    """Meters LLM tokens, Whisper seconds and TTS characters per session and per tenant.
+
+    OpenAIService and ElevenLabsService record every call against the session
+    bound to the current context (see `bind`); tasks started from that context,
+    such as feedback jobs and speculative drafts, inherit it. Hedged duplicate
+    requests that lose the race are not metered.
+
+    A session's usage is kept on the session itself, so it is dropped with the
+    session and survives a drain hand-off in its snapshot. Tenant usage is
+    counted per `tenant_budget_period_seconds` window; every tenant's usage
+    resets when a window ends (never, if the period is 0).
+
+    A session's cost against `session_budget_usd` (and its tenant's against
+    `tenant_budget_usd`) sets its BudgetLevel, which the services use to cut
+    `max_tokens`, serve only cached audio, or skip synthesis.
+    """
+
+    def __init__(self):
+        self.total = Usage()
+        self._tenants: Dict[str, Usage] = {}
+        self._period_started = time.monotonic()
+        self.downgrades: Dict[str, int] = {level.name.lower(): 0 for level in BudgetLevel if level}
+
+    def bind(self, session: InterviewSession):
+        """Bill provider calls made from the current context to this session"""
+        _current_session.set(session)
+
+    def record_llm(self, input_tokens: int, output_tokens: int):
+        cost = (
+            input_tokens * settings.price_llm_input_per_million_tokens
+            + output_tokens * settings.price_llm_output_per_million_tokens
+        ) / 1_000_000
+        for usage in self._targets():
+            usage.input_tokens += input_tokens
+            usage.output_tokens += output_tokens
+            usage.cost_usd += cost
+
+    def record_transcription(self, seconds: float):
+        cost = seconds / 60 * settings.price_whisper_per_minute
+        for usage in self._targets():
+            usage.whisper_seconds += seconds
+            usage.cost_usd += cost
+
+    def record_tts(self, characters: int, cached: bool = False):
+        cost = 0.0 if cached else characters / 1000 * settings.price_tts_per_thousand_characters
+        for usage in self._targets():
+            if cached:
+                usage.cached_tts_characters += characters
+            else:
+                usage.tts_characters += characters
+            usage.cost_usd += cost
+
+    def _targets(self):
+        yield self.total
+        session = _current_session.get()
+        if session is not None:
+            yield session.usage
+            yield self._tenants.setdefault(session.tenant or "unknown", Usage())
+
+    def _roll_period(self):
+        """Start a new tenant budget window once the current one has ended"""
+        period = settings.tenant_budget_period_seconds
+        if period > 0 and time.monotonic() - self._period_started >= period:
+            self._tenants.clear()
+            self._period_started = time.monotonic()
+
+    def period_remaining(self) -> Optional[float]:
+        """Seconds until tenant usage resets, or None if it never does"""
+        if settings.tenant_budget_period_seconds <= 0:
+            return None
+        return max(0.0, settings.tenant_budget_period_seconds - (time.monotonic() - self._period_started))
+
+    def _budget_used(self, session: InterviewSession) -> float:
+        """Largest fraction used of the session's and its tenant's budgets"""
+        used = 0.0
+        if settings.session_budget_usd > 0:
+            used = session.usage.cost_usd / settings.session_budget_usd
+        if settings.tenant_budget_usd > 0:
+            self._roll_period()
+            usage = self._tenants.get(session.tenant or "unknown")
+            if usage:
+                used = max(used, usage.cost_usd / settings.tenant_budget_usd)
+        return used
+
+    def level(self, session: Optional[InterviewSession] = None) -> BudgetLevel:
+        session = session or _current_session.get()
+        if session is None:
+            return BudgetLevel.NORMAL
+        used = self._budget_used(session)
+        if used >= settings.budget_text_only_at:
+            return BudgetLevel.TEXT_ONLY
+        if used >= settings.budget_cached_audio_at:
+            return BudgetLevel.CACHED_AUDIO
+        if used >= settings.budget_reduce_tokens_at:
+            return BudgetLevel.REDUCED_TOKENS
+        return BudgetLevel.NORMAL
+
+    def max_tokens(self, requested: int) -> int:
+        """Reply length allowed for the current session"""
+        if self.level() >= BudgetLevel.REDUCED_TOKENS and requested > settings.budget_reduced_max_tokens:
+            self.downgrades["reduced_tokens"] += 1
+            return settings.budget_reduced_max_tokens
+        return requested
+
+    def count_downgrade(self, level: BudgetLevel):
+        self.downgrades[level.name.lower()] += 1
+
+    def session_usage(self, session: InterviewSession) -> Dict:
+        return {
+            **session.usage.to_dict(),
+            "budget_usd": settings.session_budget_usd or None,
+            "budget_used": round(self._budget_used(session), 3),
+            "budget_level": self.level(session).name.lower(),
+        }
+
+    def tenant_usage(self, tenant: str) -> Dict:
+        """Usage in the current budget window"""
+        self._roll_period()
+        remaining = self.period_remaining()
+        return {
+            **(self._tenants.get(tenant) or Usage()).to_dict(),
+            "period_seconds": settings.tenant_budget_period_seconds or None,
+            "period_resets_in_seconds": round(remaining) if remaining is not None else None,
+        }
+
+    def stats(self) -> Dict:
+        self._roll_period()
+        return {
+            **self.total.to_dict(),
+            "tenants": len(self._tenants),
+            "downgrades": dict(self.downgrades),
+        }
+
+
+# Global usage meter instance
+usage_meter = UsageMeter()
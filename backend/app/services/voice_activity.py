@@ -0,0 +1,89 @@
+from typing import Dict, Optional, Tuple
+import numpy as np
+from ..core.config import settings
+from ..utils.audio import FRAME_SECONDS, PcmAudio, frame_energy_db
+
+MIN_RUN_FRAMES = 3  # Ignore clicks shorter than 60 ms
+MAX_SPEECH_ZCR = 0.35  # Broadband noise crosses zero on ~half the samples
+SPEECH_DB_RANGE = (-55.0, -35.0)  # Clamp for the adaptive speech threshold
+
+
+def zero_crossing_rate(samples: np.ndarray, sample_rate: int) -> np.ndarray:
+    """Fraction of sign changes per analysis frame"""
+    frame = max(1, int(sample_rate * FRAME_SECONDS))
+    count = len(samples) // frame
+    if count == 0:
+        return np.empty(0, dtype=np.float32)
+
+    signs = np.signbit(samples[: count * frame].reshape(count, frame))
+    return np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / (frame - 1)
+
+
+def speech_frames(samples: np.ndarray, sample_rate: int, margin_db: float) -> np.ndarray:
+    """Boolean mask of frames that look like speech (energy + zero-crossing rate)"""
+    energy = frame_energy_db(samples, sample_rate)
+    if len(energy) == 0:
+        return np.zeros(0, dtype=bool)
+
+    zcr = zero_crossing_rate(samples, sample_rate)
+    floor = float(np.percentile(energy, 10))
+    threshold = min(max(floor + margin_db, SPEECH_DB_RANGE[0]), SPEECH_DB_RANGE[1])
+
+    # Loud frames count even with a high ZCR (fricatives); quiet ones need voicing
+    candidate = (energy > threshold) & ((zcr < MAX_SPEECH_ZCR) | (energy > threshold + margin_db))
+
+    # Keep only runs of at least MIN_RUN_FRAMES consecutive frames
+    kernel = np.ones(MIN_RUN_FRAMES, dtype=np.int8)
+    full_runs = np.convolve(candidate.astype(np.int8), kernel, mode="valid") == MIN_RUN_FRAMES
+    return np.convolve(full_runs.astype(np.int8), kernel, mode="full") > 0
+
+
+def find_speech_bounds(samples: np.ndarray, sample_rate: int) -> Optional[Tuple[int, int]]:
+    """Sample range [start, end) containing speech plus padding; None if no speech"""
+    mask = speech_frames(samples, sample_rate, settings.vad_margin_db)
+    if mask.sum() * FRAME_SECONDS < settings.vad_min_speech_seconds:
+        return None
+
+    frame = int(sample_rate * FRAME_SECONDS)
+    padding = int(settings.vad_padding_seconds * sample_rate)
+    first, last = np.flatnonzero(mask)[[0, -1]]
+    start = max(0, first * frame - padding)
+    end = min(len(samples), (last + 1) * frame + padding)
+    return start, end
+
+
+def trim_silence(pcm: PcmAudio) -> Tuple[Optional[PcmAudio], float]:
+    """Cut leading/trailing silence; returns (trimmed audio or None if silent, seconds removed)"""
+    bounds = find_speech_bounds(pcm.as_float(), pcm.sample_rate)
+    if bounds is None:
+        return None, pcm.duration
+
+    start, end = bounds
+    trimmed = pcm.slice(start, end)
+    return trimmed, pcm.duration - trimmed.duration
+
+
+class VoiceActivityStats:
+    """Counters for silence trimmed and Whisper requests skipped"""
+
+    def __init__(self):
+        self.clips = 0
+        self.skipped = 0
+        self.trimmed_seconds = 0.0
+
+    def record(self, has_speech: bool, trimmed_seconds: float):
+        self.clips += 1
+        self.trimmed_seconds += trimmed_seconds
+        if not has_speech:
+            self.skipped += 1
+
+    def stats(self) -> Dict:
+        return {
+            "clips": self.clips,
+            "skipped_requests": self.skipped,
+            "trimmed_seconds": round(self.trimmed_seconds, 1),
+        }
+
+
+# Global stats instance
+voice_activity = VoiceActivityStats()
@@ -0,0 +1,107 @@
+import io
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+import numpy as np
+from ..core.config import settings
+
+FRAME_SECONDS = 0.02  # 20 ms analysis frames
+TARGET_SAMPLE_RATE = 16000  # Whisper resamples to 16 kHz anyway
+
+# Shared pool for CPU-bound audio work; NumPy releases the GIL for the heavy parts
+audio_executor = ThreadPoolExecutor(max_workers=settings.audio_worker_threads, thread_name_prefix="audio")
+
+
+class PcmAudio:
+    """16-bit little-endian mono PCM held as a memoryview, so slicing never copies"""
+
+    __slots__ = ("data", "sample_rate")
+
+    def __init__(self, data: memoryview, sample_rate: int):
+        self.data = data
+        self.sample_rate = sample_rate
+
+    @property
+    def samples(self) -> np.ndarray:
+        """int16 view over the same buffer"""
+        return np.frombuffer(self.data, dtype="<i2")
+
+    @property
+    def duration(self) -> float:
+        return len(self.data) / 2 / self.sample_rate
+
+    def as_float(self) -> np.ndarray:
+        return self.samples.astype(np.float32) / 32768.0
+
+    def slice(self, start: int, end: int) -> "PcmAudio":
+        """Sub-range by sample index"""
+        return PcmAudio(self.data[start * 2:end * 2], self.sample_rate)
+
+    def to_wav(self) -> bytes:
+        output = io.BytesIO()
+        with wave.open(output, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(self.sample_rate)
+            wav.writeframes(self.data)
+        return output.getvalue()
+
+
+def frame_energy_db(samples: np.ndarray, sample_rate: int) -> np.ndarray:
+    """Per-frame RMS energy in dBFS"""
+    frame = max(1, int(sample_rate * FRAME_SECONDS))
+    count = len(samples) // frame
+    if count == 0:
+        return np.empty(0, dtype=np.float32)
+
+    frames = samples[: count * frame].reshape(count, frame)
+    rms = np.sqrt(np.mean(np.square(frames), axis=1) + 1e-12)
+    return 20.0 * np.log10(rms)
+
+
+def resample(samples: np.ndarray, source_rate: int, target_rate: int) -> np.ndarray:
+    """Linear-interpolation resampler with a box low-pass when downsampling"""
+    if source_rate == target_rate or len(samples) == 0:
+        return samples
+
+    ratio = source_rate / target_rate
+    if ratio > 1:
+        width = int(round(ratio))
+        samples = np.convolve(samples, np.full(width, 1.0 / width, dtype=np.float32), mode="same")
+
+    count = int(len(samples) / ratio)
+    positions = np.arange(count, dtype=np.float64) * ratio
+    return np.interp(positions, np.arange(len(samples)), samples).astype(np.float32)
+
+
+def decode_wav(audio_data: bytes, target_rate: Optional[int] = TARGET_SAMPLE_RATE) -> Optional[PcmAudio]:
+    """Decode PCM WAV to mono int16, resampled to `target_rate`; None if not PCM WAV"""
+    try:
+        with wave.open(io.BytesIO(audio_data), "rb") as wav:
+            sample_rate = wav.getframerate()
+            channels = wav.getnchannels()
+            width = wav.getsampwidth()
+            raw = wav.readframes(wav.getnframes())
+    except (wave.Error, EOFError):
+        return None
+
+    target_rate = target_rate or sample_rate
+    if width == 2 and channels == 1 and sample_rate == target_rate:
+        # Already in the target layout - hand out the decoded buffer as-is
+        return PcmAudio(memoryview(raw), sample_rate)
+
+    if width == 2:
+        samples = np.frombuffer(raw, dtype="<i2").astype(np.float32) / 32768.0
+    elif width == 4:
+        samples = np.frombuffer(raw, dtype="<i4").astype(np.float32) / 2147483648.0
+    elif width == 1:
+        samples = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    else:
+        return None
+
+    if channels > 1:
+        samples = samples[: len(samples) - len(samples) % channels].reshape(-1, channels).mean(axis=1)
+
+    samples = resample(samples, sample_rate, target_rate)
+    pcm = np.clip(samples * 32768.0, -32768, 32767).astype("<i2")
+    return PcmAudio(memoryview(pcm).cast("B"), target_rate)
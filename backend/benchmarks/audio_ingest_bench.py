@@ -0,0 +1,59 @@
+"""Upload bytes per turn before and after the audio ingest stage.
+
+Run from the backend directory:
+
+    python -m benchmarks.audio_ingest_bench --clips 50 --sample-rate 48000 --channels 2
+
+Input clips are browser-style WAV (48 kHz stereo by default) with mic-open
+padding. The ingest stage resamples to 16 kHz mono, trims silence and encodes
+with the configured upload codec (Opus when ffmpeg is installed, else WAV).
+"""
+import argparse
+import time
+
+import numpy as np
+
+from app.services.audio_ingest import FFMPEG, prepare_audio
+from app.core.config import settings
+from benchmarks.synthetic_audio import make_clip, to_wav_bytes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the audio ingest stage")
+    parser.add_argument("--clips", type=int, default=50)
+    parser.add_argument("--sample-rate", type=int, default=48000)
+    parser.add_argument("--channels", type=int, default=2)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    clips = []
+    for i in range(args.clips):
+        pcm, _ = make_clip(
+            seconds=float(rng.uniform(3, 30)),
+            sample_rate=args.sample_rate,
+            lead_silence=float(rng.uniform(0, 2)),
+            trail_silence=float(rng.uniform(0, 4)),
+            seed=i,
+        )
+        if args.channels > 1:
+            pcm = np.repeat(pcm, args.channels)
+        clips.append(to_wav_bytes(pcm, args.sample_rate, args.channels))
+
+    bytes_in = bytes_out = 0
+    started = time.perf_counter()
+    for audio in clips:
+        prepared = prepare_audio(audio)
+        bytes_in += len(audio)
+        bytes_out += len(prepared.upload_data)
+    elapsed = time.perf_counter() - started
+
+    codec = "opus" if settings.upload_codec == "opus" and FFMPEG else "wav"
+    print(f"input:              {args.sample_rate} Hz x {args.channels} ch WAV, {args.clips} turns")
+    print(f"upload codec:       {codec} @ 16 kHz mono")
+    print(f"bytes/turn before:  {bytes_in // args.clips:,}")
+    print(f"bytes/turn after:   {bytes_out // args.clips:,} ({bytes_in / bytes_out:.1f}x smaller)")
+    print(f"ingest cost:        {elapsed / args.clips * 1000:.1f} ms/turn")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+"""Concurrent-interview load test against local provider stubs.
+
+Starts the provider stub and the backend (one uvicorn worker) as child
+processes, then drives N simulated candidates through the full flow:
+POST /interview/start, the voice WebSocket with alternating text and audio
+turns, and POST /interview/stop followed by feedback polling. Everything runs
+on localhost, so no API keys or network access are needed.
+
+Run from the backend directory:
+
+    python -m benchmarks.load_test --sessions 50 --turns 6 --llm-delay 0.6 --tts-delay 0.4
+
+Reports throughput, p50/p99 turn latency (end of candidate input to the
+interviewer's audio), time-to-first-audio (filler clips included), feedback
+latency and backend memory per session. Add --json for machine-readable output.
+"""
+import argparse
+import asyncio
+import base64
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+import numpy as np
+import websockets
+
+from benchmarks.synthetic_audio import make_clip, to_wav_bytes
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PERSONAS = ["hr-friendly", "manager-critical", "tech-expert", "stress-interviewer", "ceo-executive"]
+
+
+class Results:
+    def __init__(self):
+        self.turn_latency: List[float] = []
+        self.first_audio: List[float] = []
+        self.feedback_latency: List[float] = []
+        self.sessions_completed = 0
+        self.errors: Dict[str, int] = {}
+
+    def error(self, kind: str):
+        self.errors[kind] = self.errors.get(kind, 0) + 1
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _rss_mb(pid: int) -> Optional[float]:
+    """Resident memory of a process from /proc (Linux only)"""
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        return None
+    return None
+
+
+def _percentile(values: List[float], pct: float) -> Optional[float]:
+    return round(float(np.percentile(values, pct)) * 1000, 1) if values else None
+
+
+async def _wait_ready(url: str, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get(url)).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"{url} did not become ready within {timeout}s")
+
+
+async def _receive_until_audio(ws, started: float, results: Results):
+    """Read messages until the interviewer's audio arrives; records latency"""
+    first_audio = None
+    while True:
+        message = json.loads(await ws.recv())
+        kind = message.get("type")
+        if kind in ("filler_audio", "audio_response") and first_audio is None:
+            first_audio = time.perf_counter() - started
+        if kind == "audio_response":
+            results.turn_latency.append(time.perf_counter() - started)
+            results.first_audio.append(first_audio)
+            return
+        if kind == "error":
+            results.error(message.get("message", "error")[:60])
+            return
+
+
+async def run_candidate(index: int, base_url: str, args, audio_turn: str, results: Results):
+    persona = PERSONAS[index % len(PERSONAS)]
+    async with httpx.AsyncClient(base_url=base_url, timeout=60.0) as client:
+        response = await client.post("/api/interview/start", json={
+            "persona_id": persona,
+            "interview_type": "general",
+            "interview_length": "standard",
+            "job_description": "Senior backend engineer working on real-time systems."
+        })
+        if response.status_code != 200:
+            results.error(f"start {response.status_code}")
+            return
+        session_id = response.json()["session_id"]
+
+        ws_url = base_url.replace("http", "ws") + f"/api/interview/voice/{session_id}?audio_format={args.audio_format}"
+        try:
+            async with websockets.connect(ws_url, max_size=None) as ws:
+                await ws.recv()  # Connection message
+                for turn in range(args.turns):
+                    if turn % 2 and audio_turn:
+                        payload = {"type": "audio_chunk", "audio_data": audio_turn, "format": "wav"}
+                    else:
+                        payload = {"type": "text_message", "content": f"Answer {turn}: I built a queue-based ingestion pipeline."}
+                    started = time.perf_counter()
+                    await ws.send(json.dumps(payload))
+                    await _receive_until_audio(ws, started, results)
+                    await asyncio.sleep(args.think_seconds)
+        except (OSError, websockets.WebSocketException) as e:
+            results.error(f"websocket {type(e).__name__}")
+            return
+
+        started = time.perf_counter()
+        response = await client.post(f"/api/interview/stop/{session_id}")
+        if response.status_code != 202:
+            results.error(f"stop {response.status_code}")
+            return
+        if not args.skip_feedback:
+            while True:
+                job = (await client.get(f"/api/interview/feedback/{session_id}")).json()
+                if job["status"] in ("completed", "failed"):
+                    break
+                await asyncio.sleep(0.2)
+            if job["status"] == "failed":
+                results.error("feedback failed")
+                return
+            results.feedback_latency.append(time.perf_counter() - started)
+        results.sessions_completed += 1
+
+
+async def sample_memory(pid: int, peak: List[float], stop: asyncio.Event):
+    while not stop.is_set():
+        rss = _rss_mb(pid)
+        if rss is not None:
+            peak[0] = max(peak[0], rss)
+        await asyncio.sleep(0.2)
+
+
+async def run(args, backend: subprocess.Popen, base_url: str, stub_url: str) -> Dict[str, Any]:
+    await _wait_ready(f"{stub_url}/_stub/stats")
+    await _wait_ready(f"{base_url}/api/health")
+    async with httpx.AsyncClient() as client:
+        await client.post(f"{stub_url}/_stub/config", json={
+            "audio_bytes_per_char": args.tts_bytes_per_char,
+            "reply_text": " ".join(["Can you walk me through a specific example of that?"] * args.reply_sentences),
+        })
+
+    pcm, _ = make_clip(args.audio_seconds, lead_silence=0.5, trail_silence=1.0)
+    audio_turn = base64.b64encode(to_wav_bytes(pcm)).decode() if args.audio_seconds > 0 else ""
+
+    results = Results()
+    baseline = _rss_mb(backend.pid)
+    peak = [baseline or 0.0]
+    stop = asyncio.Event()
+    sampler = asyncio.create_task(sample_memory(backend.pid, peak, stop))
+
+    started = time.perf_counter()
+    candidates = []
+    for i in range(args.sessions):
+        candidates.append(asyncio.create_task(run_candidate(i, base_url, args, audio_turn, results)))
+        if args.ramp_seconds:
+            await asyncio.sleep(args.ramp_seconds / args.sessions)
+    await asyncio.gather(*candidates)
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await sampler
+
+    async with httpx.AsyncClient() as client:
+        providers = (await client.get(f"{base_url}/api/health/providers")).json()
+
+    return {
+        "sessions": args.sessions,
+        "sessions_completed": results.sessions_completed,
+        "turns": len(results.turn_latency),
+        "elapsed_seconds": round(elapsed, 2),
+        "turns_per_second": round(len(results.turn_latency) / elapsed, 2),
+        "turn_p50_ms": _percentile(results.turn_latency, 50),
+        "turn_p99_ms": _percentile(results.turn_latency, 99),
+        "first_audio_p50_ms": _percentile(results.first_audio, 50),
+        "first_audio_p99_ms": _percentile(results.first_audio, 99),
+        "feedback_p50_ms": _percentile(results.feedback_latency, 50),
+        "feedback_p99_ms": _percentile(results.feedback_latency, 99),
+        "memory_baseline_mb": round(baseline, 1) if baseline else None,
+        "memory_peak_mb": round(peak[0], 1) if baseline else None,
+        "memory_per_session_kb": round((peak[0] - baseline) * 1024 / args.sessions, 1) if baseline else None,
+        "event_loop_max_lag_ms": providers.get("event_loop", {}).get("max_lag_ms"),
+        "errors": results.errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the interview backend against local provider stubs")
+    parser.add_argument("--sessions", type=int, default=20, help="Concurrent simulated candidates")
+    parser.add_argument("--turns", type=int, default=6, help="Turns per interview (odd turns send audio)")
+    parser.add_argument("--think-seconds", type=float, default=0.5, help="Pause between turns")
+    parser.add_argument("--ramp-seconds", type=float, default=0.0, help="Spread session starts over this long")
+    parser.add_argument("--audio-seconds", type=float, default=6.0, help="Candidate clip length; 0 for text-only")
+    parser.add_argument("--audio-format", default="mp3", help="TTS format requested on the voice socket")
+    parser.add_argument("--llm-delay", type=float, default=0.5)
+    parser.add_argument("--stt-delay", type=float, default=0.3)
+    parser.add_argument("--tts-delay", type=float, default=0.4)
+    parser.add_argument("--jitter", type=float, default=0.1)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--tts-bytes-per-char", type=int, default=180, help="Stub TTS payload size at 128 kbps")
+    parser.add_argument("--reply-sentences", type=int, default=1, help="Length of the stub interviewer reply")
+    parser.add_argument("--skip-feedback", action="store_true", help="Don't wait for feedback after stopping")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    stub_port, backend_port = _free_port(), _free_port()
+    stub_url = f"http://127.0.0.1:{stub_port}"
+    base_url = f"http://127.0.0.1:{backend_port}"
+
+    stub = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.stub_providers", "--port", str(stub_port),
+         "--llm-delay", str(args.llm_delay), "--stt-delay", str(args.stt_delay),
+         "--tts-delay", str(args.tts_delay), "--jitter", str(args.jitter),
+         "--error-rate", str(args.error_rate), "--seed", "0"],
+        cwd=BACKEND_DIR
+    )
+    env = {
+        **os.environ,
+        "OPENAI_API_KEY": "stub",
+        "ELEVENLABS_API_KEY": "stub",
+        "OPENAI_BASE_URL": f"{stub_url}/v1",
+        "ELEVENLABS_BASE_URL": stub_url,
+        "MAX_CONCURRENT_SESSIONS": str(args.sessions),
+    }
+    backend = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1",
+         "--port", str(backend_port), "--log-level", "warning"],
+        cwd=BACKEND_DIR, env=env
+    )
+
+    try:
+        report = asyncio.run(run(args, backend, base_url, stub_url))
+    finally:
+        for process in (backend, stub):
+            process.terminate()
+            process.wait(timeout=10)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"Sessions:            {report['sessions_completed']}/{report['sessions']} completed, {report['turns']} turns")
+    print(f"Throughput:          {report['turns_per_second']} turns/s over {report['elapsed_seconds']}s")
+    print(f"Turn latency:        p50 {report['turn_p50_ms']} ms, p99 {report['turn_p99_ms']} ms")
+    print(f"Time to first audio: p50 {report['first_audio_p50_ms']} ms, p99 {report['first_audio_p99_ms']} ms")
+    print(f"Feedback latency:    p50 {report['feedback_p50_ms']} ms, p99 {report['feedback_p99_ms']} ms")
+    print(f"Memory:              {report['memory_baseline_mb']} -> {report['memory_peak_mb']} MB "
+          f"({report['memory_per_session_kb']} KB per session)")
+    print(f"Event loop max lag:  {report['event_loop_max_lag_ms']} ms")
+    if report["errors"]:
+        print(f"Errors:              {report['errors']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""Replay recorded interview transcripts to catch prompt-size and latency regressions.
+
+Each line of the input JSONL is one interview:
+
+    {"name": "...", "config": {InterviewConfig}, "messages": [{"role": "candidate", "content": "..."}, ...]}
+
+For every candidate message the tool rebuilds the interviewer prompt exactly
+as the live pipeline does (SessionManager history + PersonaService prompt +
+OpenAIService chat messages), then optionally sends it to the provider. The
+recorded interviewer reply, not the generated one, is appended afterwards so
+every run sees the same history.
+
+Run from the backend directory:
+
+    python -m benchmarks.replay_transcripts benchmarks/transcripts/sample_interviews.jsonl --dry-run --output before.jsonl
+    python -m benchmarks.replay_transcripts benchmarks/transcripts/sample_interviews.jsonl --dry-run --compare before.jsonl
+
+--dry-run skips the provider (prompt sizes and build time only). Without it,
+point OPENAI_BASE_URL at benchmarks/stub_providers.py or a real endpoint.
+Records are written one JSON object per line in a fixed order; pass
+--no-timings to leave out the noisy latency fields for exact diffs.
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import sys
+import time
+from typing import Any, Dict, List
+
+
+def load_transcripts(path: str) -> List[Dict[str, Any]]:
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+async def replay(transcript: Dict[str, Any], dry_run: bool) -> List[Dict[str, Any]]:
+    from app.core.models import ConversationRole, InterviewConfig
+    from app.core.session_manager import session_manager
+    from app.services.openai_service import openai_service
+    from app.services.persona_service import persona_service
+    from app.services.provider_scheduler import estimate_tokens
+
+    session_id = session_manager.create_session(InterviewConfig(**transcript["config"]))
+    session_manager.start_session(session_id)
+    session = session_manager.get_session(session_id)
+
+    records = []
+    turn = 0
+    try:
+        for message in transcript["messages"]:
+            role = ConversationRole(message["role"])
+            session_manager.add_turn(session_id, role, message["content"])
+            if role != ConversationRole.CANDIDATE:
+                continue
+
+            turn += 1
+            started = time.perf_counter()
+            system_prompt = persona_service.build_system_prompt(session)
+            chat_messages = openai_service.build_chat_messages(system_prompt, session.conversation_history)
+            build_seconds = time.perf_counter() - started
+
+            prompt_text = "\n".join(m["content"] for m in chat_messages)
+            record = {
+                "interview": transcript.get("name", session_id),
+                "turn": turn,
+                "messages": len(chat_messages),
+                "system_prompt_chars": len(system_prompt),
+                "prompt_chars": len(prompt_text),
+                "prompt_tokens": sum(estimate_tokens(m["content"]) for m in chat_messages),
+                "prompt_hash": hashlib.sha1(prompt_text.encode()).hexdigest()[:12],
+                "build_ms": round(build_seconds * 1000, 3),
+            }
+
+            if not dry_run:
+                started = time.perf_counter()
+                reply = await openai_service.generate_interview_response(
+                    system_prompt=system_prompt,
+                    conversation_history=session.conversation_history,
+                    max_tokens=200
+                )
+                record["e2e_ms"] = round((time.perf_counter() - started) * 1000, 1)
+                record["reply_chars"] = len(reply)
+
+            records.append(record)
+    finally:
+        session_manager.complete_session(session_id)
+
+    return records
+
+
+def compare(records: List[Dict[str, Any]], baseline_path: str, tolerance: float, min_delta_ms: float) -> int:
+    """Print per-turn changes against a previous run; returns the number of regressions"""
+    baseline = {(r["interview"], r["turn"]): r for r in load_transcripts(baseline_path)}
+    regressions = 0
+    for record in records:
+        before = baseline.get((record["interview"], record["turn"]))
+        if before is None:
+            print(f"{record['interview']} turn {record['turn']}: new")
+            continue
+
+        changes = []
+        for field in ("prompt_tokens", "build_ms", "e2e_ms"):
+            if field not in record or field not in before or not before[field]:
+                continue
+            delta = (record[field] - before[field]) / before[field]
+            if field.endswith("_ms") and abs(record[field] - before[field]) < min_delta_ms:
+                continue  # Timer noise
+            if abs(delta) > tolerance:
+                changes.append(f"{field} {before[field]} -> {record[field]} ({delta:+.0%})")
+                regressions += delta > 0
+        if record["prompt_hash"] != before["prompt_hash"]:
+            changes.append("prompt text changed")
+        if changes:
+            print(f"{record['interview']} turn {record['turn']}: " + "; ".join(changes))
+
+    print(f"{regressions} regression(s) beyond {tolerance:.0%}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay interview transcripts through prompt building and the LLM")
+    parser.add_argument("transcripts", help="JSONL file, one interview per line")
+    parser.add_argument("--dry-run", action="store_true", help="Build prompts only; no provider calls")
+    parser.add_argument("--output", help="Write per-turn records to this JSONL file (default: stdout)")
+    parser.add_argument("--no-timings", action="store_true", help="Omit latency fields so output diffs exactly")
+    parser.add_argument("--compare", metavar="BASELINE", help="Report changes against a previous --output file")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="Relative change that counts as a regression")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0, help="Ignore latency changes smaller than this")
+    args = parser.parse_args()
+
+    async def run_all():
+        records = []
+        for transcript in load_transcripts(args.transcripts):
+            records.extend(await replay(transcript, args.dry_run))
+        return records
+
+    records = asyncio.run(run_all())
+    if args.no_timings:
+        for record in records:
+            record.pop("build_ms", None)
+            record.pop("e2e_ms", None)
+
+    lines = [json.dumps(record) for record in records]
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write("\n".join(lines) + "\n")
+    elif not args.compare:
+        print("\n".join(lines))
+
+    total_tokens = sum(r["prompt_tokens"] for r in records)
+    print(f"{len(records)} turns, {total_tokens} prompt tokens", file=sys.stderr)
+
+    if args.compare:
+        sys.exit(1 if compare(records, args.compare, args.tolerance, args.min_delta_ms) else 0)
+
+
+if __name__ == "__main__":
+    main()
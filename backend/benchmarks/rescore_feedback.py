@@ -0,0 +1,341 @@
+"""Re-score stored interviews with the current feedback rubric.
+
+Reads interviews from a transcript JSONL (the replay_transcripts.py format)
+or a directory of session snapshots (SESSION_STORE_DIR), requests feedback
+for each one and appends an InterviewFeedback record per interview to a
+JSONL file.
+
+Run from the backend directory:
+
+    python -m benchmarks.rescore_feedback benchmarks/transcripts/sample_interviews.jsonl --output rescored.jsonl
+    python -m benchmarks.rescore_feedback ./session_snapshots --output rescored.jsonl --mode batch
+
+--mode live (the default) calls the chat API with at most --concurrency
+interviews in flight. The calls go through the same background scheduler
+slots and map-reduce path as the feedback jobs. --mode batch writes the
+requests to provider batch files instead (the OpenAI Batch API;
+benchmarks/stub_providers.py serves a local one). Batches are cheaper and
+don't count against the live rate limits, but take longer. In batch mode
+long interviews are scored from a single prompt.
+
+The output is also the checkpoint: interviews already in it are skipped,
+so an interrupted run carries on where it stopped. Submitted batch ids are
+kept in <output>.batches, so a restarted batch run waits for them instead
+of resubmitting. Failed interviews are not written and are retried on the
+next run. Progress and throughput in interviews per minute go to stderr.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+TERMINAL_BATCH_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+
+def iter_interviews(path: str) -> Iterator[Tuple[str, Any]]:
+    """(key, InterviewSession) pairs, read one at a time"""
+    from app.core.models import ConversationRole, InterviewConfig, InterviewSession
+    from app.core.serialization import loads
+
+    if os.path.isdir(path):
+        for name in sorted(os.listdir(path)):
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(path, name), "rb") as f:
+                    session = InterviewSession.from_snapshot(loads(f.read()))
+            except Exception as e:
+                print(f"Skipping unreadable snapshot {name}: {e}", file=sys.stderr)
+                continue
+            yield session.session_id, session
+        return
+
+    with open(path) as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            transcript = json.loads(line)
+            key = transcript.get("name") or f"line-{line_number}"
+            session = InterviewSession(InterviewConfig(**transcript["config"]), session_id=key)
+            for message in transcript["messages"]:
+                role = ConversationRole(message["role"])
+                session.conversation_history.append(role, message["content"])
+                if role == ConversationRole.INTERVIEWER:
+                    session.question_count += 1
+            yield key, session
+
+
+class Checkpoint:
+    """Append-only JSONL output; the interviews already in it are done"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.done: Set[str] = set()
+        if os.path.exists(path):
+            self._recover()
+        self._file = open(path, "a")
+
+    def _recover(self):
+        with open(self.path, "rb+") as f:
+            data = f.read()
+            # Drop a record cut off by a crash so the next append starts on a fresh line
+            end = data.rfind(b"\n") + 1
+            if end < len(data):
+                f.truncate(end)
+        for line in data[:end].splitlines():
+            if line.strip():
+                self.done.add(json.loads(line)["interview"])
+
+    def write(self, key: str, record: Dict[str, Any]):
+        self._file.write(json.dumps({"interview": key, **record}) + "\n")
+        self._file.flush()
+        self.done.add(key)
+
+    def close(self):
+        self._file.close()
+
+
+class Progress:
+    def __init__(self, interval: float = 5.0):
+        self.started = time.monotonic()
+        self.interval = interval
+        self.last_report = self.started
+        self.scored = 0
+        self.failed = 0
+        self.skipped = 0
+
+    def record(self, ok: bool):
+        if ok:
+            self.scored += 1
+        else:
+            self.failed += 1
+        self.maybe_report()
+
+    def per_minute(self) -> float:
+        elapsed = time.monotonic() - self.started
+        return self.scored / elapsed * 60 if elapsed else 0.0
+
+    def maybe_report(self, note: str = ""):
+        now = time.monotonic()
+        if now - self.last_report < self.interval:
+            return
+        self.last_report = now
+        print(f"{self.scored} scored, {self.failed} failed, {self.per_minute():.1f}/min {note}".rstrip(), file=sys.stderr)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "scored": self.scored,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "seconds": round(time.monotonic() - self.started, 1),
+            "per_minute": round(self.per_minute(), 1),
+        }
+
+
+def _record(feedback, tag: Optional[str]) -> Dict[str, Any]:
+    record = feedback.model_dump(mode="json")
+    if tag:
+        record["tag"] = tag
+    return record
+
+
+async def rescore_live(interviews, checkpoint: Checkpoint, progress: Progress, concurrency: int, tag: Optional[str]):
+    from app.core.config import settings
+    from app.services.feedback_segments import feedback_segmenter
+    from app.services.openai_service import openai_service
+
+    semaphore = asyncio.Semaphore(concurrency)
+    tasks: Set[asyncio.Task] = set()
+
+    async def score(key: str, session):
+        try:
+            if len(session.conversation_history) >= settings.feedback_chunked_min_messages:
+                analyses = await feedback_segmenter.collect(session)
+                feedback = await openai_service.request_feedback(session, segment_analyses=analyses)
+            else:
+                feedback = await openai_service.request_feedback(session)
+            checkpoint.write(key, _record(feedback, tag))
+            progress.record(True)
+        except Exception as e:
+            print(f"{key}: {e}", file=sys.stderr)
+            progress.record(False)
+        finally:
+            semaphore.release()
+
+    for key, session in interviews:
+        if key in checkpoint.done:
+            progress.skipped += 1
+            continue
+        # Read the next interview only when there is room for it
+        await semaphore.acquire()
+        task = asyncio.create_task(score(key, session))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+    await asyncio.gather(*tasks)
+
+
+class BatchLedger:
+    """Submitted batches and, per interview, what's needed to build its record"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.pending: Dict[str, Dict[str, Any]] = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    entry = json.loads(line)
+                    if entry.get("finished"):
+                        self.pending.pop(entry["batch_id"], None)
+                    else:
+                        self.pending[entry["batch_id"]] = entry
+
+    def _append(self, entry: Dict[str, Any]):
+        with open(self.path, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+
+    def submitted(self, batch_id: str, interviews: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        entry = {"batch_id": batch_id, "interviews": interviews}
+        self._append(entry)
+        self.pending[batch_id] = entry
+        return entry
+
+    def finished(self, batch_id: str):
+        """Its failed interviews become eligible for resubmission"""
+        self._append({"batch_id": batch_id, "finished": True})
+        self.pending.pop(batch_id, None)
+
+
+async def rescore_batch(
+    interviews,
+    checkpoint: Checkpoint,
+    progress: Progress,
+    batch_size: int,
+    poll_seconds: float,
+    tag: Optional[str]
+):
+    from app.core.models import InterviewFeedback
+    from app.core.session_manager import format_duration
+    from app.services.openai_service import FEEDBACK_MAX_TOKENS, openai_service
+
+    client = openai_service.client
+    ledger = BatchLedger(checkpoint.path + ".batches")
+    in_batches = {key for entry in ledger.pending.values() for key in entry["interviews"]}
+
+    async def submit(chunk: Dict[str, Dict[str, Any]], lines: List[str]) -> Dict[str, Any]:
+        upload = await client.files.create(file=("rescore.jsonl", "".join(lines).encode()), purpose="batch")
+        batch = await client.batches.create(
+            input_file_id=upload.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        print(f"Submitted {batch.id} with {len(chunk)} interviews", file=sys.stderr)
+        return ledger.submitted(batch.id, chunk)
+
+    async def collect(entry: Dict[str, Any]):
+        batch_id, chunk = entry["batch_id"], entry["interviews"]
+        while True:
+            batch = await client.batches.retrieve(batch_id)
+            if batch.status in TERMINAL_BATCH_STATUSES:
+                break
+            progress.maybe_report(f"({batch_id} {batch.status})")
+            await asyncio.sleep(poll_seconds)
+
+        results = []
+        if batch.output_file_id:
+            output = await client.files.content(batch.output_file_id)
+            results = [json.loads(line) for line in output.text.splitlines() if line.strip()]
+        for result in results:
+            key = result["custom_id"]
+            meta = chunk.get(key)
+            response = result.get("response") or {}
+            if meta is None or key in checkpoint.done:
+                continue
+            try:
+                if response.get("status_code") != 200:
+                    raise ValueError(f"status {response.get('status_code')}")
+                content = response["body"]["choices"][0]["message"]["content"]
+                feedback = InterviewFeedback(**meta, **openai_service.feedback_fields(content))
+                checkpoint.write(key, _record(feedback, tag))
+                progress.record(True)
+            except Exception as e:
+                print(f"{key}: {e}", file=sys.stderr)
+                progress.record(False)
+
+        # Anything without a result failed or expired (details are in the batch's error file)
+        answered = {result["custom_id"] for result in results}
+        for key in chunk:
+            if key not in answered and key not in checkpoint.done:
+                progress.record(False)
+        if batch.status != "completed":
+            print(f"{batch_id} ended {batch.status}", file=sys.stderr)
+        ledger.finished(batch_id)
+
+    async def submit_and_collect(chunk, lines):
+        await collect(await submit(chunk, lines))
+
+    tasks = [asyncio.create_task(collect(entry)) for entry in list(ledger.pending.values())]
+    chunk: Dict[str, Dict[str, Any]] = {}
+    lines: List[str] = []
+    for key, session in interviews:
+        if key in checkpoint.done or key in in_batches:
+            progress.skipped += 1
+            continue
+        chunk[key] = {
+            "session_id": session.session_id,
+            "duration": format_duration(session),
+            "total_questions": session.question_count,
+        }
+        body = openai_service.background_request(openai_service.build_feedback_prompt(session), FEEDBACK_MAX_TOKENS)
+        lines.append(json.dumps({"custom_id": key, "method": "POST", "url": "/v1/chat/completions", "body": body}) + "\n")
+        if len(chunk) >= batch_size:
+            tasks.append(asyncio.create_task(submit_and_collect(chunk, lines)))
+            chunk, lines = {}, []
+            await asyncio.sleep(0)  # Start the upload while the next chunk is read
+    if chunk:
+        tasks.append(asyncio.create_task(submit_and_collect(chunk, lines)))
+    await asyncio.gather(*tasks)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-score stored interviews with the current feedback rubric")
+    parser.add_argument("source", help="Transcript JSONL or a directory of session snapshots")
+    parser.add_argument("--output", required=True, help="JSONL of InterviewFeedback records; also the checkpoint")
+    parser.add_argument("--mode", choices=("live", "batch"), default="live")
+    parser.add_argument("--concurrency", type=int, default=8, help="Interviews in flight in live mode")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Interviews per provider batch file")
+    parser.add_argument("--poll-seconds", type=float, default=30.0, help="Batch status polling interval")
+    parser.add_argument("--tag", help="Label stored on every record, e.g. the rubric version")
+    parser.add_argument("--json", action="store_true", help="Print the summary as JSON")
+    args = parser.parse_args()
+
+    checkpoint = Checkpoint(args.output)
+    progress = Progress()
+    interviews = iter_interviews(args.source)
+    try:
+        if args.mode == "live":
+            asyncio.run(rescore_live(interviews, checkpoint, progress, args.concurrency, args.tag))
+        else:
+            asyncio.run(rescore_batch(interviews, checkpoint, progress, args.batch_size, args.poll_seconds, args.tag))
+    except KeyboardInterrupt:
+        print(f"Interrupted; run again to resume from {args.output}", file=sys.stderr)
+    finally:
+        checkpoint.close()
+
+    summary = progress.summary()
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print(
+            f"{summary['scored']} scored, {summary['failed']} failed, {summary['skipped']} already done "
+            f"in {summary['seconds']:.0f}s ({summary['per_minute']:.1f} interviews/min)"
+        )
+    sys.exit(1 if summary["failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Voice frames encoded per second on one core.
+
+Run from the backend directory:
+
+    python -m benchmarks.serialization_bench --seconds 1 --audio-kb 40
+
+Encodes the frames a voice turn sends (status, transcription, text and audio
+responses) with the stdlib encoder, orjson (if installed) and the precomputed
+static status frames, one thread at a time.
+"""
+import argparse
+import base64
+import json
+import os
+import time
+from datetime import datetime
+
+from app.core import serialization
+from app.api.websocket.voice import THINKING_FRAME
+
+
+def frames(audio_kb: int):
+    audio = base64.b64encode(os.urandom(audio_kb * 1024)).decode()
+    return {
+        "status": {"type": "status", "message": "Generating response...", "status": "thinking"},
+        "transcription": {
+            "type": "transcription",
+            "text": "I led the migration of our billing system and cut costs by twenty percent.",
+            "timestamp": datetime.now()
+        },
+        "text_response": {
+            "type": "text_response",
+            "text": "Thanks for sharing that. Can you walk me through a specific example?",
+            "question_count": 3,
+            "timestamp": datetime.now()
+        },
+        "audio_response": {
+            "type": "audio_response",
+            "audio_data": audio,
+            "audio_format": "mp3_44100_128",
+            "mime_type": "audio/mpeg",
+            "text": "Thanks for sharing that. Can you walk me through a specific example?",
+            "timestamp": datetime.now()
+        },
+    }
+
+
+def stdlib_dumps(obj):
+    # The previous code path: isoformat() at the call site, then json.dumps
+    obj = {k: v.isoformat() if isinstance(v, datetime) else v for k, v in obj.items()}
+    return json.dumps(obj)
+
+
+def rate(encode, obj, seconds: float) -> float:
+    count = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        for _ in range(100):
+            encode(obj)
+        count += 100
+    return count / seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark voice frame serialization")
+    parser.add_argument("--seconds", type=float, default=1.0, help="Time per measurement")
+    parser.add_argument("--audio-kb", type=int, default=40, help="Raw audio size in audio_response frames")
+    args = parser.parse_args()
+
+    print(f"Serializer backend: {serialization.BACKEND}")
+    print(f"{'frame':>15} {'stdlib/s':>12} {serialization.BACKEND + '/s':>12} {'speedup':>8}")
+    for name, obj in frames(args.audio_kb).items():
+        baseline = rate(stdlib_dumps, obj, args.seconds)
+        fast = rate(serialization.dumps, obj, args.seconds)
+        print(f"{name:>15} {baseline:12,.0f} {fast:12,.0f} {fast / baseline:7.1f}x")
+
+    static = rate(lambda _: THINKING_FRAME, None, args.seconds)
+    print(f"{'static status':>15} {'':>12} {static:12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Bytes per session and per turn for in-memory conversation state.
+
+Run from the backend directory:
+
+    python -m benchmarks.session_memory_bench --sessions 200 --turns 40
+
+Compares a list of Pydantic ConversationMessage objects (the previous
+representation) with the column-oriented ConversationHistory, measured with
+tracemalloc. Message text is rebuilt per turn so each string is a fresh
+object, as it would be when decoded from a socket; repeated interviewer lines
+are only shared when interned.
+"""
+import argparse
+import tracemalloc
+from datetime import datetime
+
+from app.core.models import (
+    ConversationMessage, ConversationRole, InterviewConfig, InterviewSession
+)
+
+CANDIDATE_LINES = [
+    "I led the migration of our billing system and cut infrastructure costs by twenty percent.",
+    "Mostly by standardizing the kickoff and getting the data team involved in week one.",
+    "I'd put a short timeout on the call and fall back to a local bucket with a conservative share.",
+]
+INTERVIEWER_LINES = [
+    "Thanks for sharing that. Can you walk me through a specific example?",
+    "What would you do differently next time?",
+    "How did you measure the impact?",
+]
+
+
+def _text(lines, i: int) -> str:
+    # Fresh string object each time, as if decoded from JSON
+    return lines[i % len(lines)].encode().decode()
+
+
+def _config() -> InterviewConfig:
+    return InterviewConfig(
+        persona_id="tech-expert",
+        interview_type="technical",
+        interview_length="standard",
+        job_description="Senior backend engineer building low-latency streaming APIs in Python."
+    )
+
+
+def build_pydantic(sessions: int, turns: int):
+    states = []
+    for s in range(sessions):
+        history = []
+        for t in range(turns):
+            lines = INTERVIEWER_LINES if t % 2 == 0 else CANDIDATE_LINES
+            role = ConversationRole.INTERVIEWER if t % 2 == 0 else ConversationRole.CANDIDATE
+            content = _text(lines, s + t)
+            if role == ConversationRole.CANDIDATE:
+                content += f" ({s}:{t})"  # Candidate answers are unique
+            history.append(ConversationMessage(role=role, content=content, timestamp=datetime.now()))
+        states.append({"config": _config(), "history": history})
+    return states
+
+
+def build_compact(sessions: int, turns: int):
+    states = []
+    for s in range(sessions):
+        session = InterviewSession(config=_config())
+        for t in range(turns):
+            lines = INTERVIEWER_LINES if t % 2 == 0 else CANDIDATE_LINES
+            role = ConversationRole.INTERVIEWER if t % 2 == 0 else ConversationRole.CANDIDATE
+            content = _text(lines, s + t)
+            if role == ConversationRole.CANDIDATE:
+                content += f" ({s}:{t})"  # Candidate answers are unique
+            session.conversation_history.append(role, content)
+        states.append(session)
+    return states
+
+
+def measure(builder, sessions: int, turns: int) -> int:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    states = builder(sessions, turns)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del states
+    return after - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark conversation history memory use")
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--turns", type=int, default=40)
+    args = parser.parse_args()
+
+    results = {}
+    for name, builder in (("pydantic", build_pydantic), ("compact", build_compact)):
+        empty = measure(builder, args.sessions, 0)
+        full = measure(builder, args.sessions, args.turns)
+        results[name] = (full / args.sessions, (full - empty) / (args.sessions * args.turns))
+
+    for name, (per_session, per_turn) in results.items():
+        print(f"{name:>9}: {per_session / 1024:8.1f} KB per session, {per_turn:6.0f} bytes per turn")
+    saved = 1 - results["compact"][0] / results["pydantic"][0]
+    print(f"Saved:     {saved:.0%} per session at {args.turns} turns")
+
+
+if __name__ == "__main__":
+    main()
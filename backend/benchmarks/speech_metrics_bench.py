@@ -0,0 +1,49 @@
+"""Offline cost of the speech-delivery metrics stage.
+
+Run from the backend directory:
+
+    python -m benchmarks.speech_metrics_bench --clips 50
+
+Reports processing time per minute of candidate audio, which is what the
+worker pool has to keep up with.
+"""
+import argparse
+import time
+
+from app.services.speech_metrics import SessionDeliveryStats, _analyze_clip
+from app.utils.audio import decode_wav
+from benchmarks.synthetic_audio import corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark speech delivery metrics")
+    parser.add_argument("--clips", type=int, default=50)
+    parser.add_argument("--sample-rate", type=int, default=16000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    clips = [(decode_wav(audio), words) for audio, words in corpus(args.clips, sample_rate=args.sample_rate)]
+    best = float("inf")
+    stats = SessionDeliveryStats()
+
+    for _ in range(args.repeat):
+        stats = SessionDeliveryStats()
+        started = time.perf_counter()
+        for audio, words in clips:
+            transcript = " ".join(w["word"] for w in words)
+            clip_started = time.perf_counter()
+            result = _analyze_clip(audio, transcript, words)
+            stats.add(result, time.perf_counter() - clip_started)
+        best = min(best, time.perf_counter() - started)
+
+    audio_minutes = stats.audio_seconds / 60
+    print(f"clips:                 {args.clips}")
+    print(f"audio:                 {audio_minutes:.1f} min @ {args.sample_rate} Hz")
+    print(f"processing (best run): {best * 1000:.1f} ms")
+    print(f"cost per audio minute: {best / audio_minutes * 1000:.2f} ms")
+    print(f"realtime factor:       {stats.audio_seconds / best:.0f}x")
+    print(f"summary:               {stats.summary()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Import-time profile and cold start to first /api/health.
+
+Run from the backend directory:
+
+    python -m benchmarks.startup_bench --runs 5 --top 15
+
+1. Runs `python -X importtime -c "import main"` and reports the total and the
+   slowest top-level packages, summing the self time of each of their modules.
+2. Starts `uvicorn main:app` --runs times and measures the wall time from
+   spawning the process to the first 200 from /api/health.
+
+No API keys or providers are needed. Add --json for machine-readable output.
+"""
+import argparse
+import json
+import os
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+import httpx
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|\s*(\S+)")
+
+
+def _env() -> Dict[str, str]:
+    env = dict(os.environ)
+    # Placeholder keys so the background provider warm-up runs as it would in production
+    env.setdefault("OPENAI_API_KEY", "bench")
+    env.setdefault("ELEVENLABS_API_KEY", "bench")
+    return env
+
+
+def import_profile() -> Tuple[float, List[Tuple[str, float]]]:
+    """Seconds to import main, and seconds of module self time per top-level package"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=BACKEND_DIR, env=_env(), capture_output=True, text=True, check=True
+    )
+    packages: Dict[str, float] = {}
+    total = 0.0
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, module = int(match.group(1)), int(match.group(2)), match.group(3)
+        if module == "main":
+            total = cumulative_us / 1e6
+        top = module.split(".")[0]
+        packages[top] = packages.get(top, 0.0) + self_us / 1e6
+    return total, sorted(packages.items(), key=lambda item: item[1], reverse=True)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def cold_start(timeout: float = 30.0) -> float:
+    """Seconds from spawning uvicorn to the first healthy /api/health response"""
+    port = _free_port()
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1",
+         "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR, env=_env()
+    )
+    try:
+        url = f"http://127.0.0.1:{port}/api/health"
+        with httpx.Client(timeout=1.0) as client:
+            while time.perf_counter() - started < timeout:
+                try:
+                    if client.get(url).status_code == 200:
+                        return time.perf_counter() - started
+                except httpx.HTTPError:
+                    pass
+                time.sleep(0.01)
+        raise RuntimeError(f"{url} did not become ready within {timeout}s")
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure import time and cold start of the backend")
+    parser.add_argument("--runs", type=int, default=5, help="Cold starts to measure")
+    parser.add_argument("--top", type=int, default=15, help="Packages to list in the import profile")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    total, packages = import_profile()
+    starts = [cold_start() for _ in range(args.runs)]
+    report = {
+        "import_main_ms": round(total * 1000, 1),
+        "packages_ms": {name: round(seconds * 1000, 1) for name, seconds in packages[:args.top]},
+        "cold_start_ms": {
+            "median": round(statistics.median(starts) * 1000, 1),
+            "min": round(min(starts) * 1000, 1),
+            "max": round(max(starts) * 1000, 1),
+        },
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"import main: {report['import_main_ms']:.0f} ms")
+    for name, ms in report["packages_ms"].items():
+        print(f"  {name:<24} {ms:8.1f} ms")
+    cold = report["cold_start_ms"]
+    print(f"cold start to /api/health over {args.runs} runs: "
+          f"median {cold['median']:.0f} ms (min {cold['min']:.0f}, max {cold['max']:.0f})")
+
+
+if __name__ == "__main__":
+    main()
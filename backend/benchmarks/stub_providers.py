@@ -0,0 +1,327 @@
+"""Local stand-in for the OpenAI and ElevenLabs HTTP APIs.
+
+Serves just enough of both APIs for the backend to run fully offline, with
+configurable latency and error injection so deadlines, hedging and circuit
+breaking can be exercised. Point the backend at it with:
+
+    OPENAI_BASE_URL=http://127.0.0.1:9100/v1
+    ELEVENLABS_BASE_URL=http://127.0.0.1:9100
+
+Run from the backend directory:
+
+    python -m benchmarks.stub_providers --port 9100 --llm-delay 0.4 --error-rate 0.1
+
+Injection settings can be changed at runtime with POST /_stub/config. The
+Files and Batch endpoints complete a submitted batch after --batch-delay
+seconds, for benchmarks/rescore_feedback.py --mode batch.
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import Any, Dict
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
+import uvicorn
+
+
+class StubConfig:
+    def __init__(self):
+        self.llm_delay = 0.3  # Seconds before a chat completion returns (first token when streaming)
+        self.llm_token_interval = 0.01  # Seconds between streamed chunks
+        self.stt_delay = 0.3  # Seconds before a transcription returns
+        self.tts_delay = 0.3  # Seconds before synthesized audio returns
+        self.jitter = 0.1  # Uniform +/- jitter added to every delay
+        self.error_rate = 0.0  # Fraction of requests answered with error_status
+        self.error_status = 500
+        self.stall_rate = 0.0  # Fraction of requests that hang for stall_seconds
+        self.stall_seconds = 30.0
+        self.audio_bytes_per_char = 180  # Roughly mp3_44100_128 speech
+        self.reply_text = "Thanks for sharing that. Can you walk me through a specific example?"
+        self.transcript_text = "I led the migration of our billing system and cut costs by twenty percent."
+        self.batch_delay = 2.0  # Seconds before a submitted batch completes
+        self.seed = None
+
+    def update(self, values: Dict[str, Any]):
+        for key, value in values.items():
+            if hasattr(self, key):
+                setattr(self, key, value)
+
+
+config = StubConfig()
+stats = {"chat": 0, "transcriptions": 0, "tts": 0, "errors": 0, "stalls": 0, "batches": 0, "batch_requests": 0}
+files: Dict[str, Dict[str, Any]] = {}
+batches: Dict[str, Dict[str, Any]] = {}
+rng = random.Random()
+
+app = FastAPI(title="Provider stub")
+
+
+async def _inject(delay: float):
+    """Sleep for the configured latency; return an error response if one is injected"""
+    if config.stall_rate and rng.random() < config.stall_rate:
+        stats["stalls"] += 1
+        await asyncio.sleep(config.stall_seconds)
+
+    await asyncio.sleep(max(0.0, delay + rng.uniform(-config.jitter, config.jitter)))
+
+    if config.error_rate and rng.random() < config.error_rate:
+        stats["errors"] += 1
+        return JSONResponse(
+            status_code=config.error_status,
+            content={"error": {"message": "Injected stub error", "type": "stub_error"}}
+        )
+    return None
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(request: Request):
+    stats["chat"] += 1
+    body = await request.json()
+    error = await _inject(config.llm_delay)
+    if error:
+        return error
+
+    content, usage = _completion(body)
+    if body.get("stream"):
+        return StreamingResponse(_stream_chunks(body, content, usage), media_type="text/event-stream")
+    return _completion_object(body, content, usage)
+
+
+def _completion(body: Dict[str, Any]):
+    """Reply text and token usage for a chat completion request"""
+    prompt = " ".join(str(m.get("content", "")) for m in body.get("messages", []))
+    if "JSON format" in prompt:
+        content = json.dumps({
+            "confidence": 7.5,
+            "clarity": 8.0,
+            "overall_fit": 7.0,
+            "improvements": ["Use more concrete metrics", "Keep answers shorter", "Close with a question"],
+            "conversation_summary": "Stub summary of the interview."
+        })
+    else:
+        content = config.reply_text
+
+    prompt_tokens = len(prompt) // 4 + 1
+    completion_tokens = len(content) // 4 + 1
+    usage = {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens
+    }
+    return content, usage
+
+
+def _completion_object(body: Dict[str, Any], content: str, usage: Dict[str, int]) -> Dict[str, Any]:
+    return {
+        "id": f"chatcmpl-stub-{stats['chat']}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "stub"),
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": content},
+            "finish_reason": "stop"
+        }],
+        "usage": usage
+    }
+
+
+async def _stream_chunks(body: Dict[str, Any], content: str, usage: Dict[str, int]):
+    """Server-sent chat.completion.chunk events, one word per chunk"""
+    base = {
+        "id": f"chatcmpl-stub-{stats['chat']}",
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": body.get("model", "stub"),
+    }
+    words = content.split(" ")
+    for i, word in enumerate(words):
+        if i:
+            await asyncio.sleep(config.llm_token_interval)
+        delta = {"content": word if i == 0 else " " + word}
+        chunk = {**base, "choices": [{"index": 0, "delta": delta, "finish_reason": None}]}
+        yield f"data: {json.dumps(chunk)}\n\n"
+
+    yield f"data: {json.dumps({**base, 'choices': [{'index': 0, 'delta': {}, 'finish_reason': 'stop'}]})}\n\n"
+    if body.get("stream_options", {}).get("include_usage"):
+        yield f"data: {json.dumps({**base, 'choices': [], 'usage': usage})}\n\n"
+    yield "data: [DONE]\n\n"
+
+
+@app.post("/v1/audio/transcriptions")
+async def transcriptions(request: Request):
+    stats["transcriptions"] += 1
+    form = await request.form()
+    error = await _inject(config.stt_delay)
+    if error:
+        return error
+
+    response_format = form.get("response_format", "json")
+    if response_format == "text":
+        return PlainTextResponse(config.transcript_text)
+    if response_format == "verbose_json":
+        # Evenly spaced word timings at ~150 words per minute
+        words = [
+            {"word": word, "start": round(i * 0.4, 2), "end": round(i * 0.4 + 0.3, 2)}
+            for i, word in enumerate(config.transcript_text.split())
+        ]
+        return {
+            "task": "transcribe",
+            "language": "english",
+            "duration": words[-1]["end"] if words else 0.0,
+            "text": config.transcript_text,
+            "words": words
+        }
+    return {"text": config.transcript_text}
+
+
+@app.post("/v1/text-to-speech/{voice_id}")
+async def text_to_speech(voice_id: str, request: Request):
+    stats["tts"] += 1
+    body = await request.json()
+    error = await _inject(config.tts_delay)
+    if error:
+        return error
+
+    # Scale the payload with the requested bitrate (audio_bytes_per_char is for 128 kbps)
+    output_format = request.query_params.get("output_format", "mp3_44100_128")
+    codec, rate, *bitrate = output_format.split("_")
+    kbps = int(bitrate[0]) if bitrate else int(rate) * 16 // 1000
+    size = max(1, len(body.get("text", ""))) * config.audio_bytes_per_char * kbps // 128
+    return Response(content=bytes(size), media_type="audio/mpeg" if codec == "mp3" else "application/octet-stream")
+
+
+@app.post("/v1/files")
+async def upload_file(request: Request):
+    form = await request.form()
+    upload = form["file"]
+    content = await upload.read()
+    file_id = f"file-stub-{len(files) + 1}"
+    files[file_id] = {"content": content, "filename": upload.filename, "purpose": form.get("purpose", "batch")}
+    return _file_object(file_id)
+
+
+def _file_object(file_id: str) -> Dict[str, Any]:
+    entry = files[file_id]
+    return {
+        "id": file_id,
+        "object": "file",
+        "bytes": len(entry["content"]),
+        "created_at": int(time.time()),
+        "filename": entry["filename"],
+        "purpose": entry["purpose"],
+        "status": "processed"
+    }
+
+
+@app.get("/v1/files/{file_id}/content")
+async def file_content(file_id: str):
+    if file_id not in files:
+        return JSONResponse(status_code=404, content={"error": {"message": "No such file", "type": "invalid_request_error"}})
+    return Response(content=files[file_id]["content"], media_type="application/octet-stream")
+
+
+@app.post("/v1/batches")
+async def create_batch(request: Request):
+    """Batch API: chat completions from an uploaded JSONL file, finished after batch_delay"""
+    body = await request.json()
+    if body.get("input_file_id") not in files:
+        return JSONResponse(status_code=404, content={"error": {"message": "No such file", "type": "invalid_request_error"}})
+    stats["batches"] += 1
+    batch_id = f"batch_stub_{stats['batches']}"
+    batches[batch_id] = {
+        "id": batch_id,
+        "object": "batch",
+        "endpoint": body.get("endpoint", "/v1/chat/completions"),
+        "input_file_id": body["input_file_id"],
+        "completion_window": body.get("completion_window", "24h"),
+        "status": "in_progress",
+        "created_at": int(time.time()),
+        "output_file_id": None,
+        "error_file_id": None,
+        "request_counts": {"total": 0, "completed": 0, "failed": 0},
+    }
+    asyncio.create_task(_run_batch(batch_id))
+    return batches[batch_id]
+
+
+async def _run_batch(batch_id: str):
+    batch = batches[batch_id]
+    await asyncio.sleep(config.batch_delay)
+    outputs, errors = [], []
+    for line in files[batch["input_file_id"]]["content"].decode().splitlines():
+        if not line.strip():
+            continue
+        item = json.loads(line)
+        stats["batch_requests"] += 1
+        result = {"id": f"batch_req_{stats['batch_requests']}", "custom_id": item["custom_id"]}
+        if config.error_rate and rng.random() < config.error_rate:
+            stats["errors"] += 1
+            errors.append({**result, "response": None, "error": {"code": "stub_error", "message": "Injected stub error"}})
+            continue
+        content, usage = _completion(item["body"])
+        body = _completion_object(item["body"], content, usage)
+        outputs.append({**result, "response": {"status_code": 200, "request_id": result["id"], "body": body}, "error": None})
+
+    for key, records in (("output_file_id", outputs), ("error_file_id", errors)):
+        if records:
+            file_id = f"file-stub-{len(files) + 1}"
+            content = "".join(json.dumps(record) + "\n" for record in records).encode()
+            files[file_id] = {"content": content, "filename": f"{batch_id}_{key}.jsonl", "purpose": "batch_output"}
+            batch[key] = file_id
+    batch["request_counts"] = {"total": len(outputs) + len(errors), "completed": len(outputs), "failed": len(errors)}
+    batch["status"] = "completed"
+
+
+@app.get("/v1/batches/{batch_id}")
+async def get_batch(batch_id: str):
+    if batch_id not in batches:
+        return JSONResponse(status_code=404, content={"error": {"message": "No such batch", "type": "invalid_request_error"}})
+    return batches[batch_id]
+
+
+@app.get("/v1/voices")
+async def voices():
+    return {"voices": []}
+
+
+@app.post("/_stub/config")
+async def update_config(values: Dict[str, Any]):
+    config.update(values)
+    if "seed" in values:
+        rng.seed(values["seed"])
+    return vars(config)
+
+
+@app.get("/_stub/stats")
+async def get_stats():
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run local OpenAI/ElevenLabs stubs")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--llm-delay", type=float, default=config.llm_delay)
+    parser.add_argument("--stt-delay", type=float, default=config.stt_delay)
+    parser.add_argument("--tts-delay", type=float, default=config.tts_delay)
+    parser.add_argument("--jitter", type=float, default=config.jitter)
+    parser.add_argument("--error-rate", type=float, default=config.error_rate)
+    parser.add_argument("--error-status", type=int, default=config.error_status)
+    parser.add_argument("--stall-rate", type=float, default=config.stall_rate)
+    parser.add_argument("--batch-delay", type=float, default=config.batch_delay)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    config.update({k: v for k, v in vars(args).items() if k not in ("host", "port")})
+    if args.seed is not None:
+        rng.seed(args.seed)
+
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
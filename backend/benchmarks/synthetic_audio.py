@@ -0,0 +1,80 @@
+"""Synthetic speech-like audio for offline benchmarks.
+
+Clips alternate voiced bursts (harmonic tones with amplitude modulation) and
+low-level noise, optionally padded with leading/trailing silence, so audio
+stages can be measured without recorded candidate audio.
+"""
+import io
+import wave
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+
+def make_clip(
+    seconds: float,
+    sample_rate: int = 16000,
+    lead_silence: float = 0.0,
+    trail_silence: float = 0.0,
+    speech: bool = True,
+    seed: int = 0,
+) -> Tuple[np.ndarray, List[Dict]]:
+    """Return int16 samples and matching word timings for a synthetic clip"""
+    rng = np.random.default_rng(seed)
+    total = int((lead_silence + seconds + trail_silence) * sample_rate)
+    samples = rng.normal(0.0, 0.002, total).astype(np.float32)  # Room noise
+    words = []
+
+    if speech:
+        t = 0.0
+        index = 0
+        while t < seconds:
+            word_len = rng.uniform(0.15, 0.45)
+            gap = rng.choice([0.05, 0.1, 0.15, 0.6, 1.2], p=[0.4, 0.3, 0.15, 0.1, 0.05])
+            start = int((lead_silence + t) * sample_rate)
+            end = min(int((lead_silence + t + word_len) * sample_rate), total)
+            n = end - start
+            if n <= 0:
+                break
+
+            time_axis = np.arange(n) / sample_rate
+            pitch = rng.uniform(100, 220)
+            tone = sum(np.sin(2 * np.pi * pitch * k * time_axis) / k for k in (1, 2, 3))
+            envelope = np.sin(np.pi * np.arange(n) / n)
+            samples[start:end] += (0.2 * tone * envelope).astype(np.float32)
+
+            word = "um" if rng.random() < 0.04 else f"word{index}"
+            words.append({"word": word, "start": round(t, 3), "end": round(t + word_len, 3)})
+            t += word_len + gap
+            index += 1
+
+    pcm = np.clip(samples * 32767, -32768, 32767).astype("<i2")
+    return pcm, words
+
+
+def to_wav_bytes(pcm: np.ndarray, sample_rate: int = 16000, channels: int = 1) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(pcm.tobytes())
+    return buffer.getvalue()
+
+
+def corpus(count: int = 50, sample_rate: int = 16000, seed: int = 0) -> List[Tuple[bytes, List[Dict]]]:
+    """A mix of clips with varied length, padding, and some containing no speech"""
+    rng = np.random.default_rng(seed)
+    clips = []
+    for i in range(count):
+        speech = rng.random() > 0.1
+        pcm, words = make_clip(
+            seconds=float(rng.uniform(2, 30)),
+            sample_rate=sample_rate,
+            lead_silence=float(rng.uniform(0, 3)),
+            trail_silence=float(rng.uniform(0, 5)),
+            speech=speech,
+            seed=seed + i,
+        )
+        clips.append((to_wav_bytes(pcm, sample_rate), words))
+    return clips
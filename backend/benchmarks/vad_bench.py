@@ -0,0 +1,46 @@
+"""Upload bytes saved by server-side VAD on a synthetic audio corpus.
+
+Run from the backend directory:
+
+    python -m benchmarks.vad_bench --clips 100
+
+Clips have random leading/trailing silence and ~10% contain no speech at all,
+mimicking a mic left open before and after the answer.
+"""
+import argparse
+import time
+
+from app.services.voice_activity import trim_silence
+from app.utils.audio import decode_wav
+from benchmarks.synthetic_audio import corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark VAD silence trimming")
+    parser.add_argument("--clips", type=int, default=100)
+    parser.add_argument("--sample-rate", type=int, default=16000)
+    args = parser.parse_args()
+
+    clips = [decode_wav(audio) for audio, _ in corpus(args.clips, sample_rate=args.sample_rate)]
+    bytes_in = bytes_out = skipped = 0
+    trimmed_seconds = 0.0
+
+    started = time.perf_counter()
+    for pcm in clips:
+        trimmed, seconds = trim_silence(pcm)
+        bytes_in += len(pcm.data)
+        bytes_out += len(trimmed.data) if trimmed else 0
+        trimmed_seconds += seconds
+        skipped += trimmed is None
+    elapsed = time.perf_counter() - started
+
+    print(f"clips:            {args.clips}")
+    print(f"skipped (silent): {skipped}")
+    print(f"trimmed audio:    {trimmed_seconds:.1f} s")
+    print(f"bytes in:         {bytes_in / 1e6:.2f} MB")
+    print(f"bytes out:        {bytes_out / 1e6:.2f} MB ({(1 - bytes_out / bytes_in) * 100:.1f}% saved)")
+    print(f"vad cost:         {elapsed / args.clips * 1000:.2f} ms/clip")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,83 @@
 from fastapi import FastAPI, HTTPException, WebSocket
+from fastapi.responses import PlainTextResponse, JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
+from app.core.metrics import metrics
+from app.core.loop_monitor import loop_monitor
+from app.core.event_bus import event_bus
+from app.core.drain import drain_controller
+from app.core.serialization import FastJSONResponse
+from app.core.session_manager import session_manager
+from app.core.models import SessionStatus
 from app.api.routes import personas, cv, interview
-from app.api.websocket.voice import handle_voice_websocket
+from app.api.websocket.voice import handle_voice_websocket, handle_observer_websocket, voice_manager
+from app.services.provider_scheduler import openai_scheduler, elevenlabs_scheduler
+from app.services.openai_service import openai_service
+from app.services.elevenlabs_service import elevenlabs_service
+from app.services.voice_activity import voice_activity
+from app.services.audio_ingest import audio_ingest
+from app.services.filler_audio import filler_audio
+from app.services.speech_metrics import speech_metrics
+from app.services.feedback_segments import feedback_segmenter
+from app.services.speculative_drafts import speculative_drafts
+from app.services.admission import admission_controller
+from app.services.usage import usage_meter
+from app.services.persona_service import persona_service
+from app.services.response_cache import response_cache
+from contextlib import asynccontextmanager
+from datetime import datetime
+import asyncio
 import uvicorn
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start and stop background monitors with the server"""
+    if settings.loop_monitor_enabled:
+        await loop_monitor.start()
+    await event_bus.start()
+    sweeper = asyncio.create_task(sweep_sessions())
+    # Serving starts right away; requests that need a client meanwhile wait on the same load
+    warmup = asyncio.create_task(warm_providers()) if settings.provider_warmup else None
+    yield
+    sweeper.cancel()
+    if warmup:
+        warmup.cancel()
+    await event_bus.stop()
+    await loop_monitor.stop()
+
+async def sweep_sessions():
+    """Periodically end sessions that ran too long or were abandoned without a stop"""
+    while True:
+        await asyncio.sleep(settings.session_sweep_seconds)
+        try:
+            expire_sessions()
+        except Exception as e:
+            print(f"Session sweep error: {e}")
+
+def expire_sessions():
+    for session in session_manager.cleanup_expired_sessions():
+        filler_audio.discard(session.session_id)
+        speech_metrics.discard(session.session_id)
+        # Abandoned sessions never reach a feedback job; stop paying for their segment analyses
+        feedback_segmenter.discard(session.session_id)
+        if session.status != SessionStatus.COMPLETED:
+            # Stopped sessions already gave their slot back
+            admission_controller.session_ended((datetime.now() - session.start_time).total_seconds())
+
+async def warm_providers():
+    for service in (openai_service, elevenlabs_service):
+        try:
+            await service.ensure_client()
+        except Exception as e:
+            print(f"WARNING: provider warm-up failed, interview turns using it will fail: {e}")
+
 # Create FastAPI app
 app = FastAPI(
     title="AI Interview Simulator API",
     description="Backend API for AI-powered interview simulation with real-time voice conversation",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse
 )
 
 # Add CORS middleware
@@ -32,20 +100,116 @@ async def websocket_voice_endpoint(websocket: WebSocket, session_id: str):
     """WebSocket endpoint for real-time voice communication"""
     await handle_voice_websocket(websocket, session_id)
 
+# Read-only session event feed, e.g. for a coach's live dashboard
+@app.websocket("/api/interview/observe/{session_id}")
+async def websocket_observe_endpoint(websocket: WebSocket, session_id: str):
+    """WebSocket endpoint that mirrors a session's events"""
+    await handle_observer_websocket(websocket, session_id)
+
 # Health check endpoint
 @app.get("/api/health")
 async def health_check():
-    """Health check endpoint"""
+    """Health check endpoint; 503 while draining so load balancers stop routing here"""
+    if drain_controller.draining:
+        return JSONResponse(status_code=503, content={
+            "status": "draining",
+            "message": "Server is restarting",
+            "version": "1.0.0"
+        })
     return {
         "status": "healthy",
         "message": "AI Interview Simulator API is running",
         "version": "1.0.0"
     }
 
+# Provider scheduling metrics
+@app.get("/api/health/providers")
+async def provider_health():
+    """Queue depth, wait times and circuit state for each upstream provider"""
+    return provider_stats()
+
+# Prometheus scrape endpoint: stage latency histograms plus the provider stats as gauges
+@app.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+# Event loop health: lag stats and stacks of recent blocking calls
+@app.get("/api/debug/event-loop")
+async def event_loop_debug():
+    """Recent event-loop stalls with the stack that was running when each was detected"""
+    return {
+        **loop_monitor.stats(),
+        "stalls": loop_monitor.recent_stalls()
+    }
+
+def provider_stats():
+    return {
+        "openai": {
+            **openai_scheduler.stats(),
+            "circuit": openai_service.breaker.stats(),
+            "chat_p95_ms": _ms(openai_service.chat_latency.percentile(95)),
+            "transcription_p95_ms": _ms(openai_service.transcription_latency.percentile(95)),
+            "draft_p95_ms": _ms(openai_service.draft_latency.percentile(95))
+        },
+        "elevenlabs": {
+            **elevenlabs_scheduler.stats(),
+            "circuit": elevenlabs_service.breaker.stats(),
+            "tts_p95_ms": _ms(elevenlabs_service.tts_latency.percentile(95)),
+            "formats": {name: fmt.stats() for name, fmt in elevenlabs_service.format_stats.items()}
+        },
+        "voice_activity": voice_activity.stats(),
+        "audio_ingest": audio_ingest.stats(),
+        "fillers": filler_audio.stats(),
+        "speculative_drafts": speculative_drafts.stats(),
+        "voice_connections": voice_manager.stats(),
+        "event_bus": event_bus.stats(),
+        "drain": drain_controller.stats(),
+        "admission": admission_controller.stats(),
+        "usage": usage_meter.stats(),
+        "personas": persona_service.stats(),
+        "response_cache": response_cache.stats(),
+        "event_loop": loop_monitor.stats()
+    }
+
+def _ms(seconds):
+    return round(seconds * 1000, 1) if seconds is not None else None
+
+metrics.add_collector(provider_stats)
+
+class DrainingServer(uvicorn.Server):
+    """uvicorn server that drains live interviews on the first SIGTERM/SIGINT.
+    
+    uvicorn's own shutdown starts once the drain is done; a second signal
+    skips the rest of the drain. Only `python main.py` runs this server;
+    `uvicorn main:app` (with or without --workers) shuts down without draining.
+    """
+    
+    _drain_requested = False
+    
+    async def startup(self, sockets=None):
+        self._loop = asyncio.get_running_loop()
+        await super().startup(sockets=sockets)
+    
+    def handle_exit(self, sig, frame):
+        if self._drain_requested or self.should_exit:
+            super().handle_exit(sig, frame)
+            return
+        self._drain_requested = True
+        self._loop.call_soon_threadsafe(lambda: self._loop.create_task(self._drain_then_exit()))
+    
+    async def _drain_then_exit(self):
+        await drain_controller.drain()
+        self.should_exit = True
+
+
 if __name__ == "__main__":
-    uvicorn.run(
-        "main:app",
-        host=settings.host,
-        port=settings.port,
-        reload=True
-    )
\ No newline at end of file
+    if settings.reload:
+        uvicorn.run("main:app", host=settings.host, port=settings.port, reload=True)
+    else:
+        config = uvicorn.Config(
+            app,
+            host=settings.host,
+            port=settings.port,
+            timeout_graceful_shutdown=5  # Drained turns are already done; don't wait on stragglers
+        )
+        DrainingServer(config).run()
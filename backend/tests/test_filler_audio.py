@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+from app.core.config import settings
+from app.core.models import InterviewConfig, InterviewSession, PersonaId
+from app.services.elevenlabs_service import elevenlabs_service
+from app.services.filler_audio import FillerAudioService
+from app.services.usage import usage_meter
+
+
+class FakeTextToSpeech:
+    def __init__(self):
+        self.calls = 0
+
+    def convert(self, text, **kwargs):
+        self.calls += 1
+        return b"audio:" + text.encode()
+
+
+class FakeClient:
+    def __init__(self):
+        self.text_to_speech = FakeTextToSpeech()
+
+
+@pytest.fixture
+def tts(monkeypatch):
+    client = FakeClient()
+    monkeypatch.setattr(settings, "filler_enabled", True)
+    monkeypatch.setattr(elevenlabs_service, "_client", client)
+    monkeypatch.setattr(elevenlabs_service, "_audio_cache", type(elevenlabs_service._audio_cache)())
+    return client.text_to_speech
+
+
+def make_session():
+    session = InterviewSession(InterviewConfig(
+        persona_id="hr-friendly",
+        interview_type="general",
+        interview_length="quick",
+        job_description="Backend engineer working on Python services"
+    ))
+    session.tenant = "acme"
+    return session
+
+
+def test_fillers_rendered_after_configure_are_not_billed_to_the_session(tts):
+    session = make_session()
+    fillers = FillerAudioService()
+
+    async def configure():
+        # As on a voice connection: the session is bound, then a configure message warms new fillers
+        usage_meter.bind(session)
+        before = usage_meter.session_usage(session)
+        fillers.warm(PersonaId.HR_FRIENDLY, "opus_48000_32")
+        await asyncio.gather(*fillers._warming.values())
+        return before
+
+    before = asyncio.run(configure())
+
+    assert tts.calls > 0
+    assert fillers.stats()["pools"] == 1
+    assert usage_meter.session_usage(session) == before
@@ -0,0 +1,104 @@
+import pytest
+from app.core.config import settings
+from app.core.models import ConversationRole, InterviewConfig, InterviewSession
+from app.services.response_cache import ResponseCache
+
+QUESTION = "Welcome! Let me know when you're ready to begin."
+
+
+@pytest.fixture(autouse=True)
+def cache_settings(monkeypatch):
+    monkeypatch.setattr(settings, "response_cache_enabled", True)
+    monkeypatch.setattr(settings, "response_cache_personas", "")
+    monkeypatch.setattr(settings, "response_cache_similarity", 0.75)
+    monkeypatch.setattr(settings, "response_cache_ttl_seconds", 3600.0)
+    monkeypatch.setattr(settings, "response_cache_max_entries", 100)
+    monkeypatch.setattr(settings, "response_cache_max_audio_bytes", 1_000_000)
+
+
+def make_session(tenant="acme", cv_text=None):
+    session = InterviewSession(InterviewConfig(
+        persona_id="hr-friendly",
+        interview_type="general",
+        interview_length="quick",
+        job_description="Backend engineer working on Python services",
+        cv_text=cv_text
+    ))
+    session.tenant = tenant
+    session.conversation_history.append(ConversationRole.INTERVIEWER, QUESTION)
+    session.question_count = 1
+    return session
+
+
+def cache_reply(cache, session, text, reply="Great, let's start with your background."):
+    probe = cache.probe(session, text)
+    assert probe is not None and not probe.hit
+    cache.store(probe, reply, session)
+    return probe
+
+
+def test_similar_turn_hits():
+    cache = ResponseCache()
+    cache_reply(cache, make_session(), "I'm ready")
+
+    probe = cache.probe(make_session(), "I'm ready!")
+    assert probe.hit
+    assert probe.entry.reply == "Great, let's start with your background."
+
+
+def test_negated_turn_misses():
+    cache = ResponseCache()
+    cache_reply(cache, make_session(), "I'm ready")
+
+    probe = cache.probe(make_session(), "I'm not ready")
+    assert not probe.hit
+    assert probe.entry is None
+
+
+def test_other_tenant_misses():
+    cache = ResponseCache()
+    cache_reply(cache, make_session(tenant="acme"), "I'm ready")
+
+    assert not cache.probe(make_session(tenant="globex"), "I'm ready").hit
+
+
+def test_reply_mentioning_cv_is_not_stored():
+    cache = ResponseCache()
+    session = make_session(cv_text="Jordan Avery\nSoftware engineer at Initech, Python and Go")
+    cache_reply(cache, session, "I'm ready", reply="Great, Jordan. Tell me about your time at Initech.")
+
+    assert cache.stats()["entries"] == 0
+    assert cache.personal_replies == 1
+    # Proper nouns that come from the job description are shared by every candidate
+    cache_reply(cache, session, "I'm ready", reply="Great. Which Python services have you built?")
+    assert cache.stats()["entries"] == 1
+
+
+def test_expired_entry_misses():
+    cache = ResponseCache()
+    probe = cache_reply(cache, make_session(), "I'm ready")
+    probe.entry.created_at -= settings.response_cache_ttl_seconds + 1
+    cache._expired_at = 0.0
+
+    assert not cache.probe(make_session(), "I'm ready").hit
+    assert cache.stats()["entries"] == 0
+    assert cache.expirations == 1
+    assert not cache._buckets
+
+
+def test_audio_bytes_evict_least_recently_used(monkeypatch):
+    monkeypatch.setattr(settings, "response_cache_max_audio_bytes", 100)
+    cache = ResponseCache()
+    first = cache_reply(cache, make_session(), "I'm ready")
+    cache.store_audio(first, "mp3", b"a" * 60)
+    second = cache_reply(cache, make_session(), "can you repeat the question")
+    cache.store_audio(second, "mp3", b"b" * 60)
+
+    stats = cache.stats()
+    assert stats["entries"] == 1
+    assert stats["audio_bytes"] == 60
+    assert cache.evictions == 1
+    assert not cache.probe(make_session(), "I'm ready").hit
+    hit = cache.probe(make_session(), "Can you repeat the question?")
+    assert hit.hit
+    assert cache.audio_for(hit, "mp3") == b"b" * 60
@@ -16,6 +16,15 @@ export interface InterviewSession {
   status: string;
 }
 
+export interface QueuedStart {
+  status: 'queued';
+  ticket_id: string;
+  position: number;
+  queue_length: number;
+  eta_seconds: number;
+  poll_after_seconds: number;
+}
+
 export interface PersonaInfo {
   id: string;
   name: string;
@@ -38,6 +47,13 @@ export interface InterviewFeedback {
   total_questions: number;
 }
 
+export interface FeedbackJob {
+  session_id: string;
+  status: 'pending' | 'running' | 'completed' | 'failed';
+  feedback?: InterviewFeedback;
+  error_message?: string;
+}
+
 export interface CVExtractionResponse {
   success: boolean;
   extracted_text: string;
@@ -112,10 +128,35 @@ class APIClient {
 
   // Interview Management
   async startInterview(config: InterviewConfig): Promise<InterviewSession> {
-    return this.request<InterviewSession>('/interview/start', {
-      method: 'POST',
-      body: JSON.stringify(config),
-    });
+    // At capacity the server queues the start (202 with a ticket); retry with the ticket until admitted
+    let endpoint = '/interview/start';
+
+    while (true) {
+      const response = await fetch(`${this.baseURL}${endpoint}`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify(config),
+      });
+
+      if (response.status === 202) {
+        const queued: QueuedStart = await response.json();
+        const retryAfter = Number(response.headers.get('Retry-After')) || queued.poll_after_seconds || 1;
+        console.log(`Interview start queued at position ${queued.position}, ETA ${queued.eta_seconds}s`);
+        await new Promise((resolve) => setTimeout(resolve, retryAfter * 1000));
+        endpoint = `/interview/start?ticket=${encodeURIComponent(queued.ticket_id)}`;
+        continue;
+      }
+
+      if (!response.ok) {
+        // 429 means the queue is full or the wait timed out; the detail says which
+        const errorData = await response.json().catch(() => ({}));
+        const error = new Error(errorData.detail || `HTTP ${response.status}: ${response.statusText}`);
+        console.error('API Error [/interview/start]:', error);
+        throw error;
+      }
+
+      return await response.json();
+    }
   }
 
   async getInterviewStatus(sessionId: string) {
@@ -130,9 +171,25 @@ class APIClient {
   }
 
   async stopInterview(sessionId: string): Promise<InterviewFeedback> {
-    return this.request<InterviewFeedback>(`/interview/stop/${sessionId}`, {
+    // Stopping returns a feedback job; poll until the feedback is ready
+    let job = await this.request<FeedbackJob>(`/interview/stop/${sessionId}`, {
       method: 'POST',
     });
+
+    while (job.status === 'pending' || job.status === 'running') {
+      await new Promise((resolve) => setTimeout(resolve, 1000));
+      job = await this.getFeedback(sessionId);
+    }
+
+    if (job.status !== 'completed' || !job.feedback) {
+      throw new Error(job.error_message || 'Feedback generation failed');
+    }
+
+    return job.feedback;
+  }
+
+  async getFeedback(sessionId: string): Promise<FeedbackJob> {
+    return this.request<FeedbackJob>(`/interview/feedback/${sessionId}`);
   }
 
   // Health Check